@@ -1,45 +1,105 @@
+from __future__ import annotations
 import pandas as pd
 import numpy as np
-import matplotlib as mpl
-import matplotlib.pyplot as plt
-import matplotlib.gridspec as gridspec
-import matplotlib.colors as mcolors
-from matplotlib.lines import Line2D
-from matplotlib.patches import ConnectionPatch
-import seaborn as sns
-import statsapi
 import requests
-import pybaseball as pyb
-import polars as pl
-import re
-from PIL import Image
 from io import BytesIO
-from pyfonts import load_font
-from bs4 import BeautifulSoup
-import time
 import math
-from selenium import webdriver
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.chrome.service import Service
-from webdriver_manager.chrome import ChromeDriverManager
-from webdriver_manager.core.os_manager import ChromeType
+import re
+import os
+import json
+import time
+import threading
+import hashlib
+import importlib
+from functools import lru_cache
 import api_scraper
 from api_scraper import MLB_Scrape
-import streamlit as st
-import OSU_Dashboard as dashboard
-
-
-stratum = load_font(font_url="https://github.com/ccheney/chromotion/blob/master/assets/fonts/stratum2-medium-webfont.ttf?raw=true")
-
-# Set the theme for seaborn plots
-sns.set_theme(style='whitegrid',
-              palette='deep',
-              font='DejaVu Sans',
-              font_scale=1.5,
-              color_codes=True,
-              rc=None)
 
-plt.rcParams['figure.dpi'] = 300
+# Plotting, page parsing and Streamlit are only needed once a dashboard is drawn, so they are imported on first use
+# instead of at startup (benchmarks/profile_imports.py shows where the cold-start time goes)
+class LazyModule:
+    """
+    Stands in for a module and imports it the first time one of its attributes is used.
+    """
+
+    def __init__(self, name):
+        self._name = name
+        self._module = None
+
+    def __getattr__(self, attr):
+        if self._module is None:
+            self._module = importlib.import_module(self._name)
+        return getattr(self._module, attr)
+
+plt = LazyModule('matplotlib.pyplot')
+gridspec = LazyModule('matplotlib.gridspec')
+mcolors = LazyModule('matplotlib.colors')
+mpatches = LazyModule('matplotlib.patches')
+font_manager = LazyModule('matplotlib.font_manager')
+sns = LazyModule('seaborn')
+st = LazyModule('streamlit')
+
+# One session for every page, image and table the dashboard downloads, so they can be recorded and replayed
+# from a fixture archive like the MLB_Scrape requests (see api_scraper.install_fixtures)
+http_session = requests.Session()
+api_scraper.install_fixtures(http_session)
+
+# Fonts and tables are looked up in an assets folder next to this file, this folder and the project folder above it
+# (which has statcast_2024_grouped.csv), then in the local cache, and only downloaded into the cache when none has them
+APP_DIR = os.path.dirname(os.path.abspath(__file__))
+BUNDLE_DIRS = [os.path.join(APP_DIR, 'assets'), APP_DIR, os.path.dirname(APP_DIR)]
+ASSET_DIR = os.path.join(api_scraper.DEFAULT_CACHE_DIR, 'assets')
+
+# How long each startup asset took to load in ms, and where its file came from ('bundle', 'cache' or 'download')
+asset_timings = {}
+asset_sources = {}
+
+def local_asset(filename, url):
+    # Returns a local path for an asset, downloading it into the cache as a last resort
+    for source, folder in [('bundle', folder) for folder in BUNDLE_DIRS] + [('cache', ASSET_DIR)]:
+        path = os.path.join(folder, filename)
+        if os.path.exists(path):
+            asset_sources[filename] = source
+            return path
+    response = http_session.get(url)
+    response.raise_for_status()
+    path = os.path.join(ASSET_DIR, filename)
+    os.makedirs(ASSET_DIR, exist_ok=True)
+    api_scraper._atomic_write(path, response.content)
+    asset_sources[filename] = 'download'
+    return path
+
+def startup_asset(load):
+    # Loads an asset once, on first use instead of at import, and records how long that took
+    @lru_cache(maxsize=None)
+    def wrapper():
+        start = time.perf_counter()
+        value = load()
+        asset_timings[load.__name__] = (time.perf_counter() - start) * 1000
+        return value
+    wrapper.__name__ = load.__name__
+    return wrapper
+
+@startup_asset
+def stratum_font():
+    # The font of every chart title and label. Without a local copy or a connection the charts fall back to DejaVu Sans
+    try:
+        path = local_asset('stratum2-medium-webfont.ttf', 'https://github.com/ccheney/chromotion/blob/master/assets/fonts/stratum2-medium-webfont.ttf?raw=true')
+    except requests.RequestException:
+        return font_manager.FontProperties(family='DejaVu Sans')
+    return font_manager.FontProperties(fname=path)
+
+# Setting the seaborn theme and figure resolution once, before the first chart is drawn
+@lru_cache(maxsize=None)
+def plot_style():
+    sns.set_theme(style='whitegrid',
+                  palette='deep',
+                  font='DejaVu Sans',
+                  font_scale=1.5,
+                  color_codes=True,
+                  rc=None)
+
+    plt.rcParams['figure.dpi'] = 300
 
 ### PITCH COLORS ###
 pitch_colors = {
@@ -82,14 +142,57 @@ osu_games = {
     2024: [763702,763704,763697,763701],
     2025: [796298,796296,796293,796291,795107,795103,795104,791896,791894,791892]}
 
+# The pitch columns the charts read, passed to get_stat_data so only these are read back from the pitch store
+dashboard_columns = ['game_date', 'pitcher_name', 'pitcher_hand', 'pitcher_team', 'is_swing', 'is_whiff', 'pitch_type',
+                     'strikes', 'balls', 'start_speed', 'x0', 'z0', 'zone', 'extension', 'spin_rate', 'spin_direction', 'ivb', 'hb']
+
+# The local pitch store, every game is scraped and parsed once and read back from Parquet afterwards
+pitch_store = api_scraper.PitchStore(api_scraper.DEFAULT_STORE_DIR)
+
+# The season frames shared by every chart, kept in memory until the store changes or the memory budget is used up
+season_frames = api_scraper.FrameCache()
+
+# Games that failed, were not final yet or had no plays, with when they were last tried. They are only tried again after UNAVAILABLE_TTL seconds
+UNAVAILABLE_TTL = 300
+unavailable_games = {}
+ingest_lock = threading.Lock()
+
+# One scraper for every render, built the first time a game has to be downloaded
+@lru_cache(maxsize=1)
+def dashboard_scraper():
+    return MLB_Scrape(cache_dir=api_scraper.DEFAULT_CACHE_DIR)
+
+def ingest_missing(gamelist):
+    # Adding the games the store does not have yet, skipping the ones that were unavailable a moment ago
+    with ingest_lock:
+        stored = pitch_store.games()
+        now = time.time()
+        missing = [game_id for game_id in dict.fromkeys(gamelist)
+                   if game_id not in stored and now - unavailable_games.get(game_id, -math.inf) > UNAVAILABLE_TTL]
+        if len(missing) == 0:
+            return
+        for game_id, status, _ in pitch_store.iter_ingest(dashboard_scraper(), missing):
+            if status == 'stored':
+                unavailable_games.pop(game_id, None)
+            else:
+                unavailable_games[game_id] = now
+
 # Creating a function that can return the full dataframe for any set of games
-def get_stat_data(gamelist):
-    # Activating the scraper
-    scraper = MLB_Scrape()
+def get_stat_data(gamelist, columns=None, pitcher_name=None):
+    # Adding any games the store does not have yet, using the on-disk feed cache so finished games are only downloaded once
+    ingest_missing(gamelist)
+
+    # The frame of every requested game (every column unless columns are given) is read from the store once per store version, later calls share it
+    key = (tuple(gamelist), None if columns is None else tuple(columns), pitch_store.version(gamelist))
+    df = season_frames.get_or_build(key, lambda: stat_frame(pitch_store.read(game_ids=gamelist, columns=columns)))
+    if pitcher_name is None:
+        return df
 
-    # Getting the game data for the requested games, making it a pandas dataframe
-    game_data = scraper.get_data(game_list_input=gamelist)
-    data_df = scraper.get_data_df(data_list=game_data)
+    # A pitcher's pitches are cached as their own frame, keeping the season index that after() steps through
+    return season_frames.get_or_build(key + (pitcher_name,), lambda: df[df['pitcher_name'] == pitcher_name])
+
+# Making a pitch frame from api_scraper a pandas dataframe with the result columns the charts use
+def stat_frame(data_df):
     df = data_df.to_pandas()
 
     # Adding columns for relevant pitching results
@@ -104,12 +207,13 @@ def get_stat_data(gamelist):
 
 # Creating a function that gets only pitches thrown by a selected pitcher over a selected year
 def player_year_data(playername, year):
-    year_df = get_stat_data(osu_games[year])
-    return year_df[year_df['pitcher_name'] == playername]
+    # The pitcher's rows of the cached season frame, with the season index like a filter of the full frame
+    return get_stat_data(osu_games[year], columns=dashboard_columns, pitcher_name=playername)
 
 # Aggregating relevant metrics for our OSU pitcher to find pitch classification averages
 def gen_grouping(df):
-    group_df = df.groupby(['pitcher_name','pitcher_hand','year','pitch_type']).agg(
+    # observed=True only builds the groups that occur, so categorical columns (compact_dtypes) don't expand into every combination
+    group_df = df.groupby(['pitcher_name','pitcher_hand','year','pitch_type'], observed=True).agg(
                         pitch = ('pitch_type','count'),  # Count of pitches
                         start_speed = ('start_speed','mean'),  # Average start speed
                         ivb = ('ivb','mean'),  # Average vertical movement
@@ -127,71 +231,197 @@ def gen_grouping(df):
                         ).reset_index()
     return group_df
 
-# Importing the data from statcast averages
-mlbpd = pd.read_csv('https://github.com/tnestico/pitching_summary/blob/main/statcast_2024_grouped.csv?raw=true')
-mlbpd = mlbpd.rename(columns={'release_speed': 'start_speed',
-                              'pfx_z': 'ivb', 
-                              'pfx_x': 'hb', 
-                              'release_spin_rate': 'spin_rate', 
-                              'release_pos_x': 'x0', 
-                              'release_pos_z': 'z0', 
-                              'release_extension': 'extension'})
+# Importing the data from statcast averages, the copy in the repo is used before the one on GitHub
+@startup_asset
+def mlb_averages():
+    mlbpd = pd.read_csv(local_asset('statcast_2024_grouped.csv', 'https://github.com/tnestico/pitching_summary/blob/main/statcast_2024_grouped.csv?raw=true'))
+    return mlbpd.rename(columns={'release_speed': 'start_speed',
+                                 'pfx_z': 'ivb', 
+                                 'pfx_x': 'hb', 
+                                 'release_spin_rate': 'spin_rate', 
+                                 'release_pos_x': 'x0', 
+                                 'release_pos_z': 'z0', 
+                                 'release_extension': 'extension'})
+
+# The OSU baseball roster of each season. The page only sends its first players until it is scrolled, so each season is
+# scrolled once in a headless browser and its links are kept on disk, instead of starting the browser on every lookup
+class RosterIndex:
+    """
+    Keeps the aria-label and href of every link on the scrolled roster page of each season in a JSON file, and looks
+    players up in them the way get_player_link always did: the first link whose aria-label matches the player name.
+    A saved season is never replaced by an older page. It is scrolled again only when a player is missing from it,
+    at most once per max_age, which is how players added during the season are picked up.
+    """
+
+    SITE = 'https://osubeavers.com'
+    URL = SITE + '/sports/baseball/roster/{year}/'
+
+    def __init__(self, path, max_age=24 * 3600):
+        self.path = path
+        self.max_age = max_age
+        self.seasons = {}
+        if os.path.exists(path):
+            with open(path) as f:
+                # Seasons saved in another layout are scrolled again
+                self.seasons = {year: entry for year, entry in json.load(f).items() if 'links' in entry}
+        self.lock = threading.Lock()
+
+    def _save(self):
+        os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        api_scraper._atomic_write(self.path, json.dumps(self.seasons))
+
+    @staticmethod
+    def _links(html):
+        # [aria-label, href] of every link of the page, in page order
+        from bs4 import BeautifulSoup
+        return [[tag['aria-label'], tag['href']] for tag in BeautifulSoup(html, 'html.parser').find_all(attrs={'aria-label': True, 'href': True})]
+
+    def _scrolled_page(self, url, scroll_pause_time=1):
+        # Scrolls the page in headless Chrome until it stops growing, so it loads every player (the plain page stops after 30)
+        from selenium import webdriver
+        from selenium.webdriver.chrome.options import Options
+        options = Options()
+        options.add_argument('--headless')
+        driver = webdriver.Chrome(options=options)
+        try:
+            driver.get(url)
+            last_height = driver.execute_script("return document.body.scrollHeight")
+            while True:
+                driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
+                time.sleep(scroll_pause_time)
+                new_height = driver.execute_script("return document.body.scrollHeight")
+                if new_height == last_height:
+                    break
+                last_height = new_height
+            return driver.page_source
+        finally:
+            driver.quit()
+
+    @staticmethod
+    def _find(links, playername):
+        # The first link whose aria-label matches the name, as soup.find(attrs={"aria-label": re.compile(playername)}) did
+        pattern = re.compile(playername)
+        for label, href in links:
+            if pattern.search(label):
+                return href
+        return None
+
+    def lookup(self, playername, year):
+        """
+        Returns {'id': roster id, 'url': roster page} of a player, scrolling the season's roster page when it is not
+        saved yet or, once it is older than max_age, when the player is not on it.
+        """
+        with self.lock:
+            entry = self.seasons.get(str(year))
+            href = None if entry is None else self._find(entry['links'], playername)
+            if href is None and (entry is None or time.time() - entry['fetched'] > self.max_age):
+                entry = {'fetched': time.time(), 'links': self._links(self._scrolled_page(self.URL.format(year=year)))}
+                self.seasons[str(year)] = entry
+                self._save()
+                href = self._find(entry['links'], playername)
+        if href is None:
+            raise KeyError(f'{playername} is not on the {year} roster')
+        url = href if href.startswith('http') else self.SITE + href
+        return {'id': url.rstrip('/').rsplit('/', 1)[1], 'url': url}
+
+roster_index = RosterIndex(os.path.join(api_scraper.DEFAULT_CACHE_DIR, 'osu_roster.json'))
 
 # Defining a command that will return our selected pitcher's OSU roster page
 def get_player_link(playername, year):
-    # URL of the OSU Beavers baseball roster page
-    url = 'https://osubeavers.com/sports/baseball/roster/' + str(year) + '/'
-
-    # Defining a function using Selenium to scroll the page, so it loads every player (original URL stops after loading 30)
-    options = Options()
-    options.add_argument('--headless')
-    driver = webdriver.Chrome(options=options)
-    def scroll_and_scrape(url, scroll_pause_time=1):
-        driver.get(url)
-        # Get scroll height
-        last_height = driver.execute_script("return document.body.scrollHeight")
-        while True:
-            # Scroll down to bottom
-            driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-            # Wait to load page
-            time.sleep(scroll_pause_time)
-            # Calculate new scroll height and compare with last scroll height
-            new_height = driver.execute_script("return document.body.scrollHeight")
-            if new_height == last_height:
-                break
-            last_height = new_height
-        # Now that the page is fully scrolled, grab the source
-        soup = BeautifulSoup(driver.page_source, 'html.parser')
-        return soup
-    soup = scroll_and_scrape(url)
-
-    link = url.removesuffix('/sports/baseball/roster/' + str(year) + '/') + soup.find(attrs={"aria-label": re.compile(playername)})['href']
-    return link
-
-# Defining a function that will return our selected pitcher's OSU player ID
+    return roster_index.lookup(playername, year)['url']
+
+# Defining a function that will return our selected pitcher's OSU player ID, the last part of the roster page URL
 def get_player_id(playername, link):
-    id = link.removeprefix('https://osubeavers.com/sports/baseball/roster/' + playername.lower().split(' ',)[0] + '-' + playername.lower().split(' ',)[1] + '/')
+    id = link.rstrip('/').rsplit('/', 1)[1]
     return id
 
-def get_headshot(link, ax):
-    # Using the players link to create a soup object
-    response = requests.get(link)
-    soup = BeautifulSoup(response.text, 'html.parser')
+# The pages and images drawn in the dashboard header, kept in memory and on disk so repeat renders don't download them again
+class AssetCache:
+    """
+    A content cache for HTML pages and images with a time to live per asset. Images are decoded and downscaled to the
+    pixel size they are drawn at before they are stored, so each one is only decoded at full size once. An asset past its
+    time to live is downloaded again, and the stale copy is still served when that download fails.
+    """
+
+    def __init__(self, cache_dir, session):
+        self.cache_dir = cache_dir
+        self.session = session
+        self.memory = {}
+        self.lock = threading.Lock()
+        os.makedirs(cache_dir, exist_ok=True)
+
+    def _path(self, key, extension):
+        return os.path.join(self.cache_dir, hashlib.sha1(repr(key).encode()).hexdigest() + extension)
+
+    def _fetch(self, key, extension, ttl, download, decode):
+        # Returns the asset from memory, then disk, then download() while it is within its time to live
+        path = self._path(key, extension)
+        with self.lock:
+            entry = self.memory.get(key)
+        if entry is not None and time.time() - entry[1] <= ttl:
+            return entry[0]
+        fetched = os.path.getmtime(path) if os.path.exists(path) else None
+        if fetched is None or time.time() - fetched > ttl:
+            try:
+                content = download()
+                api_scraper._atomic_write(path, content)
+                fetched = time.time()
+            except requests.RequestException:
+                if fetched is None:
+                    raise
+        with open(path, 'rb') as f:
+            value = decode(f.read())
+        with self.lock:
+            self.memory[key] = (value, fetched)
+        return value
+
+    def page(self, url, ttl):
+        # The text of a page
+        def download():
+            response = self.session.get(url)
+            response.raise_for_status()
+            return response.content
+        return self._fetch(('page', url), '.html', ttl, download, lambda content: content.decode('utf-8', errors='replace'))
+
+    def image(self, url, ttl, size=None):
+        # An image, shrunk to fit within size (width, height) in pixels, keeping its aspect ratio
+        from PIL import Image
+        def download():
+            response = self.session.get(url)
+            response.raise_for_status()
+            img = Image.open(BytesIO(response.content))
+            if img.mode not in ('RGB', 'RGBA', 'L', 'LA', 'P'):
+                img = img.convert('RGB')
+            if size is not None:
+                img.thumbnail(size, Image.LANCZOS)
+            buffer = BytesIO()
+            img.save(buffer, format='PNG')
+            return buffer.getvalue()
+        def decode(content):
+            img = Image.open(BytesIO(content))
+            img.load()
+            return img
+        return self._fetch(('image', url, size), '.png', ttl, download, decode)
+
+asset_cache = AssetCache(ASSET_DIR, http_session)
+
+# How long each kind of asset is kept before it is downloaded again, in seconds
+PAGE_TTL = 24 * 3600
+HEADSHOT_TTL = 7 * 24 * 3600
+LOGO_TTL = 30 * 24 * 3600
+
+# The pixel size an axis is drawn at, which images are downscaled to
+def ax_pixels(ax):
+    bbox = ax.get_window_extent()
+    return (math.ceil(bbox.width), math.ceil(bbox.height))
+
+# Reading the headshot link and bio fields off a player's roster page once per player and season
+@lru_cache(maxsize=256)
+def player_page(link, year):
+    from bs4 import BeautifulSoup
+    soup = BeautifulSoup(asset_cache.page(link, PAGE_TTL), 'html.parser')
     # Finding the headshot on the page
-    pic_link = soup.find(loading="eager", class_="block aspect-[2/3] h-full w-full max-w-[120px] md:max-w-[180px]")['src']
-    # Making the headshot a plottable image
-    pic_response = requests.get(pic_link)
-    img = Image.open(BytesIO(pic_response.content))
-    # Creating the plot
-    ax.set_xlim(0, 1)
-    ax.set_ylim(0, 1.5)
-    ax.imshow(img, extent=[0, 1, 0, 1.5], origin='upper')
-    ax.axis('off')
-
-def player_bio(playername, year, link, ax):
-    # Using the players link to create a soup object
-    response = requests.get(link)
-    soup = BeautifulSoup(response.text, 'html.parser')
+    headshot = soup.find(loading="eager", class_="block aspect-[2/3] h-full w-full max-w-[120px] md:max-w-[180px]")['src']
     # Determining pitcher handedness
     if soup.find("dt", string="Position: ").find_parent().get_text().split(': ')[1].split('-')[0] == "Right":
       pitcher_hand = 'RHP'
@@ -202,19 +432,32 @@ def player_bio(playername, year, link, ax):
     # Calling height/weight
     height = soup.find("dt", string="Height: ").find_parent().get_text().split(': ')[1]
     weight = soup.find("dt", string="Weight: ").find_parent().get_text().split(': ')[1]
+    return {'headshot': headshot, 'hand': pitcher_hand, 'class': pitcher_class, 'height': height, 'weight': weight}
+
+def get_headshot(link, ax, year=None):
+    # Making the headshot a plottable image, at the size of the axis it is drawn on
+    img = asset_cache.image(player_page(link, year)['headshot'], HEADSHOT_TTL, size=ax_pixels(ax))
+    # Creating the plot
+    ax.set_xlim(0, 1)
+    ax.set_ylim(0, 1.5)
+    ax.imshow(img, extent=[0, 1, 0, 1.5], origin='upper')
+    ax.axis('off')
+
+def player_bio(playername, year, link, ax):
+    # The bio fields from the player's roster page
+    bio = player_page(link, year)
     # Display the graphic
-    ax.text(0.5, 1, f'{playername}', va='top', ha='center', fontsize=56, font=stratum)
-    ax.text(0.5, 0.70, f'{pitcher_hand}, {pitcher_class}, {height}/{weight}', va='top', ha='center', fontsize=30, font=stratum)
-    ax.text(0.5, 0.50, f'Season Pitching Summary', va='top', ha='center', fontsize=50, font=stratum)
-    ax.text(0.5, 0.25, f'{year} NCAA D1 Baseball Season', va='top', ha='center', fontsize=30, fontstyle='italic', font=stratum)
+    ax.text(0.5, 1, f'{playername}', va='top', ha='center', fontsize=56, font=stratum_font())
+    ax.text(0.5, 0.70, f"{bio['hand']}, {bio['class']}, {bio['height']}/{bio['weight']}", va='top', ha='center', fontsize=30, font=stratum_font())
+    ax.text(0.5, 0.50, f'Season Pitching Summary', va='top', ha='center', fontsize=50, font=stratum_font())
+    ax.text(0.5, 0.25, f'{year} NCAA D1 Baseball Season', va='top', ha='center', fontsize=30, fontstyle='italic', font=stratum_font())
     ax.axis('off')
 
 def logo(ax):
     # Using the logo from the baseball website, but storing it here so we don't have to scrape as it will be the same for each player
     logo_link = 'https://dxbhsrqyrr690.cloudfront.net/sidearm.nextgen.sites/oregonstate.sidearmsports.com/images/logos/site/site.png'
-    # Making the logo a plottable image
-    logo_response = requests.get(logo_link)
-    img = Image.open(BytesIO(logo_response.content))
+    # Making the logo a plottable image, at the size of the axis it is drawn on
+    img = asset_cache.image(logo_link, LOGO_TTL, size=ax_pixels(ax))
     # Creating the plot
     ax.set_xlim(0, 1)
     ax.set_ylim(0, 1)
@@ -252,20 +495,20 @@ def break_plot(playername, year, ax):
     ax.axvline(x=0, color='#808080', alpha=0.5, linestyle='--', zorder=1)
 
     # Set the labels for the x and y axes
-    ax.set_xlabel('Horizontal Break (in)', font=stratum, fontsize=16)
-    ax.set_ylabel('Induced Vertical Break (in)', font=stratum, fontsize=16)
+    ax.set_xlabel('Horizontal Break (in)', font=stratum_font(), fontsize=16)
+    ax.set_ylabel('Induced Vertical Break (in)', font=stratum_font(), fontsize=16)
 
     # Set the title of the plot
-    ax.set_title("Pitch Breaks", font=stratum, fontsize=20)
+    ax.set_title("Pitch Breaks", font=stratum_font(), fontsize=20)
 
     # Remove the legend
     ax.get_legend().remove()
 
     # Set the tick positions and labels for the x and y axes
     ax.set_xticks(range(-20, 21, 10))
-    ax.set_xticklabels(range(-20, 21, 10), font=stratum, fontsize=15)
+    ax.set_xticklabels(range(-20, 21, 10), font=stratum_font(), fontsize=15)
     ax.set_yticks(range(-20, 21, 10))
-    ax.set_yticklabels(range(-20, 21, 10), font=stratum, fontsize=15)
+    ax.set_yticklabels(range(-20, 21, 10), font=stratum_font(), fontsize=15)
 
     # Set the limits for the x and y axes
     ax.set_xlim((-25, 25))
@@ -274,22 +517,22 @@ def break_plot(playername, year, ax):
     # Add text annotations based on the pitcher's throwing hand
     if df['pitcher_hand'].values[0] == 'R':
         ax.text(-21.5, -24.2, s='Glove Side', fontstyle='italic', ha='left', va='bottom',
-                bbox=dict(facecolor='white', edgecolor='black'), font=stratum, fontsize=10, zorder=3)
+                bbox=dict(facecolor='white', edgecolor='black'), font=stratum_font(), fontsize=10, zorder=3)
         ax.text(-24.2, -24.2, s='← ', fontstyle='italic', ha='left', va='bottom',
                 bbox=dict(facecolor='white', edgecolor='black'), fontsize=9, zorder=3)
         ax.text(21.5, -24.2, s='Arm Side', fontstyle='italic', ha='right', va='bottom',
-                bbox=dict(facecolor='white', edgecolor='black'), font=stratum, fontsize=10, zorder=3)
+                bbox=dict(facecolor='white', edgecolor='black'), font=stratum_font(), fontsize=10, zorder=3)
         ax.text(22.7, -24.2, s=' →', fontstyle='italic', ha='left', va='bottom',
                 bbox=dict(facecolor='white', edgecolor='black'), fontsize=9, zorder=3)
 
     if df['pitcher_hand'].values[0] == 'L':
         ax.invert_xaxis()
         ax.text(21.5, -24.2, s='Arm Side', fontstyle='italic', ha='left', va='bottom',
-                bbox=dict(facecolor='white', edgecolor='black'), font=stratum, fontsize=10, zorder=3)
+                bbox=dict(facecolor='white', edgecolor='black'), font=stratum_font(), fontsize=10, zorder=3)
         ax.text(24.2, -24.2, s='← ', fontstyle='italic', ha='left', va='bottom',
                 bbox=dict(facecolor='white', edgecolor='black'), fontsize=9, zorder=3)
         ax.text(-21.5, -24.2, s='Glove Side', fontstyle='italic', ha='right', va='bottom',
-                bbox=dict(facecolor='white', edgecolor='black'), font=stratum, fontsize=10, zorder=3)
+                bbox=dict(facecolor='white', edgecolor='black'), font=stratum_font(), fontsize=10, zorder=3)
         ax.text(-22.7, -24.2, s=' →', fontstyle='italic', ha='left', va='bottom',
                 bbox=dict(facecolor='white', edgecolor='black'), fontsize=9, zorder=3)
 
@@ -340,9 +583,9 @@ def pitch_pie(df, balls, strikes, ax):
         [p.set_zorder(10) for p in patches]
     # Making the titles for each count
     if balls + strikes == 3:
-        ax.set_title(f'{balls}-{strikes}', font=stratum, fontsize=20, loc='left')
+        ax.set_title(f'{balls}-{strikes}', font=stratum_font(), fontsize=20, loc='left')
     else:
-        ax.set_title(f'{balls}-{strikes}', font=stratum, fontsize=20)
+        ax.set_title(f'{balls}-{strikes}', font=stratum_font(), fontsize=20)
     ax.axis('equal')
 
 # Creating the function that calls the chart
@@ -383,17 +626,17 @@ def plinko_chart(playername, year, fig, ax, gs, gs_x, gs_y):
     for (balls, strikes) in count_list:
         pitch_pie(df, balls, strikes, count_plot_loc[(balls,strikes)])
         if (balls,strikes+1) in count_list:
-           line_list.append(ConnectionPatch(xyA=(0,0), xyB=(0,0), coordsA=count_plot_loc[(balls,strikes)].transData, coordsB=count_plot_loc[(balls,strikes+1)].transData, **kw, linewidth=10*after(df, balls,strikes)['strike'].loc[0]/tot_abs))
+           line_list.append(mpatches.ConnectionPatch(xyA=(0,0), xyB=(0,0), coordsA=count_plot_loc[(balls,strikes)].transData, coordsB=count_plot_loc[(balls,strikes+1)].transData, **kw, linewidth=10*after(df, balls,strikes)['strike'].loc[0]/tot_abs))
         if (balls+1,strikes) in count_list:
-           line_list.append(ConnectionPatch(xyA=(0,0), xyB=(0,0), coordsA=count_plot_loc[(balls,strikes)].transData, coordsB=count_plot_loc[(balls+1,strikes)].transData, **kw, linewidth=10*after(df, balls,strikes)['ball'].loc[0]/tot_abs))
+           line_list.append(mpatches.ConnectionPatch(xyA=(0,0), xyB=(0,0), coordsA=count_plot_loc[(balls,strikes)].transData, coordsB=count_plot_loc[(balls+1,strikes)].transData, **kw, linewidth=10*after(df, balls,strikes)['ball'].loc[0]/tot_abs))
         for line in line_list:
             ax.add_artist(line)
     # Hiding axis text
     ax.axis('off')
     # Setting the title
-    ax.set_title('Pitch Sequencing', font=stratum, fontsize=20)
+    ax.set_title('Pitch Sequencing', font=stratum_font(), fontsize=20)
     # Set a label underneath the plot
-    count_plot_loc[(3,2)].set_xlabel('Line Thickness = Amount of Pitches',fontsize=15, font=stratum)
+    count_plot_loc[(3,2)].set_xlabel('Line Thickness = Amount of Pitches',fontsize=15, font=stratum_font())
 
 def velocity_chart(playername, year, fig, ax, gs, gs_x, gs_y):
     # Assigning the dataframe relevant to our selected pitcher
@@ -407,7 +650,7 @@ def velocity_chart(playername, year, fig, ax, gs, gs_x, gs_y):
 
     # Turn off the axis and set the title for the main plot
     ax.axis('off')
-    ax.set_title('Pitch Velocity Distribution', font=stratum, fontsize=20)
+    ax.set_title('Pitch Velocity Distribution', font=stratum_font(), fontsize=20)
 
     # Create a grid for the inner subplots
     inner_grid_1 = gridspec.GridSpecFromSubplotSpec(len(items_in_order), 1, subplot_spec=gs[gs_x[0]:gs_x[-1], gs_y[0]:gs_y[-1]])
@@ -438,6 +681,7 @@ def velocity_chart(playername, year, fig, ax, gs, gs_x, gs_y):
                       linestyle='--')
 
         # Plot the mean release speed for the 2020-2024 MLB Average Data
+        mlbpd = mlb_averages()
         df_average = mlbpd[mlbpd['pitch_type'] == i]['start_speed']
         ax_top[ax_number].plot([df_average.mean(), df_average.mean()],
                       [ax_top[ax_number].get_ylim()[0], ax_top[ax_number].get_ylim()[1]],
@@ -461,11 +705,11 @@ def velocity_chart(playername, year, fig, ax, gs, gs_x, gs_y):
         ax_top[ax_number].set_yticks([])
         ax_top[ax_number].grid(axis='x', linestyle='--')
         for label in ax_top[ax_number].get_xticklabels():
-            label.set_fontproperties(stratum)
+            label.set_fontproperties(stratum_font())
 
         # Add text label for the pitch type
         ax_top[ax_number].text(-0.01, 0.5, i, transform=ax_top[ax_number].transAxes,
-                      fontsize=20, va='center', ha='right', font=stratum)
+                      fontsize=20, va='center', ha='right', font=stratum_font())
         ax_number += 1
 
     # Hide the top, right, and left spines for the last subplot
@@ -475,12 +719,12 @@ def velocity_chart(playername, year, fig, ax, gs, gs_x, gs_y):
 
     # Set the x-ticks and x-label for the last subplot
     ax_top[-1].set_xticks(list(range(math.floor(df['start_speed'].min() / 5) * 5, math.ceil(df['start_speed'].max() / 5) * 5, 5)))
-    ax_top[-1].set_xlabel('Velocity (mph)',fontsize=20, font=stratum)
+    ax_top[-1].set_xlabel('Velocity (mph)',fontsize=20, font=stratum_font())
 
 # Defining a function that will turn our player's season stats into a dataframe
 def get_player_stats(playername, year, link):
     # Using the osu stats API, with the previous functions to find the player's stats
-    response = requests.get('https://osubeavers.com/api/v2/stats/bio?rosterPlayerId=' + get_player_id(playername, link) + '&sport=baseball&year=' + str(year)).json()
+    response = http_session.get('https://osubeavers.com/api/v2/stats/bio?rosterPlayerId=' + get_player_id(playername, link) + '&sport=baseball&year=' + str(year)).json()
 
     # Converting it to a pandas dataframe with just the total pitching stats
     df = pd.DataFrame(response).loc['pitchingStatsTotal', 'currentStats']
@@ -667,8 +911,11 @@ def plot_pitch_format(df, table):
 
 
 # Define color maps
-cmap_sum = mcolors.LinearSegmentedColormap.from_list("", ['#325aa1','#FFFFFF','#c91f26'])
-cmap_sum_r = mcolors.LinearSegmentedColormap.from_list("", ['#c91f26','#FFFFFF','#325aa1'])
+@lru_cache(maxsize=None)
+def color_maps():
+    cmap_sum = mcolors.LinearSegmentedColormap.from_list("", ['#325aa1','#FFFFFF','#c91f26'])
+    cmap_sum_r = mcolors.LinearSegmentedColormap.from_list("", ['#c91f26','#FFFFFF','#325aa1'])
+    return cmap_sum, cmap_sum_r
 
 # List of statistics to color
 color_stats = ['start_speed', 'extension', 'whiff_rate', 'in_zone_rate', 'chase_rate']
@@ -717,7 +964,8 @@ def pitch_table(playername, year, ax, fontsize:int=20):
     # Performing operations on our dataframe
     df_group, color_list = table_df(playername, year)
     df_plot = plot_pitch_format(df_group, table)
-    color_list_df = get_cell_colors(df_group, mlbpd, color_stats, cmap_sum, cmap_sum_r)
+    cmap_sum, cmap_sum_r = color_maps()
+    color_list_df = get_cell_colors(df_group, mlb_averages(), color_stats, cmap_sum, cmap_sum_r)
 
     # Create a table plot with the DataFrame values and specified column labels
     table_plot = ax.table(cellText=df_plot.values, colLabels=table_columns, cellLoc='center',
@@ -760,6 +1008,7 @@ def pitch_table(playername, year, ax, fontsize:int=20):
 def pitching_dashboard(playername, year):
     # Create a 20 by 20 figure
     df = player_year_data(playername, year)
+    plot_style()
     fig = plt.figure(figsize=(20, 20))
 
     # Create a gridspec layout with 8 columns and 6 rows
@@ -800,7 +1049,7 @@ def pitching_dashboard(playername, year):
     player_stats_table(playername=playername, year=year, link=link, ax=ax_season_table, fontsize=20)
     pitch_table(playername=playername, year=year, ax=ax_table, fontsize=fontsize)
 
-    get_headshot(link=link, ax=ax_headshot)
+    get_headshot(link=link, ax=ax_headshot, year=year)
     player_bio(playername=playername, year=year, link=link, ax=ax_bio)
     logo(ax=ax_logo)
 
@@ -809,9 +1058,9 @@ def pitching_dashboard(playername, year):
     break_plot(playername=playername, year=year, ax=ax_plot_3)
 
     # Add footer text
-    ax_footer.text(0, 1, 'By: Olav Moeller\nInspired by: @TJStats', ha='left', va='top', fontsize=24, font=stratum)
-    ax_footer.text(0.5, 1, 'Color Coding Compares to League Average By Pitch', ha='center', va='top', fontsize=16, font=stratum)
-    ax_footer.text(1, 1, 'Data: MLB, Fangraphs, OSU Baseball\nImages: OSU Baseball\nStatcast Data from 2/21-2/25/2024', ha='right', va='top', fontsize=24, font=stratum)
+    ax_footer.text(0, 1, 'By: Olav Moeller\nInspired by: @TJStats', ha='left', va='top', fontsize=24, font=stratum_font())
+    ax_footer.text(0.5, 1, 'Color Coding Compares to League Average By Pitch', ha='center', va='top', fontsize=16, font=stratum_font())
+    ax_footer.text(1, 1, 'Data: MLB, Fangraphs, OSU Baseball\nImages: OSU Baseball\nStatcast Data from 2/21-2/25/2024', ha='right', va='top', fontsize=24, font=stratum_font())
 
     # Adjust the spacing between subplots
     plt.tight_layout()
@@ -1,30 +1,4 @@
 import pandas as pd
-import numpy as np
-import matplotlib as mpl
-import matplotlib.pyplot as plt
-import matplotlib.gridspec as gridspec
-import matplotlib.colors as mcolors
-from matplotlib.lines import Line2D
-from matplotlib.patches import ConnectionPatch
-import seaborn as sns
-import statsapi
-import requests
-import pybaseball as pyb
-import polars as pl
-import re
-from PIL import Image
-from io import BytesIO
-from pyfonts import load_font
-from bs4 import BeautifulSoup
-import time
-import math
-from selenium import webdriver
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.chrome.service import Service
-from webdriver_manager.chrome import ChromeDriverManager
-from webdriver_manager.core.os_manager import ChromeType
-import api_scraper
-from api_scraper import MLB_Scrape
 import streamlit as st
 import OSU_Dashboard as dashboard
 
@@ -38,7 +12,7 @@ This Streamlit app creates a summary graphic for a selected OSU pitcher, based o
 """
 )
 
-all_games = dashboard.get_stat_data(dashboard.osu_games[2024] + dashboard.osu_games[2025])
+all_games = dashboard.get_stat_data(dashboard.osu_games[2024] + dashboard.osu_games[2025], columns=dashboard.dashboard_columns)
 osu_pitches = all_games[all_games['pitcher_team'] == 'OSU']
 osu_pitches.loc[:, 'name_year'] = osu_pitches['pitcher_name'] + ' - ' + osu_pitches['year'].astype(str)
 options_list = pd.Series(osu_pitches['name_year'].unique()).sort_values().tolist()
@@ -1,18 +1,2421 @@
 import requests
+from requests.adapters import HTTPAdapter, BaseAdapter
 import polars as pl
 import numpy as np
-from datetime import datetime
+from datetime import datetime, timedelta
 from tqdm import tqdm
 from pytz import timezone
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, wait, FIRST_COMPLETED
+import multiprocessing
 import re
+import os
+import json
+import gzip
+import time
+import threading
+import hashlib
+import random
+import logging
+from urllib.parse import urlparse
+from io import BytesIO
+from collections import OrderedDict
+from functools import lru_cache, partial
+from typing import Optional
+
+# Warnings about games that could not be decoded or downloaded, the rest of the progress output stays on print
+logger = logging.getLogger(__name__)
+
+# Default location for the local caches, can be moved with the MLB_SCRAPE_CACHE environment variable
+DEFAULT_CACHE_DIR = os.environ.get('MLB_SCRAPE_CACHE', os.path.join(os.path.expanduser('~'), '.cache', 'mlb_scrape'))
+
+# Default location of the partitioned pitch store, can be moved with the MLB_PITCH_STORE environment variable
+DEFAULT_STORE_DIR = os.environ.get('MLB_PITCH_STORE', os.path.join(DEFAULT_CACHE_DIR, 'pitches'))
+
+# Memory budget of an in-process FrameCache in MB, can be changed with the MLB_SCRAPE_FRAME_CACHE_MB environment variable
+DEFAULT_FRAME_CACHE_MB = float(os.environ.get('MLB_SCRAPE_FRAME_CACHE_MB', 512))
+
+# Record or replay every request through a fixture archive, set with the MLB_SCRAPE_FIXTURES, MLB_SCRAPE_FIXTURE_MODE ('record' or 'replay')
+# and MLB_SCRAPE_FIXTURE_SERVER (the url of a running FixtureServer) environment variables. Unset means live requests
+FIXTURE_DIR = os.environ.get('MLB_SCRAPE_FIXTURES')
+FIXTURE_MODE = os.environ.get('MLB_SCRAPE_FIXTURE_MODE', 'replay')
+FIXTURE_SERVER = os.environ.get('MLB_SCRAPE_FIXTURE_SERVER')
+
+
+def _coded_game_state(content: bytes):
+    # gameData.status is the first codedGameState in a feed/live document, so a regex avoids decoding the whole feed
+    state = re.search(rb'"codedGameState"\s*:\s*"(\w+)"', content)
+    return state.group(1).decode() if state else None
+
+
+def _atomic_write(path: str, data):
+    """
+    Writes bytes or text to a file through a temporary file and os.replace, so a crash never leaves a half-written file
+    behind and readers only ever see the old or the new contents.
+    """
+    tmp_path = f'{path}.{threading.get_ident()}.tmp'
+    with open(tmp_path, 'wb' if isinstance(data, bytes) else 'w') as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+
+
+class _LRUIndex:
+    """
+    The JSON index shared by the on-disk stores: one entry per stored file with its compressed size and last access time.
+    Once the files grow past max_bytes the least recently used ones are evicted first. The index is written after every
+    save_every changes and on flush. Subclasses define _path(key).
+    """
+
+    def __init__(self, cache_dir: str, max_bytes: int = None, save_every: int = 1):
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.save_every = max(1, save_every)
+        self.unsaved = 0
+        os.makedirs(cache_dir, exist_ok=True)
+
+        self.index_path = os.path.join(cache_dir, 'index.json')
+        self.index = {}
+        if os.path.exists(self.index_path):
+            with open(self.index_path) as f:
+                self.index = json.load(f)
+
+        self.lock = threading.Lock()
+
+    def _path(self, key):
+        raise NotImplementedError
+
+    def _evict(self):
+        # Drop the least recently used entries until the files fit under max_bytes, None keeps everything
+        if self.max_bytes is None:
+            return
+        total = sum(entry['bytes'] for entry in self.index.values())
+        if total <= self.max_bytes:
+            return
+        for key in sorted(self.index, key=lambda k: self.index[k]['accessed']):
+            if total <= self.max_bytes:
+                break
+            total -= self.index.pop(key)['bytes']
+            try:
+                os.remove(self._path(key))
+            except FileNotFoundError:
+                pass
+
+    def _save_index(self):
+        _atomic_write(self.index_path, json.dumps(self.index))
+        self.unsaved = 0
+
+    def _changed(self):
+        # Counts a change to the index, writing it once save_every changes have piled up. Called with the lock held
+        self.unsaved += 1
+        if self.unsaved >= self.save_every:
+            self._save_index()
+
+    def flush(self):
+        """
+        Writes the index, including the latest access times, back to disk.
+        """
+        with self.lock:
+            self._save_index()
 
 
-class MLB_Scrape:
+class FeedCache(_LRUIndex):
+    """
+    A gzip-compressed on-disk cache of raw feed/live JSON, keyed by gamePk.
+
+    Games in a final codedGameState never change again, so they are kept until evicted. Any other game
+    is only served for live_ttl seconds. Once the cache grows past max_bytes the least recently used
+    games are evicted first.
+
+    The index is written every save_every new games rather than on every put, so a crawl does not rewrite
+    it once per game. Call flush to write the rest, iter_data and get_data do at the end of every call.
+    """
+
+    # codedGameState values for games that are over (F = Final, O = Game Over)
+    FINAL_STATES = ('F', 'O')
+
+    def __init__(self, cache_dir: str, max_bytes: int = 2 * 1024 ** 3, live_ttl: int = 60, save_every: int = 100):
+        """
+        Parameters:
+        - cache_dir (str): The directory the compressed feeds and the index are stored in.
+        - max_bytes (int): The maximum compressed size of the cache before LRU eviction. Default is 2 GB.
+        - live_ttl (int): The number of seconds a game that is not final is served from the cache. Default is 60.
+        - save_every (int): The number of new games between index writes. Default is 100.
+        """
+        # The index holds state, timestamps and sizes for every cached game
+        super().__init__(cache_dir, max_bytes, save_every)
+        self.live_ttl = live_ttl
+        self.hits = 0
+        self.misses = 0
+        self.bytes_saved = 0
+
+    def _path(self, game_id):
+        return os.path.join(self.cache_dir, f'{game_id}.json.gz')
+
+    def get(self, game_id: int):
+        """
+        Returns the raw feed bytes for a game, or None if the game is not cached or has expired.
+        """
+        key = str(game_id)
+        with self.lock:
+            entry = self.index.get(key)
+            if entry is None or (entry['state'] not in self.FINAL_STATES and time.time() - entry['fetched'] > self.live_ttl):
+                self.misses += 1
+                return None
+        try:
+            with open(self._path(game_id), 'rb') as f:
+                content = gzip.decompress(f.read())
+        except (OSError, EOFError):
+            # The file was removed or truncated underneath us, treat it as a miss
+            with self.lock:
+                self.index.pop(key, None)
+                self.misses += 1
+            return None
+        with self.lock:
+            entry['accessed'] = time.time()
+            self.hits += 1
+            self.bytes_saved += entry['raw_bytes']
+        return content
+
+    def put(self, game_id: int, content: bytes, state: str):
+        """
+        Stores the raw feed bytes for a game along with its codedGameState.
+        """
+        compressed = gzip.compress(content, compresslevel=6)
+        _atomic_write(self._path(game_id), compressed)
+
+        now = time.time()
+        with self.lock:
+            self.index[str(game_id)] = {'state': state,
+                                        'fetched': now,
+                                        'accessed': now,
+                                        'bytes': len(compressed),
+                                        'raw_bytes': len(content)}
+            self._evict()
+            self._changed()
+
+    def stats(self):
+        """
+        Returns a dictionary with the hit rate, bytes saved and current size of the cache.
+        """
+        with self.lock:
+            lookups = self.hits + self.misses
+            return {'hits': self.hits,
+                    'misses': self.misses,
+                    'hit_rate': self.hits / lookups if lookups else 0.0,
+                    'bytes_saved': self.bytes_saved,
+                    'games': len(self.index),
+                    'bytes': sum(entry['bytes'] for entry in self.index.values())}
+
+
+class RateLimiter:
+    """
+    A thread-safe token bucket shared by every request of a session. The rate adapts to the server: it is halved
+    when the API answers 429 or 5xx (at most once per second, so a burst of errors from requests that were already
+    in flight counts once) and climbs back by a twentieth of the maximum rate after every success.
+    """
+
+    def __init__(self, rate: float = 20, burst: int = 10, min_rate: float = 0.5, max_rate: float = None):
+        """
+        Parameters:
+        - rate (float): The starting number of requests per second. Default is 20.
+        - burst (int): The number of requests that can go out back to back. Default is 10.
+        - min_rate (float): The lowest rate the limiter backs off to. Default is 0.5.
+        - max_rate (float): The highest rate the limiter recovers to. Default is the starting rate.
+        """
+        self.rate = rate
+        self.burst = burst
+        self.min_rate = min_rate
+        self.max_rate = max_rate or rate
+        self.tokens = burst
+        self.updated = time.monotonic()
+        self.blocked_until = 0.0
+        self.last_throttled = 0.0
+        self.lock = threading.Lock()
+
+    def acquire(self):
+        """
+        Blocks until a request may be sent.
+        """
+        with self.lock:
+            now = time.monotonic()
+            self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            # Reserve a token even if it is not there yet, the caller sleeps until it would have been refilled
+            self.tokens -= 1
+            delay = max(-self.tokens / self.rate, self.blocked_until - now, 0.0)
+        if delay > 0:
+            time.sleep(delay)
+
+    def throttled(self, retry_after: float = None):
+        """
+        Backs off after a 429 or 5xx response, pausing every request for retry_after seconds when the server asked for it.
+        """
+        with self.lock:
+            now = time.monotonic()
+            if now - self.last_throttled >= 1:
+                self.rate = max(self.min_rate, self.rate / 2)
+                self.last_throttled = now
+            if retry_after:
+                self.blocked_until = max(self.blocked_until, time.monotonic() + retry_after)
+
+    def succeeded(self):
+        # Additive increase, so the rate settles just under what the server tolerates
+        with self.lock:
+            self.rate = min(self.max_rate, self.rate + self.max_rate / 20)
+
+
+class CircuitOpenError(requests.RequestException):
+    """
+    Raised instead of sending a request to an endpoint whose circuit breaker is open.
+    """
+
+
+class CircuitBreaker:
+    """
+    Per-endpoint circuit breakers. After failure_threshold requests to an endpoint fail in a row (after their retries),
+    further requests to it fail fast for reset_timeout seconds, then a single trial request decides whether it closes again.
+    """
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 30):
+        """
+        Parameters:
+        - failure_threshold (int): The number of consecutive failures that opens an endpoint's circuit. Default is 5.
+        - reset_timeout (float): The number of seconds a circuit stays open before a trial request. Default is 30.
+        """
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.failures = {}
+        self.opened = {}
+        self.lock = threading.Lock()
+
+    @staticmethod
+    def endpoint(url: str):
+        # Requests that only differ by ids share a breaker, e.g. /api/v1.1/game/{id}/feed/live
+        return re.sub(r'/\d+', '/{id}', urlparse(url).path)
+
+    def check(self, url: str):
+        """
+        Raises CircuitOpenError if the endpoint of url is open. Once the timeout has passed one caller is let through as the trial.
+        """
+        endpoint = self.endpoint(url)
+        with self.lock:
+            opened = self.opened.get(endpoint)
+            if opened is None:
+                return
+            if time.monotonic() - opened < self.reset_timeout:
+                raise CircuitOpenError(f'Circuit open for {endpoint}, skipping {url}')
+            # Half-open, push the next trial back until this one reports
+            self.opened[endpoint] = time.monotonic()
+
+    def record(self, url: str, success: bool):
+        endpoint = self.endpoint(url)
+        with self.lock:
+            if success:
+                self.failures.pop(endpoint, None)
+                self.opened.pop(endpoint, None)
+                return
+            self.failures[endpoint] = self.failures.get(endpoint, 0) + 1
+            if self.failures[endpoint] >= self.failure_threshold:
+                self.opened[endpoint] = time.monotonic()
+
+
+class ThrottledHTTPAdapter(HTTPAdapter):
+    """
+    A requests transport adapter that sends every request through a shared RateLimiter, retries 429, 5xx and
+    connection errors with jittered exponential backoff (honouring Retry-After), and keeps a CircuitBreaker per endpoint.
+    """
+
+    RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+    def __init__(self, rate_limiter: RateLimiter = None, circuit_breaker: CircuitBreaker = None, max_retries: int = 4,
+                 backoff: float = 0.5, max_backoff: float = 30, **kwargs):
+        """
+        Parameters:
+        - rate_limiter (RateLimiter): The limiter shared by the session. Default is a new RateLimiter.
+        - circuit_breaker (CircuitBreaker): The breakers shared by the session. Default is a new CircuitBreaker.
+        - max_retries (int): The number of retries of a failed request. Default is 4.
+        - backoff (float): The base of the exponential backoff in seconds. Default is 0.5.
+        - max_backoff (float): The longest wait between two tries in seconds. Default is 30.
+        """
+        self.rate_limiter = rate_limiter or RateLimiter()
+        self.circuit_breaker = circuit_breaker or CircuitBreaker()
+        self.retries = max_retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        super().__init__(**kwargs)
+
+    def _retry_after(self, response):
+        # Retry-After in seconds, the HTTP-date form is rare enough for the API to fall back to the backoff
+        value = response.headers.get('Retry-After')
+        try:
+            return min(float(value), self.max_backoff) if value is not None else None
+        except ValueError:
+            return None
+
+    def send(self, request, **kwargs):
+        self.circuit_breaker.check(request.url)
+
+        for attempt in range(self.retries + 1):
+            self.rate_limiter.acquire()
+            try:
+                response = super().send(request, **kwargs)
+            except (requests.ConnectionError, requests.Timeout):
+                if attempt == self.retries:
+                    self.circuit_breaker.record(request.url, success=False)
+                    raise
+                retry_after = None
+            else:
+                if response.status_code not in self.RETRY_STATUSES:
+                    self.rate_limiter.succeeded()
+                    self.circuit_breaker.record(request.url, success=True)
+                    return response
+                retry_after = self._retry_after(response)
+                self.rate_limiter.throttled(retry_after)
+                if attempt == self.retries:
+                    self.circuit_breaker.record(request.url, success=False)
+                    return response
+                # Release the connection back to the pool before waiting
+                response.close()
+
+            # Full jitter keeps the workers from retrying in lockstep
+            time.sleep(retry_after or random.uniform(0, min(self.max_backoff, self.backoff * 2 ** attempt)))
+
+
+class HttpCache(_LRUIndex):
+    """
+    An on-disk store of response bodies and their validators (ETag / Last-Modified), keyed by URL.
+
+    ConditionalHTTPAdapter sends the stored validators with every request, and a 304 Not Modified
+    response is answered from the stored body, so an unchanged resource only costs a header round trip.
+    Game feeds are left to FeedCache.
+    """
+
+    # URLs that are never stored here
+    SKIP_PATTERNS = ('/feed/live',)
+
+    def __init__(self, cache_dir: str, max_bytes: int = 256 * 1024 ** 2):
+        """
+        Parameters:
+        - cache_dir (str): The directory the bodies and the index are stored in.
+        - max_bytes (int): The maximum compressed size of the stored bodies before LRU eviction. Default is 256 MB.
+        """
+        super().__init__(cache_dir, max_bytes)
+        self.revalidated = 0
+        self.downloaded = 0
+        self.bytes_saved = 0
+
+    def _key(self, url):
+        return hashlib.sha1(url.encode()).hexdigest()
+
+    def _path(self, key):
+        return os.path.join(self.cache_dir, f'{key}.gz')
+
+    def should_cache(self, url: str):
+        return not any(pattern in url for pattern in self.SKIP_PATTERNS)
+
+    def validators(self, url: str):
+        """
+        Returns the conditional request headers for a URL, or an empty dictionary if nothing usable is stored.
+        """
+        key = self._key(url)
+        with self.lock:
+            entry = self.index.get(key)
+        if entry is None or not os.path.exists(self._path(key)):
+            return {}
+        headers = {}
+        if entry.get('etag'):
+            headers['If-None-Match'] = entry['etag']
+        if entry.get('last_modified'):
+            headers['If-Modified-Since'] = entry['last_modified']
+        return headers
+
+    def get(self, url: str):
+        """
+        Returns the stored body for a URL after a 304 response, or None if it is gone.
+        """
+        key = self._key(url)
+        try:
+            with open(self._path(key), 'rb') as f:
+                content = gzip.decompress(f.read())
+        except (OSError, EOFError):
+            with self.lock:
+                self.index.pop(key, None)
+            return None
+        with self.lock:
+            entry = self.index.get(key)
+            if entry is not None:
+                entry['accessed'] = time.time()
+            self.revalidated += 1
+            self.bytes_saved += len(content)
+        return content
+
+    def put(self, url: str, content: bytes, etag: str = None, last_modified: str = None):
+        """
+        Stores a full response body with its validators. Responses without validators are only counted.
+        """
+        with self.lock:
+            self.downloaded += 1
+        if not etag and not last_modified:
+            return
+        key = self._key(url)
+        compressed = gzip.compress(content, compresslevel=6)
+        _atomic_write(self._path(key), compressed)
+
+        with self.lock:
+            self.index[key] = {'url': url,
+                               'etag': etag,
+                               'last_modified': last_modified,
+                               'accessed': time.time(),
+                               'bytes': len(compressed)}
+            self._evict()
+            self._save_index()
+
+    def stats(self):
+        """
+        Returns a dictionary with the number of revalidated and downloaded responses and the bytes saved by 304 responses.
+        """
+        with self.lock:
+            requests_made = self.revalidated + self.downloaded
+            return {'revalidated': self.revalidated,
+                    'downloaded': self.downloaded,
+                    'revalidated_rate': self.revalidated / requests_made if requests_made else 0.0,
+                    'bytes_saved': self.bytes_saved,
+                    'entries': len(self.index),
+                    'bytes': sum(entry['bytes'] for entry in self.index.values())}
+
+
+class ConditionalHTTPAdapter(ThrottledHTTPAdapter):
+    """
+    A ThrottledHTTPAdapter that also turns every cacheable GET into a conditional request against an HttpCache.
+    Callers see an ordinary 200 response either way, with the stored body filled in on a 304.
+    """
+
+    def __init__(self, http_cache: HttpCache, **kwargs):
+        self.http_cache = http_cache
+        super().__init__(**kwargs)
+
+    def send(self, request, **kwargs):
+        if request.method != 'GET' or not self.http_cache.should_cache(request.url):
+            return super().send(request, **kwargs)
+
+        request.headers.update(self.http_cache.validators(request.url))
+        response = super().send(request, **kwargs)
+
+        if response.status_code == 304:
+            content = self.http_cache.get(request.url)
+            if content is None:
+                # The stored body disappeared after the validators were sent, ask again without them
+                request.headers.pop('If-None-Match', None)
+                request.headers.pop('If-Modified-Since', None)
+                return self.send(request, **kwargs)
+            response.status_code = 200
+            response.reason = 'OK'
+            response._content = content
+            response._content_consumed = True
+            # The stored body is already decoded
+            response.headers.pop('Content-Encoding', None)
+            response.headers['Content-Length'] = str(len(content))
+        elif response.status_code == 200:
+            self.http_cache.put(request.url, response.content, response.headers.get('ETag'), response.headers.get('Last-Modified'))
+        return response
+
+
+class FixtureArchive(_LRUIndex):
+    """
+    A directory of recorded HTTP responses (status, headers and gzip-compressed body), keyed by method and URL.
+
+    RecordingHTTPAdapter fills it from live traffic, and ReplayHTTPAdapter or FixtureServer serve it back,
+    so a whole scrape can be rerun offline and timed against identical data.
+    """
+
+    # Headers that describe the wire encoding of the recorded response, the stored body is already decoded
+    DROP_HEADERS = ('Content-Encoding', 'Transfer-Encoding', 'Content-Length', 'Connection', 'Keep-Alive')
+
+    def __init__(self, archive_dir: str):
+        """
+        Parameters:
+        - archive_dir (str): The directory the bodies and the index are stored in.
+        """
+        # Recordings are never evicted
+        super().__init__(archive_dir)
+        self.archive_dir = archive_dir
+        self.recorded = 0
+        self.served = 0
+        self.missing = 0
+
+    def _key(self, method, url):
+        return hashlib.sha1(f'{method} {url}'.encode()).hexdigest()
+
+    def _path(self, key):
+        return os.path.join(self.archive_dir, f'{key}.gz')
+
+    def put(self, method: str, url: str, status: int, headers: dict, content: bytes):
+        """
+        Stores one response, replacing any earlier recording of the same request.
+        """
+        key = self._key(method, url)
+        _atomic_write(self._path(key), gzip.compress(content, compresslevel=6))
+
+        with self.lock:
+            self.index[key] = {'method': method,
+                               'url': url,
+                               'status': status,
+                               'headers': {k: v for k, v in headers.items() if k not in self.DROP_HEADERS},
+                               'bytes': len(content),
+                               'recorded': time.time()}
+            self.recorded += 1
+            self._save_index()
+
+    def get(self, method: str, url: str):
+        """
+        Returns the recorded response of a request as a dictionary (status, headers, content), or None if it was never recorded.
+        """
+        key = self._key(method, url)
+        with self.lock:
+            entry = self.index.get(key)
+        try:
+            if entry is None:
+                raise FileNotFoundError(url)
+            with open(self._path(key), 'rb') as f:
+                content = gzip.decompress(f.read())
+        except (OSError, EOFError):
+            with self.lock:
+                self.missing += 1
+            return None
+        with self.lock:
+            self.served += 1
+        return {'status': entry['status'], 'headers': entry['headers'], 'content': content}
+
+    def stats(self):
+        """
+        Returns a dictionary with the number of responses recorded, served and missing, and the size of the archive.
+        """
+        with self.lock:
+            return {'recorded': self.recorded,
+                    'served': self.served,
+                    'missing': self.missing,
+                    'entries': len(self.index),
+                    'bytes': sum(entry['bytes'] for entry in self.index.values())}
+
+
+class FixtureMissingError(requests.ConnectionError):
+    """
+    Raised in replay mode for a request that is not in the fixture archive.
+    """
+
+
+def _fixture_response(request, status: int, headers: dict, content: bytes):
+    # Builds the requests Response a live adapter would have returned
+    response = requests.Response()
+    response.status_code = status
+    response.headers = requests.structures.CaseInsensitiveDict(headers)
+    response.headers['Content-Length'] = str(len(content))
+    response._content = content
+    response._content_consumed = True
+    response.encoding = requests.utils.get_encoding_from_headers(response.headers)
+    response.reason = 'OK' if status == 200 else 'Fixture'
+    response.url = request.url
+    response.request = request
+    return response
+
+
+class RecordingHTTPAdapter(BaseAdapter):
+    """
+    Wraps the adapter a session would use and stores every response it returns in a FixtureArchive.
+    """
+
+    def __init__(self, archive: FixtureArchive, adapter: BaseAdapter = None):
+        """
+        Parameters:
+        - archive (FixtureArchive): The archive the responses are written to.
+        - adapter (BaseAdapter): The adapter that sends the requests. Default is a new ThrottledHTTPAdapter.
+        """
+        super().__init__()
+        self.archive = archive
+        self.adapter = adapter or ThrottledHTTPAdapter()
+
+    def send(self, request, **kwargs):
+        # Keyed by the URL as the caller built it, in case the wrapped adapter rewrites it
+        url = request.url
+        response = self.adapter.send(request, **kwargs)
+        self.archive.put(request.method, url, response.status_code, dict(response.headers), response.content)
+        return response
+
+    def close(self):
+        self.adapter.close()
+
+
+class ReplayHTTPAdapter(BaseAdapter):
+    """
+    Answers every request from a FixtureArchive without touching the network, after an optional simulated latency.
+    Requests that were never recorded raise FixtureMissingError.
+    """
+
+    def __init__(self, archive: FixtureArchive, latency: float = 0):
+        """
+        Parameters:
+        - archive (FixtureArchive): The archive the responses are read from.
+        - latency (float): The number of seconds each response is delayed, to mimic the round trip to the real server. Default is 0.
+        """
+        super().__init__()
+        self.archive = archive
+        self.latency = latency
+
+    def send(self, request, **kwargs):
+        if self.latency:
+            time.sleep(self.latency)
+        entry = self.archive.get(request.method, request.url)
+        if entry is None:
+            raise FixtureMissingError(f'{request.method} {request.url} is not in the fixture archive {self.archive.archive_dir}', request=request)
+        return _fixture_response(request, entry['status'], entry['headers'], entry['content'])
+
+    def close(self):
+        pass
+
+
+class StandInHTTPAdapter(HTTPAdapter):
+    """
+    Sends every request to a FixtureServer instead of its real host. https://statsapi.mlb.com/api/v1/sports becomes
+    <server_url>/https/statsapi.mlb.com/api/v1/sports, so the request still goes over a local socket.
+    """
+
+    def __init__(self, server_url: str, **kwargs):
+        self.server_url = server_url.rstrip('/')
+        super().__init__(**kwargs)
+
+    def send(self, request, **kwargs):
+        url = urlparse(request.url)
+        request.url = f'{self.server_url}/{url.scheme}/{url.netloc}{url.path}' + (f'?{url.query}' if url.query else '')
+        request.headers.pop('Host', None)
+        return super().send(request, **kwargs)
+
+
+class FixtureServer:
+    """
+    A local HTTP stand-in for the recorded hosts, serving a FixtureArchive at /<scheme>/<host>/<path>?<query>
+    (see StandInHTTPAdapter). Requests are handled on their own threads, so it can be load tested with many workers.
+    """
+
+    def __init__(self, archive: FixtureArchive, host: str = '127.0.0.1', port: int = 0, latency: float = 0):
+        """
+        Parameters:
+        - archive (FixtureArchive): The archive to serve.
+        - host (str): The interface to listen on. Default is 127.0.0.1.
+        - port (int): The port to listen on. Default is 0 (any free port, see url).
+        - latency (float): The number of seconds each response is delayed. Default is 0.
+        """
+        from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(handler):
+                scheme, _, rest = handler.path.lstrip('/').partition('/')
+                if latency:
+                    time.sleep(latency)
+                entry = archive.get('GET', f'{scheme}://{rest}')
+                if entry is None:
+                    handler.send_error(404, 'Not in the fixture archive')
+                    return
+                handler.send_response(entry['status'])
+                for name, value in entry['headers'].items():
+                    handler.send_header(name, value)
+                handler.send_header('Content-Length', str(len(entry['content'])))
+                handler.end_headers()
+                handler.wfile.write(entry['content'])
+
+            def log_message(handler, *args):
+                pass
+
+        Handler.protocol_version = 'HTTP/1.1'
+        self.archive = archive
+        self.httpd = ThreadingHTTPServer((host, port), Handler)
+        self.httpd.daemon_threads = True
+        self.thread = None
+
+    @property
+    def url(self):
+        host, port = self.httpd.server_address[:2]
+        return f'http://{host}:{port}'
+
+    def start(self):
+        """
+        Serves the archive on a background thread and returns the server.
+        """
+        self.thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        self.thread.start()
+        return self
+
+    def stop(self):
+        """
+        Stops serving and closes the socket.
+        """
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+
+def install_fixtures(session: requests.Session, fixture_dir: str = None, mode: str = None, latency: float = 0, server_url: str = None,
+                     pool_size: int = 10):
+    """
+    Mounts fixture recording or replay on a requests session, for every http and https URL.
+
+    Parameters:
+    - session (requests.Session): The session to change.
+    - fixture_dir (str): The fixture archive directory. Default is FIXTURE_DIR (the MLB_SCRAPE_FIXTURES environment variable).
+    - mode (str): 'record' to send requests and archive the responses, or 'replay' to answer them from the archive.
+      Default is FIXTURE_MODE (the MLB_SCRAPE_FIXTURE_MODE environment variable, 'replay' when unset).
+    - latency (float): In replay mode, the number of seconds each response is delayed. Default is 0.
+    - server_url (str): In replay mode, send the requests to a running FixtureServer instead of reading the archive in process.
+      Default is FIXTURE_SERVER (the MLB_SCRAPE_FIXTURE_SERVER environment variable).
+    - pool_size (int): The number of pooled connections to the FixtureServer. Default is 10.
+
+    Returns:
+    - archive (FixtureArchive): The archive in use, or None if neither a fixture directory nor a server is set.
+    """
+    fixture_dir = fixture_dir or FIXTURE_DIR
+    mode = mode or FIXTURE_MODE
+    server_url = server_url or FIXTURE_SERVER
+    if mode not in ('record', 'replay'):
+        raise ValueError("mode must be 'record' or 'replay'.")
+    if mode == 'replay' and server_url:
+        adapter = StandInHTTPAdapter(server_url, pool_connections=pool_size, pool_maxsize=pool_size)
+        archive = None
+    elif fixture_dir:
+        archive = FixtureArchive(fixture_dir)
+        if mode == 'record':
+            adapter = RecordingHTTPAdapter(archive, session.get_adapter('https://'))
+        else:
+            adapter = ReplayHTTPAdapter(archive, latency)
+    else:
+        return None
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return archive
+
+
+class ReferenceRegistry:
+    """
+    The reference lists of the Stats API (sports, leagues, teams and the players of a sport and season), downloaded once per process
+    and shared by every MLB_Scrape through reference_registry.
+
+    Each list is kept on disk as JSON and downloaded again once it is older than max_age, except the players of past seasons,
+    which do not change any more. Lookups by id go through dictionaries built in one pass over each list.
+    """
+
+    # The endpoint and the response field of every list, player lists are keyed players_{sport_id}_{season}
+    ENDPOINTS = {
+        'sports': ('https://statsapi.mlb.com/api/v1/sports', 'sports'),
+        'leagues': ('https://statsapi.mlb.com/api/v1/leagues/', 'leagues'),
+        'teams': ('https://statsapi.mlb.com/api/v1/teams/', 'teams'),
+    }
+
+    def __init__(self, cache_dir: str = None, max_age: float = 24 * 3600):
+        """
+        Parameters:
+        - cache_dir (str): The cache directory of MLB_Scrape, the lists are stored in its reference folder. Default is None (memory only).
+        - max_age (float): The number of seconds a stored list is used before it is downloaded again. Default is one day.
+        """
+        self.cache_dir = os.path.join(cache_dir, 'reference') if cache_dir else None
+        self.max_age = max_age
+        if self.cache_dir:
+            os.makedirs(self.cache_dir, exist_ok=True)
+
+        self.lock = threading.RLock()
+        self.records = {}
+        self.indexes = {}
+        self.downloads = 0
+        self.disk_loads = 0
+        self._scraper = None
+
+    def _session(self):
+        # The lists are downloaded through a throttled (and, with a cache directory, conditional) MLB_Scrape session of our own
+        if self._scraper is None:
+            self._scraper = MLB_Scrape(max_workers=1, cache_dir=os.path.dirname(self.cache_dir) if self.cache_dir else None)
+        return self._scraper.session
+
+    def _path(self, key):
+        return os.path.join(self.cache_dir, f'{key}.json')
+
+    def _expires(self, key):
+        # Player lists of a finished season never change, everything else is refreshed after max_age
+        if key.startswith('players_') and int(key.rsplit('_', 1)[1]) < datetime.now().year:
+            return False
+        return True
 
-    def __init__(self):
-        # Initialize your class here if needed
+    def _load(self, key, url, field):
+        """
+        Returns the records of a list, from memory, from disk while it is fresh, or from the API.
+        """
+        with self.lock:
+            if key in self.records:
+                return self.records[key]
+
+            if self.cache_dir and os.path.exists(self._path(key)):
+                with open(self._path(key)) as f:
+                    stored = json.load(f)
+                if not self._expires(key) or time.time() - stored['fetched'] <= self.max_age:
+                    self.records[key] = stored['records']
+                    self.disk_loads += 1
+                    return self.records[key]
+
+            records = self._session().get(url=url).json().get(field, [])
+            self.downloads += 1
+            self.records[key] = records
+            if self.cache_dir:
+                _atomic_write(self._path(key), json.dumps({'fetched': time.time(), 'url': url, 'records': records}))
+            return records
+
+    def _index(self, key, records):
+        # id -> record, built once per list
+        with self.lock:
+            if key not in self.indexes:
+                self.indexes[key] = {x['id']: x for x in records if 'id' in x}
+            return self.indexes[key]
+
+    def refresh(self, key: str = None):
+        """
+        Forgets a list (or every list when key is None) so the next lookup reloads it from the API.
+        """
+        with self.lock:
+            if key is not None:
+                keys = [key]
+            else:
+                keys = set(self.records)
+                if self.cache_dir:
+                    keys |= {name[:-5] for name in os.listdir(self.cache_dir) if name.endswith('.json')}
+            for name in keys:
+                self.records.pop(name, None)
+                self.indexes.pop(name, None)
+                if self.cache_dir and os.path.exists(self._path(name)):
+                    os.remove(self._path(name))
+
+    def sports(self):
+        """
+        Returns the records of the sports endpoint.
+        """
+        return self._load('sports', *self.ENDPOINTS['sports'])
+
+    def leagues(self):
+        """
+        Returns the records of the leagues endpoint.
+        """
+        return self._load('leagues', *self.ENDPOINTS['leagues'])
+
+    def teams(self):
+        """
+        Returns the records of the teams endpoint.
+        """
+        return self._load('teams', *self.ENDPOINTS['teams'])
+
+    def players(self, sport_id: int = 1, season: int = None):
+        """
+        Returns the player records of a sport and season. Default season is the current year.
+        """
+        season = season or datetime.now().year
+        return self._load(f'players_{sport_id}_{season}', f'https://statsapi.mlb.com/api/v1/sports/{sport_id}/players?season={season}', 'people')
+
+    def has_sport(self, sport_id: int):
+        """
+        Returns True if the sport id is in the sports list.
+        """
+        return sport_id in self._index('sports', self.sports())
+
+    def team(self, team_id: int):
+        """
+        Returns the team record of a team id, or None.
+        """
+        return self._index('teams', self.teams()).get(team_id)
+
+    def team_abbreviation(self, team_id: int):
+        """
+        Returns the abbreviation of a team id, or None.
+        """
+        with self.lock:
+            if 'team_abbreviations' not in self.indexes:
+                self.indexes['team_abbreviations'] = {x['id']: x.get('abbreviation') for x in self.teams() if 'id' in x}
+            return self.indexes['team_abbreviations'].get(team_id)
+
+    def league(self, league_id: int):
+        """
+        Returns the league record of a league id, or None.
+        """
+        return self._index('leagues', self.leagues()).get(league_id)
+
+    def player(self, player_id: int, sport_id: int = 1, season: int = None):
+        """
+        Returns the record (name, position, team, height, weight, age, birth date, ...) of a player in a sport and season, or None.
+        """
+        season = season or datetime.now().year
+        key = f'players_{sport_id}_{season}'
+        return self._index(key, self.players(sport_id, season)).get(player_id)
+
+    def stats(self):
+        """
+        Returns a dictionary with the number of lists downloaded and read from disk, and the lists held in memory.
+        """
+        with self.lock:
+            return {'downloads': self.downloads,
+                    'disk_loads': self.disk_loads,
+                    'lists': sorted(self.records)}
+
+
+@lru_cache(maxsize=None)
+def reference_registry(cache_dir: str = None, max_age: float = 24 * 3600):
+    """
+    Returns the process-wide ReferenceRegistry for a cache directory, so every MLB_Scrape in the process shares one copy of each list.
+
+    Parameters:
+    - cache_dir (str): The cache directory the lists are stored under. Default is None (memory only).
+    - max_age (float): The number of seconds a stored list is used before it is downloaded again. Default is one day.
+
+    Returns:
+    - registry (ReferenceRegistry): The shared registry.
+    """
+    return ReferenceRegistry(cache_dir, max_age)
+
+
+# Column names and dtypes of the pitch-level frame built by get_data_df, shared by every parsing engine
+PITCH_SCHEMA = {
+    'game_id': pl.Int64,
+    'game_date': pl.String,
+    'batter_id': pl.Int64,
+    'batter_name': pl.String,
+    'batter_hand': pl.String,
+    'batter_team': pl.String,
+    'batter_team_id': pl.Int64,
+    'pitcher_id': pl.Int64,
+    'pitcher_name': pl.String,
+    'pitcher_hand': pl.String,
+    'pitcher_team': pl.String,
+    'pitcher_team_id': pl.Int64,
+    'ab_number': pl.Int64,
+    'play_description': pl.String,
+    'play_code': pl.String,
+    'in_play': pl.Boolean,
+    'is_strike': pl.Boolean,
+    'is_swing': pl.Boolean,
+    'is_whiff': pl.Boolean,
+    'is_out': pl.Boolean,
+    'is_ball': pl.Boolean,
+    'is_review': pl.Boolean,
+    'pitch_type': pl.String,
+    'pitch_description': pl.String,
+    'strikes': pl.Int64,
+    'balls': pl.Int64,
+    'outs': pl.Int64,
+    'strikes_after': pl.Int64,
+    'balls_after': pl.Int64,
+    'outs_after': pl.Int64,
+    'start_speed': pl.Float64,
+    'end_speed': pl.Float64,
+    'sz_top': pl.Float64,
+    'sz_bot': pl.Float64,
+    'x': pl.Float64,
+    'y': pl.Float64,
+    'ax': pl.Float64,
+    'ay': pl.Float64,
+    'az': pl.Float64,
+    'pfxx': pl.Float64,
+    'pfxz': pl.Float64,
+    'px': pl.Float64,
+    'pz': pl.Float64,
+    'vx0': pl.Float64,
+    'vy0': pl.Float64,
+    'vz0': pl.Float64,
+    'x0': pl.Float64,
+    'y0': pl.Float64,
+    'z0': pl.Float64,
+    'zone': pl.Int64,
+    'type_confidence': pl.Float64,
+    'plate_time': pl.Float64,
+    'extension': pl.Float64,
+    'spin_rate': pl.Float64,
+    'spin_direction': pl.Float64,
+    'vb': pl.Float64,
+    'ivb': pl.Float64,
+    'hb': pl.Float64,
+    'launch_speed': pl.Float64,
+    'launch_angle': pl.Float64,
+    'launch_distance': pl.Float64,
+    'launch_location': pl.String,
+    'trajectory': pl.String,
+    'hardness': pl.String,
+    'hit_x': pl.Float64,
+    'hit_y': pl.Float64,
+    'index_play': pl.Int64,
+    'play_id': pl.String,
+    'start_time': pl.String,
+    'end_time': pl.String,
+    'is_pitch': pl.Boolean,
+    'type_type': pl.String,
+    'type_ab': pl.String,
+    'event': pl.String,
+    'event_type': pl.String,
+    'rbi': pl.Int64,
+    'away_score': pl.Int64,
+    'home_score': pl.Int64,
+}
+
+# PITCH_SCHEMA columns grouped by the part of the feed they are read from, so a projection only walks the groups it needs
+PITCH_COLUMN_GROUPS = {
+    'game': ['game_id', 'game_date'],
+    'matchup': ['batter_id', 'batter_name', 'batter_hand', 'pitcher_id', 'pitcher_name', 'pitcher_hand'],
+    'teams': ['batter_team', 'batter_team_id', 'pitcher_team', 'pitcher_team_id'],
+    'details': ['play_description', 'play_code', 'in_play', 'is_strike', 'is_swing', 'is_whiff', 'is_ball', 'is_review', 'pitch_type', 'pitch_description'],
+    'count': ['strikes', 'balls', 'outs', 'strikes_after', 'balls_after', 'outs_after'],
+    'pitch_data': ['start_speed', 'end_speed', 'sz_top', 'sz_bot', 'x', 'y', 'ax', 'ay', 'az', 'pfxx', 'pfxz', 'px', 'pz',
+                   'vx0', 'vy0', 'vz0', 'x0', 'y0', 'z0', 'zone', 'type_confidence', 'plate_time', 'extension',
+                   'spin_rate', 'spin_direction', 'vb', 'ivb', 'hb'],
+    'hit_data': ['launch_speed', 'launch_angle', 'launch_distance', 'launch_location', 'trajectory', 'hardness', 'hit_x', 'hit_y'],
+    'event': ['ab_number', 'index_play', 'play_id', 'start_time', 'end_time', 'is_pitch', 'type_type'],
+    'result': ['type_ab', 'event', 'event_type', 'rbi', 'away_score', 'home_score', 'is_out'],
+}
+
+
+def _column_projection(columns: list = None):
+    """
+    Resolves a column projection into the output column list and the PITCH_COLUMN_GROUPS that have to be parsed.
+
+    Parameters:
+    - columns (list): PITCH_SCHEMA column names to keep, in PITCH_SCHEMA order. None keeps every column.
+
+    Returns:
+    - tuple: (list of output columns, dict of group name -> bool)
+    """
+    if columns is None:
+        return list(PITCH_SCHEMA), {group: True for group in PITCH_COLUMN_GROUPS}
+    unknown = [c for c in columns if c not in PITCH_SCHEMA]
+    if unknown:
+        raise ValueError(f"Unknown column(s) {unknown}. Columns must be taken from PITCH_SCHEMA.")
+    # Keeping the PITCH_SCHEMA order so projected frames line up with the full frame
+    wanted = set(columns)
+    keep = [c for c in PITCH_SCHEMA if c in wanted]
+    want = {group: any(c in wanted for c in cols) for group, cols in PITCH_COLUMN_GROUPS.items()}
+    return keep, want
+
+
+# Memory-compact dtypes for PITCH_SCHEMA columns. Repeated strings become categoricals (handedness is a fixed Enum),
+# counts and small indexes become 8/16-bit integers, and MLB ids fit in 32 bits. Columns not listed keep their PITCH_SCHEMA dtype
+_HAND_ENUM = pl.Enum(['L', 'R', 'S'])
+COMPACT_PITCH_DTYPES = {
+    'game_id': pl.Int32,
+    'game_date': pl.Categorical,
+    'batter_id': pl.Int32,
+    'batter_name': pl.Categorical,
+    'batter_hand': _HAND_ENUM,
+    'batter_team': pl.Categorical,
+    'batter_team_id': pl.Int32,
+    'pitcher_id': pl.Int32,
+    'pitcher_name': pl.Categorical,
+    'pitcher_hand': _HAND_ENUM,
+    'pitcher_team': pl.Categorical,
+    'pitcher_team_id': pl.Int32,
+    'ab_number': pl.Int16,
+    'play_description': pl.Categorical,
+    'play_code': pl.Categorical,
+    'pitch_type': pl.Categorical,
+    'pitch_description': pl.Categorical,
+    'strikes': pl.Int8,
+    'balls': pl.Int8,
+    'outs': pl.Int8,
+    'strikes_after': pl.Int8,
+    'balls_after': pl.Int8,
+    'outs_after': pl.Int8,
+    'zone': pl.Int8,
+    'launch_location': pl.Categorical,
+    'trajectory': pl.Categorical,
+    'hardness': pl.Categorical,
+    'index_play': pl.Int16,
+    'type_type': pl.Categorical,
+    'type_ab': pl.Categorical,
+    'event': pl.Categorical,
+    'event_type': pl.Categorical,
+    'rbi': pl.Int8,
+    'away_score': pl.Int16,
+    'home_score': pl.Int16,
+}
+
+# The measured tracking columns that can be stored as Float32, which keeps ~7 significant digits and is plenty for every one of them
+TRACKING_COLUMNS = [c for c in PITCH_COLUMN_GROUPS['pitch_data'] + PITCH_COLUMN_GROUPS['hit_data'] if PITCH_SCHEMA[c] == pl.Float64]
+
+
+def compact_pitch_schema(float32: bool = False):
+    """
+    Returns PITCH_SCHEMA with the memory-compact dtypes of COMPACT_PITCH_DTYPES.
+
+    Parameters:
+    - float32 (bool): Also store the tracking columns (TRACKING_COLUMNS) as Float32. Default is False.
+
+    Returns:
+    - schema (dict): Column name -> dtype for every PITCH_SCHEMA column.
+    """
+    schema = {name: COMPACT_PITCH_DTYPES.get(name, dtype) for name, dtype in PITCH_SCHEMA.items()}
+    if float32:
+        schema.update({name: pl.Float32 for name in TRACKING_COLUMNS})
+    return schema
+
+
+def compact_pitch_frame(df, float32: bool = False):
+    """
+    Casts a pitch frame (or a projection of one) to the memory-compact dtypes. Columns that are not in PITCH_SCHEMA are left alone.
+
+    Parameters:
+    - df (pl.DataFrame or pl.LazyFrame): A frame with PITCH_SCHEMA columns.
+    - float32 (bool): Also store the tracking columns as Float32. Default is False.
+
+    Returns:
+    - df (pl.DataFrame or pl.LazyFrame): The same frame with compact dtypes.
+    """
+    schema = compact_pitch_schema(float32)
+    names = df.collect_schema().names() if isinstance(df, pl.LazyFrame) else df.columns
+    return df.cast({name: schema[name] for name in names if name in schema})
+
+
+def _column_bytes(series: pl.Series):
+    # estimated_size only counts the characters of a String column. Every row also holds a 16-byte view,
+    # and strings of up to 12 bytes live inside that view rather than in a separate buffer
+    if series.dtype != pl.String:
+        return series.estimated_size()
+    lengths = series.str.len_bytes()
+    return 16 * series.len() + int(lengths.filter(lengths > 12).sum() or 0) + (series.len() + 7) // 8 * series.has_nulls()
+
+
+def pitch_memory_report(df: pl.DataFrame, float32: bool = False):
+    """
+    Measures the bytes per pitch of every column of a PITCH_SCHEMA frame, as built and after compact_pitch_frame.
+
+    Parameters:
+    - df (pl.DataFrame): A frame with PITCH_SCHEMA columns, in the default dtypes.
+    - float32 (bool): Measure the compact frame with Float32 tracking columns. Default is False.
+
+    Returns:
+    - report (pl.DataFrame): One row per column plus a 'total' row, with the dtype and bytes per pitch before and after, sorted by
+      the bytes saved.
+    """
+    compact_df = compact_pitch_frame(df, float32)
+    rows = max(df.height, 1)
+    report = pl.DataFrame({
+        'column': df.columns,
+        'dtype': [str(dtype) for dtype in df.dtypes],
+        'bytes_per_pitch': [_column_bytes(df[name]) / rows for name in df.columns],
+        'compact_dtype': [str(dtype) for dtype in compact_df.dtypes],
+        'compact_bytes_per_pitch': [_column_bytes(compact_df[name]) / rows for name in compact_df.columns],
+    }).sort(pl.col('bytes_per_pitch') - pl.col('compact_bytes_per_pitch'), descending=True)
+    total = pl.DataFrame({
+        'column': ['total'],
+        'dtype': [None],
+        'bytes_per_pitch': [report['bytes_per_pitch'].sum()],
+        'compact_dtype': [None],
+        'compact_bytes_per_pitch': [report['compact_bytes_per_pitch'].sum()],
+    }, schema=report.schema)
+    return pl.concat([report, total]).with_columns(
+        (pl.col('bytes_per_pitch') / pl.col('compact_bytes_per_pitch')).round(2).alias('ratio'))
+
+
+# The columns of the normalized pitch tables built by normalize_pitch_frame. Tables are linked by game_id, pa_key and pitch_key
+PITCH_TABLES = {
+    'games': ['game_id', 'game_date', 'away_team', 'away_team_id', 'home_team', 'home_team_id'],
+    'plate_appearances': ['pa_key', 'game_id', 'ab_number', 'is_top', 'batter_id', 'batter_name', 'batter_hand',
+                          'pitcher_id', 'pitcher_name', 'pitcher_hand', 'type_ab', 'event', 'event_type', 'rbi',
+                          'away_score', 'home_score', 'is_out'],
+    'pitches': ['pitch_key', 'pa_key', 'is_main', 'has_result', 'has_event']
+               + PITCH_COLUMN_GROUPS['details'] + PITCH_COLUMN_GROUPS['count'] + PITCH_COLUMN_GROUPS['pitch_data']
+               + ['index_play', 'play_id', 'start_time', 'end_time', 'is_pitch', 'type_type'],
+    'batted_balls': ['pitch_key', 'pa_key'] + PITCH_COLUMN_GROUPS['hit_data'],
+}
+
+# The plate appearance result columns, which get_data_df only fills on the last pitch of the plate appearance
+_PA_RESULT_COLUMNS = ['type_ab', 'rbi', 'away_score', 'home_score', 'is_out']
+
+
+def normalize_pitch_frame(df: pl.DataFrame):
+    """
+    Splits a get_data_df frame into games, plate appearances, pitches and batted balls, so game and at-bat fields are
+    stored once instead of on every pitch and the (mostly null) hitData columns only exist for balls in play.
+    join_pitch_tables rebuilds the exact wide frame.
+
+    The pitches table keeps three flags for where the wide frame shows plate appearance fields: is_main (a pitch or
+    called event rather than a non-pitch ball four), has_result (the row carrying type_ab, rbi, scores and is_out)
+    and has_event (the rows carrying event and event_type).
+
+    Parameters:
+    - df (pl.DataFrame): A frame with every PITCH_SCHEMA column, with whole games in the order get_data_df builds them.
+      Away and home are taken from the batting and pitching team of the first row of each game.
+
+    Returns:
+    - tables (dict): {'games', 'plate_appearances', 'pitches', 'batted_balls'} -> pl.DataFrame, with the columns of PITCH_TABLES.
+    """
+    missing = [c for c in PITCH_SCHEMA if c not in df.columns]
+    if missing:
+        raise ValueError(f"normalize_pitch_frame needs every PITCH_SCHEMA column, missing {missing}.")
+
+    # A plate appearance is a run of rows with the same game, batter and pitcher. Non-pitch walk rows have no ab_number,
+    # so it is carried forward from the pitches before them, and a walk with no pitches still starts a new run on its new batter
+    df = (df
+          .with_row_index('pitch_key')
+          .with_columns(pl.col('ab_number').is_not_null().alias('is_main'),
+                        pl.any_horizontal([pl.col(c).is_not_null() for c in _PA_RESULT_COLUMNS]).alias('has_result'),
+                        (pl.col('event').is_not_null() | pl.col('event_type').is_not_null()).alias('has_event'))
+          .with_columns(pl.struct('game_id', 'batter_id', 'pitcher_id', pl.col('ab_number').forward_fill().over('game_id'))
+                        .rle_id().alias('pa_key')))
+
+    games = (df
+             .group_by('game_id', maintain_order=True)
+             .agg(pl.col('game_date').first(),
+                  pl.col('batter_team').first().alias('away_team'),
+                  pl.col('batter_team_id').first().alias('away_team_id'),
+                  pl.col('pitcher_team').first().alias('home_team'),
+                  # A main row pitched to the away team holds the home id, the batting team id of any other row is the fallback
+                  pl.col('pitcher_team_id').filter(pl.col('is_main') & (pl.col('batter_team_id') == pl.col('batter_team_id').first()))
+                  .first().alias('_home_pitching'),
+                  pl.col('batter_team_id').filter(pl.col('batter_team_id') != pl.col('batter_team_id').first())
+                  .first().alias('_home_batting'))
+             .with_columns(pl.coalesce('_home_pitching', '_home_batting').alias('home_team_id'))
+             .select(PITCH_TABLES['games']))
+
+    plate_appearances = (df
+                         .join(games.select('game_id', 'away_team', 'away_team_id'), on='game_id', how='left', maintain_order='left')
+                         .group_by('pa_key', maintain_order=True)
+                         .agg(pl.col('game_id').first(),
+                              pl.col('ab_number').drop_nulls().first(),
+                              pl.coalesce(pl.col('batter_team_id') == pl.col('away_team_id'),
+                                          pl.col('batter_team') == pl.col('away_team')).first().alias('is_top'),
+                              pl.col(['batter_id', 'batter_name', 'batter_hand', 'pitcher_id', 'pitcher_name', 'pitcher_hand']).first(),
+                              pl.col(_PA_RESULT_COLUMNS[:1]).filter(pl.col('has_result')).first(),
+                              pl.col(['event', 'event_type']).filter(pl.col('has_event')).first(),
+                              pl.col(_PA_RESULT_COLUMNS[1:]).filter(pl.col('has_result')).first())
+                         .select(PITCH_TABLES['plate_appearances']))
+
+    hit_columns = PITCH_COLUMN_GROUPS['hit_data']
+    batted_balls = (df
+                    .filter(pl.any_horizontal([pl.col(c).is_not_null() for c in hit_columns]))
+                    .select(PITCH_TABLES['batted_balls']))
+
+    return {'games': games,
+            'plate_appearances': plate_appearances,
+            'pitches': df.select(PITCH_TABLES['pitches']),
+            'batted_balls': batted_balls}
+
+
+def join_pitch_tables(tables: dict, columns: list = None):
+    """
+    Rebuilds the wide get_data_df frame from the tables of normalize_pitch_frame.
+
+    Parameters:
+    - tables (dict): The tables returned by normalize_pitch_frame.
+    - columns (list): The PITCH_SCHEMA columns to rebuild. Default is None (every column).
+
+    Returns:
+    - data_df (pl.DataFrame): The pitch-level frame, in the original row and PITCH_SCHEMA column order.
+    """
+    keep, _ = _column_projection(columns)
+    pa = (tables['plate_appearances']
+          .join(tables['games'], on='game_id', how='left', maintain_order='left'))
+    df = (tables['pitches']
+          .join(pa, on='pa_key', how='left', maintain_order='left')
+          .join(tables['batted_balls'].drop('pa_key'), on='pitch_key', how='left', maintain_order='left'))
+
+    top = pl.col('is_top')
+    main = pl.col('is_main')
+    return df.select(
+        pl.col('game_id'),
+        pl.col('game_date'),
+        pl.col(['batter_id', 'batter_name', 'batter_hand']),
+        pl.when(top).then(pl.col('away_team')).otherwise(pl.col('home_team')).alias('batter_team'),
+        pl.when(top).then(pl.col('away_team_id')).otherwise(pl.col('home_team_id')).alias('batter_team_id'),
+        pl.col(['pitcher_id', 'pitcher_name', 'pitcher_hand']),
+        pl.when(top).then(pl.col('home_team')).otherwise(pl.col('away_team')).alias('pitcher_team'),
+        # Walk rows of get_data_df carry the batting team id as pitcher_team_id
+        pl.when(top == main).then(pl.col('home_team_id')).otherwise(pl.col('away_team_id')).alias('pitcher_team_id'),
+        pl.when(main).then(pl.col('ab_number')).alias('ab_number'),
+        pl.col(PITCH_TABLES['pitches'][5:] + PITCH_COLUMN_GROUPS['hit_data']),
+        *[pl.when(pl.col('has_result')).then(pl.col(c)).alias(c) for c in _PA_RESULT_COLUMNS],
+        *[pl.when(pl.col('has_event')).then(pl.col(c)).alias(c) for c in ['event', 'event_type']],
+    ).select(keep)
+
+# Struct schema for the parts of liveData.plays.allPlays[*] that get_data_df reads, everything else in the feed is skipped
+_COUNT_STRUCT = pl.Struct({'balls': pl.Int64, 'strikes': pl.Int64, 'outs': pl.Int64})
+_PLAY_EVENT_STRUCT = pl.Struct({
+    'isPitch': pl.Boolean,
+    'pitchNumber': pl.Int64,
+    'index': pl.Int64,
+    'playId': pl.String,
+    'startTime': pl.String,
+    'endTime': pl.String,
+    'type': pl.String,
+    'details': pl.Struct({'call': pl.Struct({'code': pl.String}),
+                          'description': pl.String,
+                          'code': pl.String,
+                          'isInPlay': pl.Boolean,
+                          'isStrike': pl.Boolean,
+                          'isOut': pl.Boolean,
+                          'hasReview': pl.Boolean,
+                          'type': pl.Struct({'code': pl.String, 'description': pl.String})}),
+    'count': _COUNT_STRUCT,
+    'pitchData': pl.Struct({'startSpeed': pl.Float64,
+                            'endSpeed': pl.Float64,
+                            'strikeZoneTop': pl.Float64,
+                            'strikeZoneBottom': pl.Float64,
+                            'coordinates': pl.Struct({name: pl.Float64 for name in ['x', 'y', 'aX', 'aY', 'aZ', 'pfxX', 'pfxZ', 'pX', 'pZ',
+                                                                                    'vX0', 'vY0', 'vZ0', 'x0', 'y0', 'z0']}),
+                            'zone': pl.Int64,
+                            'typeConfidence': pl.Float64,
+                            'plateTime': pl.Float64,
+                            'extension': pl.Float64,
+                            'breaks': pl.Struct({'spinRate': pl.Float64,
+                                                 'spinDirection': pl.Float64,
+                                                 'breakVertical': pl.Float64,
+                                                 'breakVerticalInduced': pl.Float64,
+                                                 'breakHorizontal': pl.Float64})}),
+    'hitData': pl.Struct({'launchSpeed': pl.Float64,
+                          'launchAngle': pl.Float64,
+                          'totalDistance': pl.Float64,
+                          'location': pl.String,
+                          'trajectory': pl.String,
+                          'hardness': pl.String,
+                          'coordinates': pl.Struct({'coordX': pl.Float64, 'coordY': pl.Float64})}),
+})
+_PLAY_SCHEMA = {
+    'atBatIndex': pl.Int64,
+    'matchup': pl.Struct({'batter': pl.Struct({'id': pl.Int64, 'fullName': pl.String}),
+                          'batSide': pl.Struct({'code': pl.String}),
+                          'pitcher': pl.Struct({'id': pl.Int64, 'fullName': pl.String}),
+                          'pitchHand': pl.Struct({'code': pl.String})}),
+    'about': pl.Struct({'isTopInning': pl.Boolean}),
+    'result': pl.Struct({'type': pl.String,
+                         'event': pl.String,
+                         'eventType': pl.String,
+                         'rbi': pl.Int64,
+                         'awayScore': pl.Int64,
+                         'homeScore': pl.Int64,
+                         'isOut': pl.Boolean}),
+    'playEvents': pl.List(_PLAY_EVENT_STRUCT),
+}
+_TEAM_STRUCT = pl.Struct({'id': pl.Int64, 'abbreviation': pl.String})
+_FEED_SCHEMA = {
+    'gamePk': pl.Int64,
+    'gameData': pl.Struct({'datetime': pl.Struct({'officialDate': pl.String}),
+                           'teams': pl.Struct({'away': _TEAM_STRUCT, 'home': _TEAM_STRUCT})}),
+    'liveData': pl.Struct({'plays': pl.Struct({'allPlays': pl.List(pl.Struct(_PLAY_SCHEMA))})}),
+}
+
+# The play and event structs that only feed one column group, and can be left out of the read schema when that group is not projected.
+# details and count always stay, they decide which events become rows
+_PRUNABLE_PLAY_FIELDS = {'matchup': ('play', 'matchup'), 'result': ('play', 'result'),
+                         'pitch_data': ('event', 'pitchData'), 'hit_data': ('event', 'hitData')}
+
+
+@lru_cache(maxsize=None)
+def _feed_schema(skip: tuple = ()):
+    # _FEED_SCHEMA without the structs of the skipped column groups
+    if not skip:
+        return _FEED_SCHEMA
+    dropped = [_PRUNABLE_PLAY_FIELDS[group] for group in skip]
+    event_struct = pl.Struct({name: dtype for name, dtype in _PLAY_EVENT_STRUCT.to_schema().items() if ('event', name) not in dropped})
+    play_schema = {name: dtype for name, dtype in _PLAY_SCHEMA.items() if ('play', name) not in dropped}
+    play_schema['playEvents'] = pl.List(event_struct)
+    return {
+        'gamePk': pl.Int64,
+        'gameData': _FEED_SCHEMA['gameData'],
+        'liveData': pl.Struct({'plays': pl.Struct({'allPlays': pl.List(pl.Struct(play_schema))})}),
+    }
+
+
+def _field(expr, *path):
+    # Walks down a chain of nested struct fields
+    for name in path:
+        expr = expr.struct.field(name)
+    return expr
+
+
+@lru_cache(maxsize=None)
+def _feed_decoder():
+    """
+    Builds the msgspec decoder for the compact feed schema. msgspec is only needed for compact decoding,
+    so it is imported the first time this is called.
+
+    Returns:
+    - decoder (msgspec.json.Decoder): A decoder that reads feed/live bytes into the Feed struct, skipping every field get_data_df does not use.
+    """
+    try:
+        import msgspec
+    except ImportError:
+        raise ImportError('Compact feed decoding needs msgspec, install it with pip install msgspec.')
+
+    # Fields default to None and omit_defaults drops them again in to_builtins, so a missing key stays missing like in the full JSON
+    class Node(msgspec.Struct, kw_only=True, omit_defaults=True):
         pass
 
+    class Person(Node):
+        id: Optional[int] = None
+        fullName: Optional[str] = None
+
+    class Code(Node):
+        code: Optional[str] = None
+
+    class TypeCode(Node):
+        code: Optional[str] = None
+        description: Optional[str] = None
+
+    class Matchup(Node):
+        batter: Optional[Person] = None
+        batSide: Optional[Code] = None
+        pitcher: Optional[Person] = None
+        pitchHand: Optional[Code] = None
+
+    class About(Node):
+        isTopInning: Optional[bool] = None
+
+    class Result(Node):
+        type: Optional[str] = None
+        event: Optional[str] = None
+        eventType: Optional[str] = None
+        rbi: Optional[int] = None
+        awayScore: Optional[int] = None
+        homeScore: Optional[int] = None
+        isOut: Optional[bool] = None
+
+    class Details(Node):
+        call: Optional[Code] = None
+        description: Optional[str] = None
+        code: Optional[str] = None
+        isInPlay: Optional[bool] = None
+        isStrike: Optional[bool] = None
+        isOut: Optional[bool] = None
+        hasReview: Optional[bool] = None
+        type: Optional[TypeCode] = None
+
+    class Count(Node):
+        balls: Optional[int] = None
+        strikes: Optional[int] = None
+        outs: Optional[int] = None
+
+    class Coordinates(Node):
+        x: Optional[float] = None
+        y: Optional[float] = None
+        aX: Optional[float] = None
+        aY: Optional[float] = None
+        aZ: Optional[float] = None
+        pfxX: Optional[float] = None
+        pfxZ: Optional[float] = None
+        pX: Optional[float] = None
+        pZ: Optional[float] = None
+        vX0: Optional[float] = None
+        vY0: Optional[float] = None
+        vZ0: Optional[float] = None
+        x0: Optional[float] = None
+        y0: Optional[float] = None
+        z0: Optional[float] = None
+
+    class Breaks(Node):
+        spinRate: Optional[float] = None
+        spinDirection: Optional[float] = None
+        breakVertical: Optional[float] = None
+        breakVerticalInduced: Optional[float] = None
+        breakHorizontal: Optional[float] = None
+
+    class PitchData(Node):
+        startSpeed: Optional[float] = None
+        endSpeed: Optional[float] = None
+        strikeZoneTop: Optional[float] = None
+        strikeZoneBottom: Optional[float] = None
+        coordinates: Optional[Coordinates] = None
+        zone: Optional[int] = None
+        typeConfidence: Optional[float] = None
+        plateTime: Optional[float] = None
+        extension: Optional[float] = None
+        breaks: Optional[Breaks] = None
+
+    class HitCoordinates(Node):
+        coordX: Optional[float] = None
+        coordY: Optional[float] = None
+
+    class HitData(Node):
+        launchSpeed: Optional[float] = None
+        launchAngle: Optional[float] = None
+        totalDistance: Optional[float] = None
+        location: Optional[str] = None
+        trajectory: Optional[str] = None
+        hardness: Optional[str] = None
+        coordinates: Optional[HitCoordinates] = None
+
+    class PlayEvent(Node):
+        isPitch: Optional[bool] = None
+        pitchNumber: Optional[int] = None
+        index: Optional[int] = None
+        playId: Optional[str] = None
+        startTime: Optional[str] = None
+        endTime: Optional[str] = None
+        type: Optional[str] = None
+        details: Optional[Details] = None
+        count: Optional[Count] = None
+        pitchData: Optional[PitchData] = None
+        hitData: Optional[HitData] = None
+
+    class Play(Node):
+        atBatIndex: Optional[int] = None
+        matchup: Optional[Matchup] = None
+        about: Optional[About] = None
+        result: Optional[Result] = None
+        playEvents: Optional[list[PlayEvent]] = None
+
+    class Plays(Node):
+        allPlays: Optional[list[Play]] = None
+
+    class LiveData(Node):
+        plays: Optional[Plays] = None
+
+    class Team(Node):
+        id: Optional[int] = None
+        abbreviation: Optional[str] = None
+
+    class Teams(Node):
+        away: Optional[Team] = None
+        home: Optional[Team] = None
+
+    class GameDate(Node):
+        officialDate: Optional[str] = None
+
+    class Status(Node):
+        codedGameState: Optional[str] = None
+
+    class GameData(Node):
+        datetime: Optional[GameDate] = None
+        status: Optional[Status] = None
+        teams: Optional[Teams] = None
+
+    class Feed(Node):
+        gamePk: Optional[int] = None
+        gameData: Optional[GameData] = None
+        liveData: Optional[LiveData] = None
+
+    return msgspec.json.Decoder(Feed)
+
+
+def decode_feed(content: bytes, compact: bool = False):
+    """
+    Decodes the raw bytes of a feed/live response.
+
+    Parameters:
+    - content (bytes): The JSON response body.
+    - compact (bool): Decode only the fields get_data_df reads (the matchup, details, count, pitchData, hitData, about and result of each play,
+      plus the game id, date, status and teams) through a typed msgspec schema instead of building the full dictionary. Default is False.
+
+    Returns:
+    - data (dict): The decoded feed, with the same layout as the full JSON for every field that is kept.
+    """
+    if not compact:
+        return json.loads(content)
+
+    import msgspec
+    try:
+        return msgspec.to_builtins(_feed_decoder().decode(content))
+    except msgspec.ValidationError as e:
+        # The API returned a type the schema does not expect, fall back to the full document for this game
+        logger.warning('Compact decoding failed (%s), decoding the full feed instead.', e)
+        return json.loads(content)
+
+
+
+def _parse_feeds_ipc(payloads: list, engine: str, compact: bool, columns: list = None, compact_dtypes: bool = False, float32: bool = False):
+    """
+    Runs in a worker process of get_data_df_parallel. Parses a chunk of raw feed payloads and sends each game's frame back as
+    Arrow IPC bytes, which is far cheaper to move between processes than pickled rows.
+    """
+    scraper = MLB_Scrape(max_workers=1)
+    results = []
+    for content in payloads:
+        data = decode_feed(content, compact=compact) if engine == 'python' else content
+        buffer = BytesIO()
+        scraper._data_df([data], engine, columns, compact_dtypes, float32).write_ipc(buffer)
+        results.append(buffer.getvalue())
+    return results
+
+
+def _frame_bytes(frame):
+    # The memory held by a polars or pandas frame, strings included
+    if isinstance(frame, (pl.DataFrame, pl.Series)):
+        return frame.estimated_size()
+    if hasattr(frame, 'memory_usage'):
+        usage = frame.memory_usage(deep=True)
+        return int(usage.sum()) if hasattr(usage, 'sum') else int(usage)
+    return 0
+
+
+class FrameCache:
+    """
+    An in-process LRU cache of DataFrames, bounded by the memory the frames hold. Keys should include a data version
+    (for example PitchStore.version) so a cached frame is never served after its games have changed, stale versions
+    simply age out. Frames are shared between callers and must not be modified in place.
+    """
+
+    def __init__(self, max_bytes: int = None):
+        """
+        Parameters:
+        - max_bytes (int): The memory budget of the cached frames. Default is DEFAULT_FRAME_CACHE_MB.
+        """
+        self.max_bytes = int(DEFAULT_FRAME_CACHE_MB * 1024 ** 2) if max_bytes is None else max_bytes
+        self.entries = OrderedDict()
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.lock = threading.Lock()
+
+    def get(self, key):
+        """
+        Returns the cached frame of a key and marks it as most recently used, or None.
+        """
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self.entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def put(self, key, frame):
+        """
+        Stores a frame, evicting the least recently used ones until the cache fits its budget again. A frame larger than
+        the whole budget is not kept.
+        """
+        size = _frame_bytes(frame)
+        with self.lock:
+            if key in self.entries:
+                self.bytes -= self.entries.pop(key)[1]
+            if size > self.max_bytes:
+                return frame
+            self.entries[key] = (frame, size)
+            self.bytes += size
+            while self.bytes > self.max_bytes:
+                _, (_, evicted) = self.entries.popitem(last=False)
+                self.bytes -= evicted
+                self.evictions += 1
+        return frame
+
+    def get_or_build(self, key, build):
+        """
+        Returns the cached frame of a key, building and storing it with build() on a miss.
+
+        Parameters:
+        - key (hashable): The cache key.
+        - build (callable): Called without arguments to make the frame.
+
+        Returns:
+        - frame (pl.DataFrame or pd.DataFrame): The cached or newly built frame.
+        """
+        frame = self.get(key)
+        if frame is None:
+            frame = self.put(key, build())
+        return frame
+
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
+            self.bytes = 0
+
+    def stats(self):
+        """
+        Returns a dictionary with the hit rate, evictions and current size of the cache.
+        """
+        with self.lock:
+            lookups = self.hits + self.misses
+            return {'hits': self.hits,
+                    'misses': self.misses,
+                    'hit_rate': self.hits / lookups if lookups else 0.0,
+                    'evictions': self.evictions,
+                    'frames': len(self.entries),
+                    'bytes': self.bytes}
+
+
+class PitchStore:
+    """
+    A local pitch-level dataset with the PITCH_SCHEMA columns, stored as one Parquet file per game in a
+    season=YYYY/game_id=N directory layout. Games are added once with ingest, and read back lazily so filters
+    on season skip whole directories and filters on pitcher columns are pushed down into the Parquet scan.
+    """
+
+    # Partition columns taken from the directory names
+    PARTITION_SCHEMA = {'season': pl.Int64, 'game_id': pl.Int64}
+
+    def __init__(self, store_dir: str = DEFAULT_STORE_DIR):
+        """
+        Parameters:
+        - store_dir (str): The root directory of the store. Default is DEFAULT_STORE_DIR.
+        """
+        self.store_dir = store_dir
+        os.makedirs(store_dir, exist_ok=True)
+
+    def _path(self, season, game_id):
+        return os.path.join(self.store_dir, f'season={season}', f'game_id={game_id}', 'part-0.parquet')
+
+    def games(self):
+        """
+        Returns the set of game IDs already in the store, read from the directory layout without opening any file.
+        """
+        game_ids = set()
+        for season_dir in os.listdir(self.store_dir):
+            if not season_dir.startswith('season='):
+                continue
+            for game_dir in os.listdir(os.path.join(self.store_dir, season_dir)):
+                if game_dir.startswith('game_id=') and os.path.exists(os.path.join(self.store_dir, season_dir, game_dir, 'part-0.parquet')):
+                    game_ids.add(int(game_dir.split('=', 1)[1]))
+        return game_ids
+
+    def version(self, game_ids: list = None):
+        """
+        Returns a short token that changes whenever one of the games is added, rewritten or removed, taken from the
+        modification times and sizes of their files without opening them. Used to key cached frames of the store.
+
+        Parameters:
+        - game_ids (list): The games to version. Default is None (every game).
+
+        Returns:
+        - version (str): The version token.
+        """
+        wanted = None if game_ids is None else {int(game_id) for game_id in game_ids}
+        files = []
+        for season_dir in sorted(os.listdir(self.store_dir)):
+            if not season_dir.startswith('season='):
+                continue
+            for game_dir in os.listdir(os.path.join(self.store_dir, season_dir)):
+                if not game_dir.startswith('game_id='):
+                    continue
+                game_id = int(game_dir.split('=', 1)[1])
+                if wanted is not None and game_id not in wanted:
+                    continue
+                try:
+                    stat = os.stat(os.path.join(self.store_dir, season_dir, game_dir, 'part-0.parquet'))
+                except FileNotFoundError:
+                    continue
+                files.append((game_id, stat.st_mtime_ns, stat.st_size))
+        return hashlib.sha1(repr(sorted(files)).encode()).hexdigest()[:16]
+
+    def write_game(self, game_df: pl.DataFrame):
+        """
+        Writes (or replaces) the partition of one game.
+
+        Parameters:
+        - game_df (pl.DataFrame): The PITCH_SCHEMA frame of a single game.
+        """
+        game_id = game_df['game_id'][0]
+        season = int(game_df['game_date'][0][:4])
+        path = self._path(season, game_id)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+
+        buffer = BytesIO()
+        game_df.write_parquet(buffer, statistics=True)
+        _atomic_write(path, buffer.getvalue())
+
+    def ingest(self, scraper, game_list_input: list, replace: bool = False):
+        """
+        Downloads and adds the games that are not in the store yet. Only finished games are written, so a game that
+        is still in progress is picked up again on the next ingest.
+
+        Parameters:
+        - scraper (MLB_Scrape): The scraper used to download the game feeds.
+        - game_list_input (list): A list of game IDs that should be in the store.
+        - replace (bool): Download and rewrite games that are already in the store. Default is False.
+
+        Returns:
+        - added (list): The game IDs written to the store.
+        """
+        stored = set() if replace else self.games()
+        new_games = list(dict.fromkeys(game_id for game_id in game_list_input if game_id not in stored))
+        if len(new_games) == 0:
+            return []
+
+        print(f'Adding {len(new_games)} Games to the Pitch Store.')
+        added = []
+        for game_id, status, _ in tqdm(self.iter_ingest(scraper, new_games), total=len(new_games), desc="Processing", unit="iteration"):
+            if status == 'stored':
+                added.append(game_id)
+        return added
+
+    def iter_ingest(self, scraper, game_list_input: list):
+        """
+        Downloads, parses and writes a list of games, yielding the outcome of each game as soon as it is known.
+
+        Parameters:
+        - scraper (MLB_Scrape): The scraper used to download the game feeds.
+        - game_list_input (list): A list of game IDs to write, whether or not they are already stored.
+
+        Yields:
+        - (game_id, status, rows) (tuple): status is 'stored', 'empty' (final but without plays), 'not_final' or 'failed'.
+        """
+        for i, content in scraper.iter_data(game_list_input, raw=True):
+            if _coded_game_state(content) not in FeedCache.FINAL_STATES:
+                yield game_list_input[i], 'not_final', 0
+                continue
+            game_df = scraper._data_df([content], 'polars')
+            del content
+            # Games without any plays have nothing to store
+            if game_df.height == 0:
+                yield game_list_input[i], 'empty', 0
+                continue
+            self.write_game(game_df)
+            yield game_list_input[i], 'stored', game_df.height
+
+        # iter_data only knows which games failed once it is done
+        for game_id in scraper.failed_games:
+            yield game_id, 'failed', 0
+
+    def scan(self, game_ids: list = None, year=None, pitcher_team=None, pitcher_name=None, columns: list = None,
+             compact_dtypes: bool = False, float32: bool = False):
+        """
+        Lazily scans the store. Each filter takes a single value or a list of values.
+
+        Parameters:
+        - game_ids (list): Only keep these games, returned in the order of the list. Default is None (every game, by season and game ID).
+        - year (int or list): Only keep these seasons, whole season directories are skipped. Default is None.
+        - pitcher_team (str or list): Only keep pitches thrown by these teams. Default is None.
+        - pitcher_name (str or list): Only keep pitches thrown by these pitchers. Default is None.
+        - columns (list): The PITCH_SCHEMA columns to read. Default is None (every column).
+        - compact_dtypes (bool): Cast the pitches to the memory-compact dtypes of compact_pitch_schema. Default is False.
+        - float32 (bool): With compact_dtypes, also read the tracking columns as Float32. Default is False.
+
+        Returns:
+        - lf (pl.LazyFrame): The filtered pitches, in PITCH_SCHEMA column order.
+        """
+        keep, _ = _column_projection(columns)
+        if len(self.games()) == 0:
+            schema = compact_pitch_schema(float32) if compact_dtypes else PITCH_SCHEMA
+            return pl.LazyFrame(schema={c: schema[c] for c in keep})
+
+        lf = pl.scan_parquet(os.path.join(self.store_dir, '**', '*.parquet'), hive_partitioning=True, hive_schema=self.PARTITION_SCHEMA)
+
+        # Filters on the partition columns prune directories, the rest are checked against the Parquet statistics
+        for name, value in (('game_id', game_ids), ('season', year), ('pitcher_team', pitcher_team), ('pitcher_name', pitcher_name)):
+            if value is None:
+                continue
+            if isinstance(value, (list, tuple, set)):
+                lf = lf.filter(pl.col(name).is_in(list(value)))
+            else:
+                lf = lf.filter(pl.col(name) == value)
+        if isinstance(game_ids, (list, tuple)):
+            # The games come back in the order they were asked for, like get_data_df of the same list
+            order = list(dict.fromkeys(int(game_id) for game_id in game_ids))
+            lf = lf.sort(pl.col('game_id').replace_strict(order, list(range(len(order))), return_dtype=pl.Int64), maintain_order=True)
+        else:
+            lf = lf.sort(['season', 'game_id'], maintain_order=True)
+        lf = lf.select(keep)
+        return compact_pitch_frame(lf, float32) if compact_dtypes else lf
+
+    def read(self, game_ids: list = None, year=None, pitcher_team=None, pitcher_name=None, columns: list = None,
+             compact_dtypes: bool = False, float32: bool = False):
+        """
+        Reads pitches from the store into a DataFrame, see scan for the filters and dtypes.
+
+        Returns:
+        - data_df (pl.DataFrame): The filtered pitches.
+        """
+        return self.scan(game_ids=game_ids, year=year, pitcher_team=pitcher_team, pitcher_name=pitcher_name, columns=columns,
+                         compact_dtypes=compact_dtypes, float32=float32).collect()
+
+
+class TrackingIndex:
+    """
+    A persisted record of which games have pitch tracking, so untracked games (parks without Statcast/Hawk-Eye)
+    can be skipped before their full feed is downloaded.
+
+    Games are checked with MLB_Scrape.probe_game_tracking. Results are also rolled up per venue and season: once a venue
+    has venue_threshold probed games in a season that all agree, its other games that season take that answer without a probe.
+    """
+
+    def __init__(self, path: str, venue_threshold: int = 3):
+        """
+        Parameters:
+        - path (str): The JSON file the index is kept in.
+        - venue_threshold (int): The number of agreeing probes before a venue's answer is reused for its other games. Default is 3.
+        """
+        self.path = path
+        self.venue_threshold = venue_threshold
+        self.index = {'games': {}, 'venues': {}}
+        if os.path.exists(path):
+            with open(path) as f:
+                self.index = json.load(f)
+        self.probes = 0
+        self.lock = threading.Lock()
+
+    def _save(self):
+        os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        _atomic_write(self.path, json.dumps(self.index))
+
+    def _venue_answer(self, venue_key):
+        # The answer of a venue once enough probes agree on it, otherwise None
+        counts = self.index['venues'].get(venue_key)
+        if counts is None:
+            return None
+        if counts['tracked'] >= self.venue_threshold and counts['untracked'] == 0:
+            return True
+        if counts['untracked'] >= self.venue_threshold and counts['tracked'] == 0:
+            return False
+        return None
+
+    def record(self, game_id: int, tracked: bool, venue_id: int = None, season: int = None):
+        """
+        Records whether a game has tracking, for example from a probe or from a parsed feed.
+        """
+        with self.lock:
+            self.index['games'][str(game_id)] = tracked
+            if venue_id is not None and season is not None:
+                counts = self.index['venues'].setdefault(f'{venue_id}|{season}', {'tracked': 0, 'untracked': 0})
+                counts['tracked' if tracked else 'untracked'] += 1
+
+    def is_tracked(self, game_id: int):
+        """
+        Returns True or False for a game that has been checked, or None if it has not.
+        """
+        return self.index['games'].get(str(game_id))
+
+    def filter(self, scraper, schedule: pl.DataFrame):
+        """
+        Adds a tracked column to a get_schedule result and keeps only the tracked games, probing the games that are not known yet.
+
+        Parameters:
+        - scraper (MLB_Scrape): The scraper used for the probes.
+        - schedule (pl.DataFrame): A get_schedule result, with game_id, date and venue_id columns.
+
+        Returns:
+        - schedule (pl.DataFrame): The tracked games of the schedule, with a tracked column.
+        """
+        tracked = self.check(scraper, schedule)
+        return schedule.with_columns(pl.Series('tracked', [tracked[game_id] for game_id in schedule['game_id']], dtype=pl.Boolean)).filter(pl.col('tracked'))
+
+    def check(self, scraper, schedule: pl.DataFrame):
+        """
+        Decides for every game of a schedule whether it has tracking, probing concurrently only when neither the game
+        nor its venue is known. Probes that fail leave the game unknown, and it is kept so it is not lost.
+
+        Returns:
+        - tracked (dict): Game ID -> bool.
+        """
+        games = schedule.select('game_id', pl.col('date').dt.year().cast(pl.Int64).alias('season'), 'venue_id').rows()
+        tracked = {}
+        to_probe = []
+        for game_id, season, venue_id in games:
+            known = self.is_tracked(game_id)
+            if known is None:
+                known = self._venue_answer(f'{venue_id}|{season}')
+            if known is None:
+                to_probe.append((game_id, season, venue_id))
+            else:
+                tracked[game_id] = known
+
+        # Probe in venue order, so a venue's answer can settle early and spare the rest of its games
+        to_probe.sort(key=lambda game: (game[2], game[1]))
+
+        def probe(game):
+            game_id, season, venue_id = game
+            # Other probes update the venue counts while this one reads them
+            with self.lock:
+                venue_answer = self._venue_answer(f'{venue_id}|{season}')
+            if venue_answer is not None:
+                return game_id, venue_answer
+            try:
+                result = scraper.probe_game_tracking(game_id)
+            except requests.RequestException:
+                return game_id, None
+            with self.lock:
+                self.probes += 1
+            self.record(game_id, result, venue_id, season)
+            return game_id, result
+
+        if to_probe:
+            print(f'Checking pitch tracking for {len(to_probe)} games.')
+            with ThreadPoolExecutor(max_workers=scraper.max_workers) as executor:
+                for game_id, result in executor.map(probe, to_probe):
+                    tracked[game_id] = True if result is None else result
+            with self.lock:
+                self._save()
+        return tracked
+
+    def stats(self):
+        """
+        Returns a dictionary with the number of known tracked and untracked games and the probes made by this object.
+        """
+        with self.lock:
+            values = list(self.index['games'].values())
+            return {'tracked': sum(values), 'untracked': len(values) - sum(values), 'probes': self.probes}
+
+
+class SeasonCrawler:
+    """
+    Fills a PitchStore with every game of a schedule, unattended. The outcome of every game is checkpointed to a JSON
+    manifest as the crawl goes, so an interrupted run picks up where it stopped, and progress, throughput and ETA are
+    printed at a fixed interval.
+    """
+
+    # Outcomes that are not tried again on the next run
+    DONE_STATUSES = ('stored', 'empty', 'untracked')
+
+    def __init__(self, scraper, store: PitchStore, manifest_path: str = None, checkpoint_every: int = 25, report_every: float = 30):
+        """
+        Parameters:
+        - scraper (MLB_Scrape): The scraper used to download the game feeds.
+        - store (PitchStore): The store the games are written to.
+        - manifest_path (str): The checkpoint manifest. Default is crawl_manifest.json in the store directory.
+        - checkpoint_every (int): The number of games between manifest writes. Default is 25.
+        - report_every (float): The number of seconds between progress lines. Default is 30.
+        """
+        self.scraper = scraper
+        self.store = store
+        self.manifest_path = manifest_path or os.path.join(store.store_dir, 'crawl_manifest.json')
+        self.checkpoint_every = checkpoint_every
+        self.report_every = report_every
+        self.manifest = {'games': {}}
+        if os.path.exists(self.manifest_path):
+            with open(self.manifest_path) as f:
+                self.manifest = json.load(f)
+
+    def _save_manifest(self):
+        _atomic_write(self.manifest_path, json.dumps(self.manifest))
+
+    def _record(self, game_id, status, rows=0):
+        entry = self.manifest['games'].setdefault(str(game_id), {'attempts': 0})
+        entry.update({'status': status, 'rows': rows, 'updated': datetime.now().isoformat(timespec='seconds')})
+        if status != 'not_scheduled':
+            entry['attempts'] += 1
+
+    def pending(self, game_list_input: list):
+        """
+        Returns the games of game_list_input that still have to be crawled, in order.
+        """
+        stored = self.store.games()
+        games = self.manifest['games']
+        return [game_id for game_id in dict.fromkeys(game_list_input)
+                if game_id not in stored and games.get(str(game_id), {}).get('status') not in self.DONE_STATUSES]
+
+    def crawl(self, schedule, max_attempts: int = 3, tracking_index: TrackingIndex = None):
+        """
+        Crawls every game of a schedule into the store, skipping what an earlier run already finished.
+
+        Parameters:
+        - schedule (pl.DataFrame or list): A get_schedule result, or a list of game IDs. With a schedule, games that are
+          not in a final state yet are recorded as 'not_scheduled' without being downloaded.
+        - max_attempts (int): Give up on a game after this many failed attempts across runs. Default is 3.
+        - tracking_index (TrackingIndex): With a schedule, skip the games without pitch tracking, recording them as 'untracked'.
+          Default is None (crawl every game).
+
+        Returns:
+        - summary (dict): The number of games per status in the manifest, after this run.
+        """
+        if isinstance(schedule, pl.DataFrame):
+            final = schedule.filter(pl.col('state').is_in(FeedCache.FINAL_STATES))['game_id'].to_list()
+            for game_id in schedule.filter(~pl.col('state').is_in(FeedCache.FINAL_STATES))['game_id'].to_list():
+                self._record(game_id, 'not_scheduled')
+            game_list_input = final
+            if tracking_index is not None:
+                # Only check the games that still have to be crawled
+                todo = schedule.filter(pl.col('game_id').is_in(self.pending(final)))
+                tracked = tracking_index.check(self.scraper, todo)
+                for game_id, is_tracked in tracked.items():
+                    if not is_tracked:
+                        self._record(game_id, 'untracked')
+        else:
+            game_list_input = list(schedule)
+
+        # Games that kept failing are left for a manual look instead of being retried forever
+        def given_up(game_id):
+            entry = self.manifest['games'].get(str(game_id), {})
+            return entry.get('status') == 'failed' and entry.get('attempts', 0) >= max_attempts
+        pending = [game_id for game_id in self.pending(game_list_input) if not given_up(game_id)]
+        self.manifest['started'] = datetime.now().isoformat(timespec='seconds')
+        print(f'Crawling {len(pending)} of {len(game_list_input)} games ({len(game_list_input) - len(pending)} already done or given up).')
+
+        start = last_report = time.monotonic()
+        done = rows = 0
+        try:
+            for game_id, status, game_rows in self.store.iter_ingest(self.scraper, pending):
+                self._record(game_id, status, game_rows)
+                done += 1
+                rows += game_rows
+                if done % self.checkpoint_every == 0:
+                    self._save_manifest()
+                now = time.monotonic()
+                if now - last_report >= self.report_every or done == len(pending):
+                    last_report = now
+                    print(self._progress(done, len(pending), rows, now - start))
+        finally:
+            # Always leave a manifest and the feed cache index behind, including when the run is interrupted
+            self._save_manifest()
+            if self.scraper.feed_cache is not None:
+                self.scraper.feed_cache.flush()
+
+        summary = {}
+        for entry in self.manifest['games'].values():
+            summary[entry['status']] = summary.get(entry['status'], 0) + 1
+        return summary
+
+    @staticmethod
+    def _progress(done, total, rows, elapsed):
+        # One progress line with throughput and ETA, readable in a log file
+        rate = done / elapsed if elapsed > 0 else 0.0
+        eta = (total - done) / rate if rate > 0 else float('nan')
+        eta_text = time.strftime('%H:%M:%S', time.gmtime(eta)) if eta == eta else '--:--:--'
+        return f'{done}/{total} games ({done / total:.0%}), {rows} pitches, {rate:.2f} games/s, {rows / elapsed if elapsed > 0 else 0:.0f} pitches/s, ETA {eta_text}'
+
+
+def _apply_json_patch(document, operations: list):
+    """
+    Applies JSON patch (RFC 6902) operations to a decoded JSON document in place, as returned by the feed/live/diffPatch endpoint.
+
+    Parameters:
+    - document (dict): The decoded document.
+    - operations (list): The patch operations, each a dictionary with 'op', 'path' and 'value' or 'from'.
+
+    Returns:
+    - document (dict): The patched document (a new object only if the root itself was replaced).
+    """
+    def split(pointer):
+        return [part.replace('~1', '/').replace('~0', '~') for part in pointer.split('/')[1:]]
+
+    def resolve(parts):
+        # Walks down to the parent container of the last path part
+        parent = document
+        for part in parts[:-1]:
+            parent = parent[int(part)] if isinstance(parent, list) else parent[part]
+        return parent, parts[-1]
+
+    def get(pointer):
+        parts = split(pointer)
+        if len(parts) == 0:
+            return document
+        parent, key = resolve(parts)
+        return parent[int(key)] if isinstance(parent, list) else parent[key]
+
+    def add(pointer, value):
+        nonlocal document
+        parts = split(pointer)
+        if len(parts) == 0:
+            document = value
+            return
+        parent, key = resolve(parts)
+        if isinstance(parent, list):
+            parent.insert(len(parent) if key == '-' else int(key), value)
+        else:
+            parent[key] = value
+
+    def remove(pointer):
+        parent, key = resolve(split(pointer))
+        return parent.pop(int(key) if isinstance(parent, list) else key)
+
+    for operation in operations:
+        op = operation['op']
+        if op == 'add':
+            add(operation['path'], operation['value'])
+        elif op == 'remove':
+            remove(operation['path'])
+        elif op == 'replace':
+            parts = split(operation['path'])
+            if len(parts) == 0:
+                document = operation['value']
+                continue
+            parent, key = resolve(parts)
+            parent[int(key) if isinstance(parent, list) else key] = operation['value']
+        elif op == 'move':
+            add(operation['path'], remove(operation['from']))
+        elif op == 'copy':
+            add(operation['path'], json.loads(json.dumps(get(operation['from']))))
+        elif op == 'test':
+            if get(operation['path']) != operation['value']:
+                raise ValueError(f"JSON patch test failed at {operation['path']}.")
+        else:
+            raise ValueError(f"Unknown JSON patch operation '{op}'.")
+    return document
+
+
+class LiveGame:
+    """
+    Keeps the pitch-level frame of an in-progress game up to date. The full feed is downloaded once, after that
+    every update only asks the Stats API for the changes since the last timecode, patches the local copy, and
+    re-parses only the plays those changes touched.
+
+    Rows of plays before the current one are kept as they are. The open play at the end of the feed is re-parsed
+    on every update, since its result fields and the count of its first pitch depend on the events that follow.
+    """
+
+    _PLAY_PATH = re.compile(r'^/liveData/plays/allPlays/(\d+|-)(/|$)')
+    # Changes under these paths can alter every row, so they trigger a full re-parse
+    _GAME_PATHS = ('/gamePk', '/gameData/datetime', '/gameData/teams', '/liveData/plays/allPlays')
+
+    def __init__(self, scraper, game_id: int, columns: list = None):
+        """
+        Parameters:
+        - scraper (MLB_Scrape): The scraper used for the requests.
+        - game_id (int): The game ID to follow.
+        - columns (list): The PITCH_SCHEMA columns to build, see get_data_df. Default is None (every column).
+        """
+        self.scraper = scraper
+        self.game_id = game_id
+        self.columns = columns
+        self.data = None
+        self.timecode = None
+        self.frame = None
+        self.bytes_downloaded = 0
+        # Frame of the plays before self._stable_plays, which no longer change
+        self._stable_frame = None
+        self._stable_plays = 0
+
+    @property
+    def state(self):
+        # codedGameState of the local copy, None before the first update
+        if self.data is None:
+            return None
+        return self.data['gameData'].get('status', {}).get('codedGameState')
+
+    @property
+    def is_final(self):
+        return self.state in FeedCache.FINAL_STATES
+
+    def _parse_plays(self, start: int, end: int = None):
+        # Parses a slice of the plays through the python engine, which only walks the events it is given
+        data = {'gamePk': self.data['gamePk'],
+                'gameData': self.data['gameData'],
+                'liveData': {'plays': {'allPlays': self.data['liveData']['plays']['allPlays'][start:end]}}}
+        return self.scraper._data_df([data], 'python', self.columns)
+
+    def _reparse(self, start: int):
+        """
+        Rebuilds the frame from the play at index start onward, keeping the stable rows before it.
+        """
+        if start < self._stable_plays:
+            # An earlier play was edited (e.g. a scoring change), rebuild everything
+            self._stable_frame = self._parse_plays(0, 0)
+            self._stable_plays = 0
+            start = 0
+
+        # Every play before the last one is finished, unless the game is over and the last one is finished too
+        n_plays = len(self.data['liveData']['plays']['allPlays'])
+        last_stable = n_plays if self.is_final else max(n_plays - 1, 0)
+        if last_stable > self._stable_plays:
+            self._stable_frame = pl.concat([self._stable_frame, self._parse_plays(self._stable_plays, last_stable)])
+            self._stable_plays = last_stable
+        self.frame = pl.concat([self._stable_frame, self._parse_plays(self._stable_plays)])
+
+    def update(self):
+        """
+        Brings the game up to date. The first call downloads the full feed, later calls only download the changes.
+
+        Returns:
+        - data_df (pl.DataFrame): The pitch-level frame of the game, the same as get_data_df of the full feed.
+        """
+        if self.data is None:
+            content = self.scraper.get_game_feed_bytes(self.game_id)
+            self.bytes_downloaded += len(content)
+            return self._reset(json.loads(content))
+
+        content = self.scraper.get_game_diff_bytes(self.game_id, self.timecode)
+        self.bytes_downloaded += len(content)
+        changes = json.loads(content)
+
+        # When the changes would be larger than the game, the API sends the full feed instead
+        if isinstance(changes, dict):
+            return self._reset(changes)
+        if len(changes) == 0:
+            return self.frame
+
+        # Apply every patch to a copy and find the first play it touched, the local copy and its timecode only move
+        # on once all of them applied, so a failed patch leaves the game as it was for the next update
+        data = json.loads(json.dumps(self.data))
+        first_changed = None
+        for patch in changes:
+            for operation in patch.get('diff', []):
+                data = _apply_json_patch(data, [operation])
+                paths = [operation['path']] + ([operation['from']] if 'from' in operation else [])
+                for path in paths:
+                    match = self._PLAY_PATH.match(path)
+                    if match:
+                        index = len(data['liveData']['plays']['allPlays']) - 1 if match.group(1) == '-' else int(match.group(1))
+                    elif path == '' or path.startswith(self._GAME_PATHS):
+                        index = 0
+                    else:
+                        continue
+                    first_changed = index if first_changed is None else min(first_changed, index)
+
+        self.data = data
+        self.timecode = self.data.get('metaData', {}).get('timeStamp', self.timecode)
+        if first_changed is not None:
+            self._reparse(first_changed)
+        return self.frame
+
+    def _reset(self, data):
+        # Starts over from a full copy of the feed
+        self.data = data
+        self.timecode = data.get('metaData', {}).get('timeStamp')
+        self._stable_frame = self._parse_plays(0, 0)
+        self._stable_plays = 0
+        self._reparse(0)
+        return self.frame
+
+    def poll(self, interval: float = 10, until_final: bool = True, callback=None):
+        """
+        Keeps updating the game every interval seconds.
+
+        Parameters:
+        - interval (float): The number of seconds between updates. Default is 10.
+        - until_final (bool): Stop once the game reaches a final state. Default is True.
+        - callback (callable): Called with the updated frame after every update. Default is None.
+
+        Returns:
+        - data_df (pl.DataFrame): The pitch-level frame of the game after the last update.
+        """
+        while True:
+            frame = self.update()
+            if callback is not None:
+                callback(frame)
+            if until_final and self.is_final:
+                return frame
+            time.sleep(interval)
+
+
+class MLB_Scrape:
+
+    def __init__(self, max_workers: int = 8, cache_dir: str = None, cache_max_bytes: int = 2 * 1024 ** 3, live_ttl: int = 60,
+                 rate_limit: float = 20, max_retries: int = 4, fixture_dir: str = None, fixture_mode: str = None, fixture_latency: float = 0):
+        """
+        Parameters:
+        - max_workers (int): The maximum number of requests kept in flight when downloading game feeds. Default is 8.
+        - rate_limit (float): The starting number of requests per second, lowered automatically when the API throttles us. Default is 20.
+        - max_retries (int): The number of retries of a request that hit a 429, 5xx or connection error. Default is 4.
+        - cache_dir (str): A directory for the on-disk game feed cache and the conditional request cache of every other endpoint,
+          use DEFAULT_CACHE_DIR for the shared location. Default is None (no caching).
+        - cache_max_bytes (int): The maximum compressed size of the feed cache. Default is 2 GB.
+        - live_ttl (int): The number of seconds a cached game that is not final stays valid. Default is 60.
+        - fixture_dir (str): A fixture archive to record every response into or replay every response from, see install_fixtures.
+          Default is FIXTURE_DIR (the MLB_SCRAPE_FIXTURES environment variable, live requests when unset).
+        - fixture_mode (str): 'record' or 'replay'. Default is FIXTURE_MODE.
+        - fixture_latency (float): In replay mode, the number of seconds each response is delayed. Default is 0.
+        """
+        # Every request has to reach the fixture archive, so the local caches are left off while fixtures are in use
+        if fixture_dir or FIXTURE_DIR or FIXTURE_SERVER:
+            cache_dir = None
+        self.max_workers = max_workers
+        self.cache_dir = cache_dir
+        self.feed_cache = FeedCache(os.path.join(cache_dir, 'feeds'), max_bytes=cache_max_bytes, live_ttl=live_ttl) if cache_dir else None
+        self.http_cache = HttpCache(os.path.join(cache_dir, 'http')) if cache_dir else None
+        self.rate_limiter = RateLimiter(rate=rate_limit)
+        self.circuit_breaker = CircuitBreaker()
+        # Sports, leagues, teams and players are shared by every scraper of the process with the same cache directory
+        self.reference = reference_registry(cache_dir)
+        # Game IDs that could not be downloaded in the last get_data / iter_data call
+        self.failed_games = []
+
+        # Share one keep-alive session so every call reuses pooled connections instead of a new handshake per request.
+        # Every request is rate limited and retried, and the reference endpoints are sent as conditional requests when there is a cache
+        self.session = requests.Session()
+        adapter_options = {'rate_limiter': self.rate_limiter, 'circuit_breaker': self.circuit_breaker, 'max_retries': max_retries,
+                           'pool_connections': max_workers, 'pool_maxsize': max_workers}
+        if self.http_cache is not None:
+            adapter = ConditionalHTTPAdapter(self.http_cache, **adapter_options)
+        else:
+            adapter = ThrottledHTTPAdapter(**adapter_options)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        self.fixtures = install_fixtures(self.session, fixture_dir, fixture_mode, fixture_latency, pool_size=max_workers)
+        if fixture_dir or FIXTURE_DIR or FIXTURE_SERVER:
+            # The reference lists go through this session too, rather than the shared registry's live one
+            self.reference = ReferenceRegistry()
+            self.reference._scraper = self
+
     def get_sport_id(self):
         """
         Retrieves the list of sports from the MLB API and processes it into a Polars DataFrame.
@@ -20,11 +2423,8 @@ class MLB_Scrape:
         Returns:
         - df (pl.DataFrame): A DataFrame containing the sports information.
         """
-        # Make API call to retrieve sports information
-        response = requests.get(url='https://statsapi.mlb.com/api/v1/sports').json()
-        
-        # Convert the JSON response into a Polars DataFrame
-        df = pl.DataFrame(response['sports'])
+        # The sports list is downloaded once per process by the reference registry
+        df = pl.DataFrame(self.reference.sports())
         
         return df
 
@@ -38,13 +2438,10 @@ class MLB_Scrape:
         Returns:
         - bool: True if the sport ID exists, False otherwise. If False, prints the available sport IDs.
         """
-        # Retrieve the list of sports from the MLB API
-        sport_id_df = self.get_sport_id()
-        
-        # Check if the provided sport ID exists in the DataFrame
-        if sport_id not in sport_id_df['id']:
+        # Check the provided sport ID against the registry's index of the sports list
+        if not self.reference.has_sport(sport_id):
             print('Please Select a New Sport ID from the following')
-            print(sport_id_df)
+            print(self.get_sport_id())
             return False
         
         return True
@@ -58,7 +2455,7 @@ class MLB_Scrape:
         - df (pl.DataFrame): A DataFrame containing the game types information.
         """
         # Make API call to retrieve game types information
-        response = requests.get(url='https://statsapi.mlb.com/api/v1/gameTypes').json()
+        response = self.session.get(url='https://statsapi.mlb.com/api/v1/gameTypes').json()
         
         # Convert the JSON response into a Polars DataFrame
         df = pl.DataFrame(response)
@@ -68,7 +2465,10 @@ class MLB_Scrape:
     def get_schedule(self,
                     year_input: list = [2024],
                     sport_id: list = [1],
-                    game_type: list = ['R']):
+                    game_type: list = ['R'],
+                    start_date: str = None,
+                    end_date: str = None,
+                    chunk_days: int = None):
         
         """
         Retrieves the schedule of baseball games based on the specified parameters.
@@ -76,6 +2476,9 @@ class MLB_Scrape:
         - year_input (list): A list of years to filter the schedule. Default is [2024].
         - sport_id (list): A list of sport IDs to filter the schedule. Default is [1].
         - game_type (list): A list of game types to filter the schedule. Default is ['R'].
+        - start_date (str): The first date to include, as 'YYYY-MM-DD'. Default is None (the start of each season).
+        - end_date (str): The last date to include, as 'YYYY-MM-DD'. Default is None (the end of each season).
+        - chunk_days (int): Split a date range longer than this many days into windows that are fetched concurrently. Default is None (one request per year).
         Returns:
         - game_df (pandas.DataFrame): A DataFrame containing the game schedule information, including game ID, date, time, away team, home team, game state, venue ID, and venue name. If the schedule length is 0, it returns a message indicating that different parameters should be selected.
         """
@@ -88,26 +2491,66 @@ class MLB_Scrape:
 
         if not isinstance(game_type, list) or not all(isinstance(gt, str) for gt in game_type):
             raise ValueError("game_type must be a list of strings.")
+        first_day = datetime.strptime(start_date, '%Y-%m-%d') if start_date is not None else None
+        last_day = datetime.strptime(end_date, '%Y-%m-%d') if end_date is not None else None
 
         eastern = timezone('US/Eastern')
 
         # Convert input lists to comma-separated strings
-        year_input_str = ','.join([str(x) for x in year_input])
         sport_id_str = ','.join([str(x) for x in sport_id])
         game_type_str = ','.join([str(x) for x in game_type])
 
-        # Make API call to retrieve game schedule
-        game_call = requests.get(url=f'https://statsapi.mlb.com/api/v1/schedule/?sportId={sport_id_str}&gameTypes={game_type_str}&season={year_input_str}&hydrate=lineup,players').json()
-
-        # Extract relevant data from the API response
-        game_list = [item for sublist in [[y['gamePk'] for y in x['games']] for x in game_call['dates']] for item in sublist]
-        time_list = [item for sublist in [[y['gameDate'] for y in x['games']] for x in game_call['dates']] for item in sublist]
-        date_list = [item for sublist in [[y['officialDate'] for y in x['games']] for x in game_call['dates']] for item in sublist]
-        away_team_list = [item for sublist in [[y['teams']['away']['team']['name'] for y in x['games']] for x in game_call['dates']] for item in sublist]
-        home_team_list = [item for sublist in [[y['teams']['home']['team']['name'] for y in x['games']] for x in game_call['dates']] for item in sublist]
-        state_list = [item for sublist in [[y['status']['codedGameState'] for y in x['games']] for x in game_call['dates']] for item in sublist]
-        venue_id = [item for sublist in [[y['venue']['id'] for y in x['games']] for x in game_call['dates']] for item in sublist]
-        venue_name = [item for sublist in [[y['venue']['name'] for y in x['games']] for x in game_call['dates']] for item in sublist]
+        # One request per season, narrowed to the dates asked for. Only a range longer than chunk_days is split into windows
+        windows = []
+        for year in year_input:
+            range_start = max(first_day or datetime(year, 1, 1), datetime(year, 1, 1))
+            range_end = min(last_day or datetime(year, 12, 31), datetime(year, 12, 31))
+            if range_start > range_end:
+                continue
+            if chunk_days is None or (range_end - range_start).days < chunk_days:
+                # A whole season is just season=year. Once either date is asked for both are sent, the schedule endpoint
+                # takes startDate and endDate as a pair
+                windows.append((year, range_start, range_end) if first_day or last_day else (year, None, None))
+                continue
+            window_start = range_start
+            while window_start <= range_end:
+                window_end = min(window_start + timedelta(days=chunk_days - 1), range_end)
+                windows.append((year, window_start, window_end))
+                window_start = window_end + timedelta(days=1)
+
+        # Only the fields read below are requested, no hydrations are needed for them
+        fields = 'dates,games,gamePk,gameDate,officialDate,teams,away,home,team,name,status,codedGameState,venue,id'
+
+        def fetch(window):
+            year, window_start, window_end = window
+            dates = ''.join(f'&{name}={day.strftime("%Y-%m-%d")}' for name, day in [('startDate', window_start), ('endDate', window_end)] if day)
+            return self.session.get(url=f'https://statsapi.mlb.com/api/v1/schedule/?sportId={sport_id_str}&gameTypes={game_type_str}&season={year}'
+                                        f'{dates}&fields={fields}').json()
+
+        # Make the API calls to retrieve the game schedule
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            game_calls = list(executor.map(fetch, windows))
+
+        # Extract relevant data from the API responses in a single pass
+        game_list = []
+        time_list = []
+        date_list = []
+        away_team_list = []
+        home_team_list = []
+        state_list = []
+        venue_id = []
+        venue_name = []
+        for game_call in game_calls:
+            for x in game_call.get('dates', []):
+                for y in x['games']:
+                    game_list.append(y['gamePk'])
+                    time_list.append(y['gameDate'])
+                    date_list.append(y['officialDate'])
+                    away_team_list.append(y['teams']['away']['team']['name'])
+                    home_team_list.append(y['teams']['home']['team']['name'])
+                    state_list.append(y['status']['codedGameState'])
+                    venue_id.append(y['venue']['id'])
+                    venue_name.append(y['venue']['name'])
 
         # Create a Polars DataFrame with the extracted data
         game_df = pl.DataFrame(data={'game_id': game_list,
@@ -138,41 +2581,310 @@ class MLB_Scrape:
         return game_df
     
 
-    def get_data(self, game_list_input: list):
+    def get_game_feed_bytes(self, game_id: int):
+        """
+        Retrieves the raw live game data for a single game ID, without decoding it.
+
+        Parameters:
+        - game_id (int): The game ID for which to retrieve live data.
+
+        Returns:
+        - content (bytes): The JSON response body containing live game data for the game ID.
+        """
+        # Serve the feed from the local cache when we have a valid copy
+        if self.feed_cache is not None:
+            content = self.feed_cache.get(game_id)
+            if content is not None:
+                return content
+
+        r = self.session.get(f'https://statsapi.mlb.com/api/v1.1/game/{game_id}/feed/live')
+        # Raise on error payloads, so a game that is still failing after its retries is reported instead of parsed
+        r.raise_for_status()
+
+        # Only cache real feeds, not error payloads
+        if self.feed_cache is not None and r.status_code == 200:
+            state = _coded_game_state(r.content)
+            if state:
+                self.feed_cache.put(game_id, r.content, state)
+        return r.content
+
+    def get_game_feed(self, game_id: int, compact: bool = False):
+        """
+        Retrieves the live game data for a single game ID.
+
+        Parameters:
+        - game_id (int): The game ID for which to retrieve live data.
+        - compact (bool): Decode only the fields get_data_df reads, see decode_feed. Default is False.
+
+        Returns:
+        - data (dict): The JSON response containing live game data for the game ID.
+        """
+        return decode_feed(self.get_game_feed_bytes(game_id), compact=compact)
+
+    def probe_game_tracking(self, game_id: int):
+        """
+        Checks whether a game has pitch tracking, downloading only the pitch speeds of the feed instead of the whole document.
+
+        Parameters:
+        - game_id (int): The game ID to check.
+
+        Returns:
+        - tracked (bool): True if at least one pitch of the game has a startSpeed.
+        """
+        r = self.session.get(url=f'https://statsapi.mlb.com/api/v1.1/game/{game_id}/feed/live?fields=liveData,plays,allPlays,playEvents,pitchData,startSpeed')
+        r.raise_for_status()
+        return b'"startSpeed"' in r.content
+
+    def get_game_diff_bytes(self, game_id: int, start_timecode: str):
+        """
+        Retrieves the changes to the live game data of a game since a timecode, without decoding them.
+
+        Parameters:
+        - game_id (int): The game ID for which to retrieve the changes.
+        - start_timecode (str): The timecode of the copy the changes are applied to, usually its metaData.timeStamp.
+
+        Returns:
+        - content (bytes): A JSON list of {'diff': [JSON patch operations]} objects, or the full feed when the API decides that is smaller.
+        """
+        r = self.session.get(url=f'https://statsapi.mlb.com/api/v1.1/game/{game_id}/feed/live/diffPatch?startTimecode={start_timecode}')
+        # An error body is a JSON object too, and would be taken for a full feed
+        r.raise_for_status()
+        return r.content
+
+    def iter_data(self, game_list_input: list, max_workers: int = None, raw: bool = False, compact: bool = False):
+        """
+        Downloads live game data for a list of game IDs, yielding each game as soon as its download finishes.
+        Only a small window of downloads (twice max_workers) is held at once, so memory does not grow with the number of games.
+
+        Parameters:
+        - game_list_input (list): A list of game IDs for which to retrieve live data.
+        - max_workers (int): The maximum number of requests in flight at once. Default is the value given to MLB_Scrape.
+        - raw (bool): Yield the undecoded response bytes instead of JSON objects. Default is False.
+        - compact (bool): Decode each response through the typed feed schema, see decode_feed. Default is False.
+
+        Yields:
+        - (index, data) (tuple): The position of the game in game_list_input and its live data, in order of completion.
+          Games that still fail after their retries are skipped and listed in self.failed_games.
+        """
+        if max_workers is None:
+            max_workers = self.max_workers
+        max_workers = max(1, max_workers)
+        fetch = self.get_game_feed_bytes if raw else partial(self.get_game_feed, compact=compact)
+
+        self.failed_games = []
+        games = iter(enumerate(game_list_input))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            pending = {}
+
+            def submit_next():
+                for i, game_id in games:
+                    pending[executor.submit(fetch, game_id)] = i
+                    return True
+                return False
+
+            for _ in range(2 * max_workers):
+                if not submit_next():
+                    break
+
+            # Hand back each finished game and top the window back up, dropping our reference to the result once it is yielded
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    i = pending.pop(future)
+                    submit_next()
+                    # One failed game should not end the crawl, keep it aside and carry on with the rest
+                    try:
+                        data = future.result()
+                    except (requests.RequestException, ValueError) as e:
+                        self.failed_games.append(game_list_input[i])
+                        logger.warning('Game %s failed: %s', game_list_input[i], e)
+                        continue
+                    yield i, data
+
+        self._report_cache()
+        if self.failed_games:
+            logger.warning('%d game(s) could not be downloaded, see failed_games.', len(self.failed_games))
+
+    def _report_cache(self):
+        # Persist the feed cache index and show how much of the download it saved
+        if self.feed_cache is not None:
+            self.feed_cache.flush()
+            stats = self.feed_cache.stats()
+            print(f"Feed cache: {stats['hit_rate']:.0%} hit rate, {stats['bytes_saved'] / 1024 ** 2:.1f} MB not downloaded.")
+
+    def cache_stats(self):
+        """
+        Returns the statistics of the feed cache and the conditional request cache.
+
+        Returns:
+        - stats (dict): {'feeds': FeedCache.stats(), 'http': HttpCache.stats()}, with None for a cache that is not in use.
+        """
+        return {'feeds': self.feed_cache.stats() if self.feed_cache is not None else None,
+                'http': self.http_cache.stats() if self.http_cache is not None else None}
+
+    def get_data(self, game_list_input: list, max_workers: int = None, raw: bool = False, compact: bool = False, return_failed: bool = False):
         """
         Retrieves live game data for a list of game IDs.
         
         Parameters:
         - game_list_input (list): A list of game IDs for which to retrieve live data.
+        - max_workers (int): The maximum number of requests in flight at once. Default is the value given to MLB_Scrape, use 1 to download serially.
+        - raw (bool): Return the undecoded response bytes instead of JSON objects, for get_data_df(engine='polars'). Default is False.
+        - compact (bool): Decode each response through the typed feed schema, keeping only the fields get_data_df reads. Needs msgspec. Default is False.
+        - return_failed (bool): Also return the game IDs that could not be downloaded. Default is False.
         
         Returns:
-        - data_total (list): A list of JSON responses containing live game data for each game ID.
+        - data_total (list): A list of JSON responses containing live game data for each game ID, in the same order as game_list_input.
+          Games that failed after their retries are left out, and listed in self.failed_games.
+        - failed_games (list): The game IDs that could not be downloaded, only if return_failed is True.
         """
-        data_total = []
         print('This May Take a While. Progress Bar shows Completion of Data Retrieval.')
-        
-        # Iterate over the list of game IDs with a progress bar
-        for i in tqdm(range(len(game_list_input)), desc="Processing", unit="iteration"):
-            # Make a GET request to the MLB API for each game ID
-            r = requests.get(f'https://statsapi.mlb.com/api/v1.1/game/{game_list_input[i]}/feed/live')
-            # Append the JSON response to the data_total list
-            data_total.append(r.json())
-        
+
+        # Download the games concurrently over the shared session, putting each one back in its input position
+        data_total = [None] * len(game_list_input)
+        for i, data in tqdm(self.iter_data(game_list_input, max_workers=max_workers, raw=raw, compact=compact),
+                            total=len(game_list_input), desc="Processing", unit="iteration"):
+            data_total[i] = data
+
+        # Keep the partial results rather than losing the whole crawl to a few failed games
+        data_total = [data for data in data_total if data is not None]
+        if return_failed:
+            return data_total, list(self.failed_games)
         return data_total
 
-    def get_data_df(self, data_list):
+    def get_data_df_stream(self, game_list_input: list, engine: str = 'polars', max_workers: int = None, compact: bool = False, columns: list = None,
+                           compact_dtypes: bool = False, float32: bool = False):
+        """
+        Downloads and converts a list of game IDs into a Polars DataFrame in one streaming pass. Each game is parsed into its
+        own frame as soon as its download finishes and the raw payload is dropped right after, so parsing overlaps the network
+        wait and memory stays bounded for season-scale pulls.
+
+        Parameters:
+        - game_list_input (list): A list of game IDs for which to retrieve live data.
+        - engine (str): The get_data_df engine used for each game. With 'polars' the raw bytes are parsed directly. Default is 'polars'.
+        - max_workers (int): The maximum number of requests in flight at once. Default is the value given to MLB_Scrape.
+        - compact (bool): With the python engine, decode each response through the typed feed schema. Default is False.
+        - columns (list): The PITCH_SCHEMA columns to build, see get_data_df. Default is None (every column).
+        - compact_dtypes (bool): Build each game frame with the memory-compact dtypes, see get_data_df. Default is False.
+        - float32 (bool): With compact_dtypes, also store the tracking columns as Float32. Default is False.
+
+        Returns:
+        - data_df (pl.DataFrame): A DataFrame containing the structured game data, with the games in the order of game_list_input.
+        """
+        # Checking the projection before any download starts
+        keep, _ = _column_projection(columns)
+        print('Downloading and Converting Games to Dataframe. Progress Bar shows Completion of Data Retrieval.')
+        frames = {}
+        for i, data in tqdm(self.iter_data(game_list_input, max_workers=max_workers, raw=engine == 'polars', compact=compact),
+                            total=len(game_list_input), desc="Processing", unit="iteration"):
+            frames[i] = self._data_df([data], engine, columns, compact_dtypes, float32)
+            del data
+
+        if len(frames) == 0:
+            schema = compact_pitch_schema(float32) if compact_dtypes else PITCH_SCHEMA
+            return pl.DataFrame(schema={c: schema[c] for c in keep})
+
+        # Stitch the per-game frames together in input order without copying them into one block
+        return pl.concat([frames[i] for i in sorted(frames)], rechunk=False)
+
+    def get_data_df_parallel(self, game_list_input: list, processes: int = None, engine: str = 'python', compact: bool = False, chunk_size: int = 4,
+                             columns: list = None, compact_dtypes: bool = False, float32: bool = False):
+        """
+        Downloads a list of game IDs and parses them across a pool of worker processes, so large pulls are not limited to one core.
+        Raw payloads are handed to the workers in chunks as their downloads finish, and each worker returns its chunk as Arrow IPC.
+        Workers are spawned, so scripts calling this need the usual if __name__ == '__main__': guard.
+
+        Parameters:
+        - game_list_input (list): A list of game IDs for which to retrieve live data.
+        - processes (int): The number of worker processes. Default is the number of CPU cores.
+        - engine (str): The get_data_df engine run in each worker. Default is 'python'.
+        - compact (bool): With the python engine, decode each response through the typed feed schema. Default is False.
+        - chunk_size (int): The number of games parsed per task. Default is 4.
+        - columns (list): The PITCH_SCHEMA columns to build, see get_data_df. Default is None (every column).
+        - compact_dtypes (bool): Build each game frame with the memory-compact dtypes, see get_data_df. Default is False.
+        - float32 (bool): With compact_dtypes, also store the tracking columns as Float32. Default is False.
+
+        Returns:
+        - data_df (pl.DataFrame): A DataFrame containing the structured game data, with the games in the order of game_list_input.
+        """
+        keep, _ = _column_projection(columns)
+        print('Downloading and Converting Games to Dataframe. Progress Bar shows Completion of Data Retrieval.')
+        futures = []
+
+        # Spawn fresh workers rather than forking, since forking a process that already runs Polars threads can deadlock
+        with ProcessPoolExecutor(max_workers=processes or os.cpu_count(), mp_context=multiprocessing.get_context('spawn')) as executor:
+            batch = []
+            for i, content in tqdm(self.iter_data(game_list_input, raw=True),
+                                   total=len(game_list_input), desc="Processing", unit="iteration"):
+                batch.append((i, content))
+                if len(batch) == chunk_size:
+                    futures.append(([j for j, _ in batch], executor.submit(_parse_feeds_ipc, [c for _, c in batch], engine, compact, columns, compact_dtypes, float32)))
+                    batch = []
+            if batch:
+                futures.append(([j for j, _ in batch], executor.submit(_parse_feeds_ipc, [c for _, c in batch], engine, compact, columns, compact_dtypes, float32)))
+
+            # Put every game back in its input position
+            frames = {}
+            for indexes, future in futures:
+                for i, ipc in zip(indexes, future.result()):
+                    frames[i] = pl.read_ipc(BytesIO(ipc))
+
+        if len(frames) == 0:
+            schema = compact_pitch_schema(float32) if compact_dtypes else PITCH_SCHEMA
+            return pl.DataFrame(schema={c: schema[c] for c in keep})
+        return pl.concat([frames[i] for i in sorted(frames)], rechunk=False)
+
+    def get_data_df(self, data_list, engine: str = 'python', columns: list = None, compact_dtypes: bool = False, float32: bool = False,
+                    normalized: bool = False):
         """
         Converts a list of game data JSON objects into a Polars DataFrame.
         
         Parameters:
         - data_list (list): A list of JSON objects containing game data.
+        - engine (str): 'python' to walk the plays event by event, or 'polars' to flatten them with vectorized Polars expressions. Both return the same columns and dtypes (PITCH_SCHEMA). Default is 'python'.
+        - columns (list): The PITCH_SCHEMA columns to build. Only the parts of each play those columns come from are read, so asking for
+          a handful of columns skips most of the parsing work. Default is None (every column).
+        - compact_dtypes (bool): Return the memory-compact dtypes of compact_pitch_schema (categorical strings, small integers)
+          instead of PITCH_SCHEMA. See pitch_memory_report for the saving. Default is False.
+        - float32 (bool): With compact_dtypes, also store the tracking columns as Float32. Default is False.
+        - normalized (bool): Return the games, plate appearances, pitches and batted balls as separate tables linked by integer keys,
+          see normalize_pitch_frame. join_pitch_tables rebuilds the wide frame. Needs every column. Default is False.
         
         Returns:
         - data_df (pl.DataFrame): A DataFrame containing the structured game data.
+          With normalized, a dict of table name -> pl.DataFrame instead.
+        """
+        if normalized and columns is not None:
+            raise ValueError("normalized output needs every column, leave columns as None.")
+        print('Converting Data to Dataframe.')
+        df = self._data_df(data_list, engine, columns, compact_dtypes, float32)
+        return normalize_pitch_frame(df) if normalized else df
+
+    def _data_df(self, data_list, engine, columns=None, compact_dtypes=False, float32=False):
+        # Dispatches to the parsing engine
+        if engine == 'polars':
+            df = self._get_data_df_polars(data_list, columns)
+        elif engine == 'python':
+            df = self._get_data_df_python(data_list, columns)
+        else:
+            raise ValueError("engine must be 'python' or 'polars'.")
+        return compact_pitch_frame(df, float32) if compact_dtypes else df
+
+    def _get_data_df_python(self, data_list, columns=None):
         """
+        Walks the plays of every game event by event, building one list per column.
+        
+        Parameters:
+        - data_list (list): A list of JSON objects containing game data.
+        - columns (list): The PITCH_SCHEMA columns to build. Default is None (every column).
+        
+        Returns:
+        - data_df (pl.DataFrame): A DataFrame containing the structured game data.
+        """
+        # Only the column groups in the projection are read from each event
+        keep, want = _column_projection(columns)
         swing_list = ['X','F','S','D','E','T','W']
         whiff_list = ['S','T','W']
-        print('Converting Data to Dataframe.')
         game_id = []
         game_date = []
         batter_id = []
@@ -265,119 +2977,283 @@ class MLB_Scrape:
             
                     
                     if ab_list['playEvents'][n]['isPitch'] == True or 'call' in ab_list['playEvents'][n]['details']:
-                        ab_number.append(ab_list['atBatIndex'] if 'atBatIndex' in ab_list else None)
-
-                        game_id.append(data['gamePk'])
-                        game_date.append(data['gameData']['datetime']['officialDate'])
-                        if 'matchup' in ab_list:
-                          batter_id.append(ab_list['matchup']['batter']['id'] if 'batter' in ab_list['matchup'] else None)
-                          if 'batter' in ab_list['matchup']:
-                            batter_name.append(ab_list['matchup']['batter']['fullName'] if 'fullName' in ab_list['matchup']['batter'] else None)
-                          else:
-                            batter_name.append(None)
-
-                          batter_hand.append(ab_list['matchup']['batSide']['code'] if 'batSide' in ab_list['matchup'] else None)
-                          pitcher_id.append(ab_list['matchup']['pitcher']['id'] if 'pitcher' in ab_list['matchup'] else None)
-                          if 'pitcher' in ab_list['matchup']:
-                            pitcher_name.append(ab_list['matchup']['pitcher']['fullName'] if 'fullName' in ab_list['matchup']['pitcher'] else None)
-                          else:
-                            pitcher_name.append(None)
+                        if want['event']:
+                            ab_number.append(ab_list['atBatIndex'] if 'atBatIndex' in ab_list else None)
+
+                        if want['game']:
+                            game_id.append(data['gamePk'])
+                            game_date.append(data['gameData']['datetime']['officialDate'])
+                        if want['matchup']:
+                            if 'matchup' in ab_list:
+                              batter_id.append(ab_list['matchup']['batter']['id'] if 'batter' in ab_list['matchup'] else None)
+                              if 'batter' in ab_list['matchup']:
+                                batter_name.append(ab_list['matchup']['batter']['fullName'] if 'fullName' in ab_list['matchup']['batter'] else None)
+                              else:
+                                batter_name.append(None)
+
+                              batter_hand.append(ab_list['matchup']['batSide']['code'] if 'batSide' in ab_list['matchup'] else None)
+                              pitcher_id.append(ab_list['matchup']['pitcher']['id'] if 'pitcher' in ab_list['matchup'] else None)
+                              if 'pitcher' in ab_list['matchup']:
+                                pitcher_name.append(ab_list['matchup']['pitcher']['fullName'] if 'fullName' in ab_list['matchup']['pitcher'] else None)
+                              else:
+                                pitcher_name.append(None)
                         
-                          pitcher_hand.append(ab_list['matchup']['pitchHand']['code'] if 'pitchHand' in ab_list['matchup'] else None)
-
-
-                        if ab_list['about']['isTopInning']:
-                            batter_team.append(data['gameData']['teams']['away']['abbreviation'] if 'away' in data['gameData']['teams'] else None)
-                            batter_team_id.append(data['gameData']['teams']['away']['id'] if 'away' in data['gameData']['teams'] else None)
-                            pitcher_team.append(data['gameData']['teams']['home']['abbreviation'] if 'home' in data['gameData']['teams'] else None)
-                            pitcher_team_id.append(data['gameData']['teams']['home']['id'] if 'home' in data['gameData']['teams'] else None)
-
-                        else:
-                            batter_team.append(data['gameData']['teams']['home']['abbreviation'] if 'home' in data['gameData']['teams'] else None)
-                            batter_team_id.append(data['gameData']['teams']['home']['id'] if 'home' in data['gameData']['teams'] else None)
-                            pitcher_team.append(data['gameData']['teams']['away']['abbreviation'] if 'away' in data['gameData']['teams'] else None)
-                            pitcher_team_id.append(data['gameData']['teams']['away']['id'] if 'away' in data['gameData']['teams'] else None)
-
-                        play_description.append(ab_list['playEvents'][n]['details']['description'] if 'description' in ab_list['playEvents'][n]['details'] else None)
-                        play_code.append(ab_list['playEvents'][n]['details']['code'] if 'code' in ab_list['playEvents'][n]['details'] else None)
-                        in_play.append(ab_list['playEvents'][n]['details']['isInPlay'] if 'isInPlay' in ab_list['playEvents'][n]['details'] else None)
-                        is_strike.append(ab_list['playEvents'][n]['details']['isStrike'] if 'isStrike' in ab_list['playEvents'][n]['details'] else None)
-
-                        if 'details' in ab_list['playEvents'][n]:
-                            is_swing.append(True if ab_list['playEvents'][n]['details']['code'] in swing_list else None)
-                            is_whiff.append(True if ab_list['playEvents'][n]['details']['code'] in whiff_list else None)
-                        else:
-                            is_swing.append(None)
-                            is_whiff.append(None)
-
-                        is_ball.append(ab_list['playEvents'][n]['details']['isOut'] if 'isOut' in ab_list['playEvents'][n]['details'] else None)
-                        is_review.append(ab_list['playEvents'][n]['details']['hasReview'] if 'hasReview' in ab_list['playEvents'][n]['details'] else None)
-                        pitch_type.append(ab_list['playEvents'][n]['details']['type']['code'] if 'type' in ab_list['playEvents'][n]['details'] else None)
-                        pitch_description.append(ab_list['playEvents'][n]['details']['type']['description'] if 'type' in ab_list['playEvents'][n]['details'] else None)
+                              pitcher_hand.append(ab_list['matchup']['pitchHand']['code'] if 'pitchHand' in ab_list['matchup'] else None)
+                            else:
+                              batter_id.append(None)
+                              batter_name.append(None)
+                              batter_hand.append(None)
+                              pitcher_id.append(None)
+                              pitcher_name.append(None)
+                              pitcher_hand.append(None)
+
+
+                        if want['teams']:
+                            if ab_list['about']['isTopInning']:
+                                batter_team.append(data['gameData']['teams']['away']['abbreviation'] if 'away' in data['gameData']['teams'] else None)
+                                batter_team_id.append(data['gameData']['teams']['away']['id'] if 'away' in data['gameData']['teams'] else None)
+                                pitcher_team.append(data['gameData']['teams']['home']['abbreviation'] if 'home' in data['gameData']['teams'] else None)
+                                pitcher_team_id.append(data['gameData']['teams']['home']['id'] if 'home' in data['gameData']['teams'] else None)
+
+                            else:
+                                batter_team.append(data['gameData']['teams']['home']['abbreviation'] if 'home' in data['gameData']['teams'] else None)
+                                batter_team_id.append(data['gameData']['teams']['home']['id'] if 'home' in data['gameData']['teams'] else None)
+                                pitcher_team.append(data['gameData']['teams']['away']['abbreviation'] if 'away' in data['gameData']['teams'] else None)
+                                pitcher_team_id.append(data['gameData']['teams']['away']['id'] if 'away' in data['gameData']['teams'] else None)
+
+                        if want['details']:
+                            play_description.append(ab_list['playEvents'][n]['details']['description'] if 'description' in ab_list['playEvents'][n]['details'] else None)
+                            play_code.append(ab_list['playEvents'][n]['details']['code'] if 'code' in ab_list['playEvents'][n]['details'] else None)
+                            in_play.append(ab_list['playEvents'][n]['details']['isInPlay'] if 'isInPlay' in ab_list['playEvents'][n]['details'] else None)
+                            is_strike.append(ab_list['playEvents'][n]['details']['isStrike'] if 'isStrike' in ab_list['playEvents'][n]['details'] else None)
+
+                            if 'details' in ab_list['playEvents'][n]:
+                                is_swing.append(True if ab_list['playEvents'][n]['details']['code'] in swing_list else None)
+                                is_whiff.append(True if ab_list['playEvents'][n]['details']['code'] in whiff_list else None)
+                            else:
+                                is_swing.append(None)
+                                is_whiff.append(None)
+
+                            is_ball.append(ab_list['playEvents'][n]['details']['isOut'] if 'isOut' in ab_list['playEvents'][n]['details'] else None)
+                            is_review.append(ab_list['playEvents'][n]['details']['hasReview'] if 'hasReview' in ab_list['playEvents'][n]['details'] else None)
+                            pitch_type.append(ab_list['playEvents'][n]['details']['type']['code'] if 'type' in ab_list['playEvents'][n]['details'] else None)
+                            pitch_description.append(ab_list['playEvents'][n]['details']['type']['description'] if 'type' in ab_list['playEvents'][n]['details'] else None)
+
+                        if want['count']:
+                            if ab_list['playEvents'][n]['pitchNumber'] == 1:
+                                strikes.append(0)
+                                balls.append(0)
+                                strikes_after.append(ab_list['playEvents'][n]['count']['strikes'] if 'strikes' in ab_list['playEvents'][n]['count'] else None)
+                                balls_after.append(ab_list['playEvents'][n]['count']['balls'] if 'balls' in ab_list['playEvents'][n]['count'] else None)
+                                outs.append(ab_list['playEvents'][n]['count']['outs'] if 'outs' in ab_list['playEvents'][n]['count'] else None)
+                                outs_after.append(ab_list['playEvents'][n]['count']['outs'] if 'outs' in ab_list['playEvents'][n]['count'] else None)
+
+                            else:
+                                strikes.append(ab_list['playEvents'][n-1]['count']['strikes'] if 'strikes' in ab_list['playEvents'][n-1]['count'] else None)
+                                balls.append(ab_list['playEvents'][n-1]['count']['balls'] if 'balls' in ab_list['playEvents'][n-1]['count'] else None)
+                                outs.append(ab_list['playEvents'][n-1]['count']['outs'] if 'outs' in ab_list['playEvents'][n-1]['count'] else None)
+
+                                strikes_after.append(ab_list['playEvents'][n]['count']['strikes'] if 'strikes' in ab_list['playEvents'][n]['count'] else None)
+                                balls_after.append(ab_list['playEvents'][n]['count']['balls'] if 'balls' in ab_list['playEvents'][n]['count'] else None)
+                                outs_after.append(ab_list['playEvents'][n]['count']['outs'] if 'outs' in ab_list['playEvents'][n]['count'] else None)
+
+
+                        if want['pitch_data']:
+                            if 'pitchData' in ab_list['playEvents'][n]:
+
+                                start_speed.append(ab_list['playEvents'][n]['pitchData']['startSpeed'] if 'startSpeed' in ab_list['playEvents'][n]['pitchData'] else None)
+                                end_speed.append(ab_list['playEvents'][n]['pitchData']['endSpeed'] if 'endSpeed' in ab_list['playEvents'][n]['pitchData'] else None)
+
+                                sz_top.append(ab_list['playEvents'][n]['pitchData']['strikeZoneTop'] if 'strikeZoneTop' in ab_list['playEvents'][n]['pitchData'] else None)
+                                sz_bot.append(ab_list['playEvents'][n]['pitchData']['strikeZoneBottom'] if 'strikeZoneBottom' in ab_list['playEvents'][n]['pitchData'] else None)
+                                x.append(ab_list['playEvents'][n]['pitchData']['coordinates']['x'] if 'x' in ab_list['playEvents'][n]['pitchData']['coordinates'] else None)
+                                y.append(ab_list['playEvents'][n]['pitchData']['coordinates']['y'] if 'y' in ab_list['playEvents'][n]['pitchData']['coordinates'] else None)
+
+                                ax.append(ab_list['playEvents'][n]['pitchData']['coordinates']['aX'] if 'aX' in ab_list['playEvents'][n]['pitchData']['coordinates'] else None)
+                                ay.append(ab_list['playEvents'][n]['pitchData']['coordinates']['aY'] if 'aY' in ab_list['playEvents'][n]['pitchData']['coordinates'] else None)
+                                az.append(ab_list['playEvents'][n]['pitchData']['coordinates']['aZ'] if 'aZ' in ab_list['playEvents'][n]['pitchData']['coordinates'] else None)
+                                pfxx.append(ab_list['playEvents'][n]['pitchData']['coordinates']['pfxX'] if 'pfxX' in ab_list['playEvents'][n]['pitchData']['coordinates'] else None)
+                                pfxz.append(ab_list['playEvents'][n]['pitchData']['coordinates']['pfxZ'] if 'pfxZ' in ab_list['playEvents'][n]['pitchData']['coordinates'] else None)
+                                px.append(ab_list['playEvents'][n]['pitchData']['coordinates']['pX'] if 'pX' in ab_list['playEvents'][n]['pitchData']['coordinates'] else None)
+                                pz.append(ab_list['playEvents'][n]['pitchData']['coordinates']['pZ'] if 'pZ' in ab_list['playEvents'][n]['pitchData']['coordinates'] else None)
+                                vx0.append(ab_list['playEvents'][n]['pitchData']['coordinates']['vX0'] if 'vX0' in ab_list['playEvents'][n]['pitchData']['coordinates'] else None)
+                                vy0.append(ab_list['playEvents'][n]['pitchData']['coordinates']['vY0'] if 'vY0' in ab_list['playEvents'][n]['pitchData']['coordinates'] else None)
+                                vz0.append(ab_list['playEvents'][n]['pitchData']['coordinates']['vZ0'] if 'vZ0' in ab_list['playEvents'][n]['pitchData']['coordinates'] else None)
+                                x0.append(ab_list['playEvents'][n]['pitchData']['coordinates']['x0'] if 'x0' in ab_list['playEvents'][n]['pitchData']['coordinates'] else None)
+                                y0.append(ab_list['playEvents'][n]['pitchData']['coordinates']['y0'] if 'y0' in ab_list['playEvents'][n]['pitchData']['coordinates'] else None)
+                                z0.append(ab_list['playEvents'][n]['pitchData']['coordinates']['z0'] if 'z0' in ab_list['playEvents'][n]['pitchData']['coordinates'] else None)
+
+                                zone.append(ab_list['playEvents'][n]['pitchData']['zone'] if 'zone' in ab_list['playEvents'][n]['pitchData'] else None)
+                                type_confidence.append(ab_list['playEvents'][n]['pitchData']['typeConfidence'] if 'typeConfidence' in ab_list['playEvents'][n]['pitchData'] else None)
+                                plate_time.append(ab_list['playEvents'][n]['pitchData']['plateTime'] if 'plateTime' in ab_list['playEvents'][n]['pitchData'] else None)
+                                extension.append(ab_list['playEvents'][n]['pitchData']['extension'] if 'extension' in ab_list['playEvents'][n]['pitchData'] else None)
+
+                                if 'breaks' in ab_list['playEvents'][n]['pitchData']:
+                                    spin_rate.append(ab_list['playEvents'][n]['pitchData']['breaks']['spinRate'] if 'spinRate' in ab_list['playEvents'][n]['pitchData']['breaks'] else None)
+                                    spin_direction.append(ab_list['playEvents'][n]['pitchData']['breaks']['spinDirection'] if 'spinDirection' in ab_list['playEvents'][n]['pitchData']['breaks'] else None)
+                                    vb.append(ab_list['playEvents'][n]['pitchData']['breaks']['breakVertical'] if 'breakVertical' in ab_list['playEvents'][n]['pitchData']['breaks'] else None)                               
+                                    ivb.append(ab_list['playEvents'][n]['pitchData']['breaks']['breakVerticalInduced'] if 'breakVerticalInduced' in ab_list['playEvents'][n]['pitchData']['breaks'] else None)
+                                    hb.append(ab_list['playEvents'][n]['pitchData']['breaks']['breakHorizontal'] if 'breakHorizontal' in ab_list['playEvents'][n]['pitchData']['breaks'] else None)
+                                else:
+                                    spin_rate.append(None)
+                                    spin_direction.append(None)
+                                    vb.append(None)
+                                    ivb.append(None)
+                                    hb.append(None)
+
+                            else:
+                                start_speed.append(None)
+                                end_speed.append(None)
+
+                                sz_top.append(None)
+                                sz_bot.append(None)
+                                x.append(None)
+                                y.append(None)
+
+                                ax.append(None)
+                                ay.append(None)
+                                az.append(None)
+                                pfxx.append(None)
+                                pfxz.append(None)
+                                px.append(None)
+                                pz.append(None)
+                                vx0.append(None)
+                                vy0.append(None)
+                                vz0.append(None)
+                                x0.append(None)
+                                y0.append(None)
+                                z0.append(None)
+
+                                zone.append(None)
+                                type_confidence.append(None)
+                                plate_time.append(None)
+                                extension.append(None)
+                                spin_rate.append(None)
+                                spin_direction.append(None)
+                                vb.append(None)
+                                ivb.append(None)
+                                hb.append(None)
+
+                        if want['hit_data']:
+                            if 'hitData' in ab_list['playEvents'][n]:
+                                launch_speed.append(ab_list['playEvents'][n]['hitData']['launchSpeed'] if 'launchSpeed' in ab_list['playEvents'][n]['hitData'] else None)
+                                launch_angle.append(ab_list['playEvents'][n]['hitData']['launchAngle'] if 'launchAngle' in ab_list['playEvents'][n]['hitData'] else None)
+                                launch_distance.append(ab_list['playEvents'][n]['hitData']['totalDistance'] if 'totalDistance' in ab_list['playEvents'][n]['hitData'] else None)
+                                launch_location.append(ab_list['playEvents'][n]['hitData']['location'] if 'location' in ab_list['playEvents'][n]['hitData'] else None)
+
+                                trajectory.append(ab_list['playEvents'][n]['hitData']['trajectory'] if 'trajectory' in ab_list['playEvents'][n]['hitData'] else None)
+                                hardness.append(ab_list['playEvents'][n]['hitData']['hardness'] if 'hardness' in ab_list['playEvents'][n]['hitData'] else None)
+                                hit_x.append(ab_list['playEvents'][n]['hitData']['coordinates']['coordX'] if 'coordX' in ab_list['playEvents'][n]['hitData']['coordinates'] else None)
+                                hit_y.append(ab_list['playEvents'][n]['hitData']['coordinates']['coordY'] if 'coordY' in ab_list['playEvents'][n]['hitData']['coordinates'] else None)
+                            else:
+                                launch_speed.append(None)
+                                launch_angle.append(None)
+                                launch_distance.append(None)
+                                launch_location.append(None)
+                                trajectory.append(None)
+                                hardness.append(None)
+                                hit_x.append(None)
+                                hit_y.append(None)
+
+                        if want['event']:
+                            index_play.append(ab_list['playEvents'][n]['index'] if 'index' in ab_list['playEvents'][n] else None)
+                            play_id.append(ab_list['playEvents'][n]['playId'] if 'playId' in ab_list['playEvents'][n] else None)
+                            start_time.append(ab_list['playEvents'][n]['startTime'] if 'startTime' in ab_list['playEvents'][n] else None)
+                            end_time.append(ab_list['playEvents'][n]['endTime'] if 'endTime' in ab_list['playEvents'][n] else None)
+                            is_pitch.append(ab_list['playEvents'][n]['isPitch'] if 'isPitch' in ab_list['playEvents'][n] else None)
+                            type_type.append(ab_list['playEvents'][n]['type'] if 'type' in ab_list['playEvents'][n] else None)
+
+
+
+                        if want['result']:
+                            if n == len(ab_list['playEvents']) - 1 :
+
+                                type_ab.append(data['liveData']['plays']['allPlays'][ab_id]['result']['type'] if 'type' in data['liveData']['plays']['allPlays'][ab_id]['result'] else None)
+                                event.append(data['liveData']['plays']['allPlays'][ab_id]['result']['event'] if 'event' in data['liveData']['plays']['allPlays'][ab_id]['result'] else None)
+                                event_type.append(data['liveData']['plays']['allPlays'][ab_id]['result']['eventType'] if 'eventType' in data['liveData']['plays']['allPlays'][ab_id]['result'] else None)
+                                rbi.append(data['liveData']['plays']['allPlays'][ab_id]['result']['rbi'] if 'rbi' in data['liveData']['plays']['allPlays'][ab_id]['result'] else None)
+                                away_score.append(data['liveData']['plays']['allPlays'][ab_id]['result']['awayScore'] if 'awayScore' in data['liveData']['plays']['allPlays'][ab_id]['result'] else None)
+                                home_score.append(data['liveData']['plays']['allPlays'][ab_id]['result']['homeScore'] if 'homeScore' in data['liveData']['plays']['allPlays'][ab_id]['result'] else None)
+                                is_out.append(data['liveData']['plays']['allPlays'][ab_id]['result']['isOut'] if 'isOut' in data['liveData']['plays']['allPlays'][ab_id]['result'] else None)
+
+                            else:
+
+                                type_ab.append(None)
+                                event.append(None)
+                                event_type.append(None)
+                                rbi.append(None)
+                                away_score.append(None)
+                                home_score.append(None)
+                                is_out.append(None)
 
-                        if ab_list['playEvents'][n]['pitchNumber'] == 1:
-                            strikes.append(0)
-                            balls.append(0)
-                            strikes_after.append(ab_list['playEvents'][n]['count']['strikes'] if 'strikes' in ab_list['playEvents'][n]['count'] else None)
-                            balls_after.append(ab_list['playEvents'][n]['count']['balls'] if 'balls' in ab_list['playEvents'][n]['count'] else None)
-                            outs.append(ab_list['playEvents'][n]['count']['outs'] if 'outs' in ab_list['playEvents'][n]['count'] else None)
-                            outs_after.append(ab_list['playEvents'][n]['count']['outs'] if 'outs' in ab_list['playEvents'][n]['count'] else None)
+                    elif ab_list['playEvents'][n]['count']['balls'] == 4:
 
-                        else:
-                            strikes.append(ab_list['playEvents'][n-1]['count']['strikes'] if 'strikes' in ab_list['playEvents'][n-1]['count'] else None)
-                            balls.append(ab_list['playEvents'][n-1]['count']['balls'] if 'balls' in ab_list['playEvents'][n-1]['count'] else None)
-                            outs.append(ab_list['playEvents'][n-1]['count']['outs'] if 'outs' in ab_list['playEvents'][n-1]['count'] else None)
+                        if want['result']:
+                            event.append(data['liveData']['plays']['allPlays'][ab_id]['result']['event'])
+                            event_type.append(data['liveData']['plays']['allPlays'][ab_id]['result']['eventType'])
+                            type_ab.append(None)
+                            rbi.append(None)
+                            away_score.append(None)
+                            home_score.append(None)
+                            is_out.append(None)
 
-                            strikes_after.append(ab_list['playEvents'][n]['count']['strikes'] if 'strikes' in ab_list['playEvents'][n]['count'] else None)
-                            balls_after.append(ab_list['playEvents'][n]['count']['balls'] if 'balls' in ab_list['playEvents'][n]['count'] else None)
+                        if want['game']:
+                            game_id.append(data['gamePk'])
+                            game_date.append(data['gameData']['datetime']['officialDate'])
+                        if want['matchup']:
+                            matchup = ab_list['matchup'] if 'matchup' in ab_list else {}
+                            batter_id.append(matchup['batter']['id'] if 'batter' in matchup else None)
+                            batter_name.append(matchup['batter']['fullName'] if 'batter' in matchup else None)
+                            batter_hand.append(matchup['batSide']['code'] if 'batSide' in matchup else None)
+                            pitcher_id.append(matchup['pitcher']['id'] if 'pitcher' in matchup else None)
+                            pitcher_name.append(matchup['pitcher']['fullName'] if 'pitcher' in matchup else None)
+                            pitcher_hand.append(matchup['pitchHand']['code'] if 'pitchHand' in matchup else None)
+                        if want['teams']:
+                            if ab_list['about']['isTopInning']:
+                                batter_team.append(data['gameData']['teams']['away']['abbreviation'] if 'away' in data['gameData']['teams'] else None)
+                                batter_team_id.append(data['gameData']['teams']['away']['id'] if 'away' in data['gameData']['teams'] else None)
+                                pitcher_team.append(data['gameData']['teams']['home']['abbreviation'] if 'home' in data['gameData']['teams'] else None)
+                                pitcher_team_id.append(data['gameData']['teams']['away']['id'] if 'away' in data['gameData']['teams'] else None)
+                            else:
+                                batter_team.append(data['gameData']['teams']['home']['abbreviation'] if 'home' in data['gameData']['teams'] else None)
+                                batter_team_id.append(data['gameData']['teams']['home']['id'] if 'home' in data['gameData']['teams'] else None)
+                                pitcher_team.append(data['gameData']['teams']['away']['abbreviation'] if 'away' in data['gameData']['teams'] else None)
+                                pitcher_team_id.append(data['gameData']['teams']['home']['id'] if 'home' in data['gameData']['teams'] else None)
+
+                        if want['details']:
+                            play_description.append(None)
+                            play_code.append(None)
+                            in_play.append(None)
+                            is_strike.append(None)
+                            is_swing.append(None)
+                            is_whiff.append(None)
+                            is_ball.append(None)
+                            is_review.append(None)
+                            pitch_type.append(None)
+                            pitch_description.append(None)
+                        if want['count']:
+                            strikes.append(ab_list['playEvents'][n]['count']['balls'] if 'balls' in ab_list['playEvents'][n]['count'] else None)
+                            balls.append(ab_list['playEvents'][n]['count']['strikes'] if 'strikes' in ab_list['playEvents'][n]['count'] else None)
+                            outs.append(ab_list['playEvents'][n]['count']['outs'] if 'outs' in ab_list['playEvents'][n]['count'] else None)
+                            strikes_after.append(ab_list['playEvents'][n]['count']['balls'] if 'balls' in ab_list['playEvents'][n]['count'] else None)
+                            balls_after.append(ab_list['playEvents'][n]['count']['strikes'] if 'strikes' in ab_list['playEvents'][n]['count'] else None)
                             outs_after.append(ab_list['playEvents'][n]['count']['outs'] if 'outs' in ab_list['playEvents'][n]['count'] else None)
-
-
-                        if 'pitchData' in ab_list['playEvents'][n]:
-
-                            start_speed.append(ab_list['playEvents'][n]['pitchData']['startSpeed'] if 'startSpeed' in ab_list['playEvents'][n]['pitchData'] else None)
-                            end_speed.append(ab_list['playEvents'][n]['pitchData']['endSpeed'] if 'endSpeed' in ab_list['playEvents'][n]['pitchData'] else None)
-
-                            sz_top.append(ab_list['playEvents'][n]['pitchData']['strikeZoneTop'] if 'strikeZoneTop' in ab_list['playEvents'][n]['pitchData'] else None)
-                            sz_bot.append(ab_list['playEvents'][n]['pitchData']['strikeZoneBottom'] if 'strikeZoneBottom' in ab_list['playEvents'][n]['pitchData'] else None)
-                            x.append(ab_list['playEvents'][n]['pitchData']['coordinates']['x'] if 'x' in ab_list['playEvents'][n]['pitchData']['coordinates'] else None)
-                            y.append(ab_list['playEvents'][n]['pitchData']['coordinates']['y'] if 'y' in ab_list['playEvents'][n]['pitchData']['coordinates'] else None)
-
-                            ax.append(ab_list['playEvents'][n]['pitchData']['coordinates']['aX'] if 'aX' in ab_list['playEvents'][n]['pitchData']['coordinates'] else None)
-                            ay.append(ab_list['playEvents'][n]['pitchData']['coordinates']['aY'] if 'aY' in ab_list['playEvents'][n]['pitchData']['coordinates'] else None)
-                            az.append(ab_list['playEvents'][n]['pitchData']['coordinates']['aZ'] if 'aZ' in ab_list['playEvents'][n]['pitchData']['coordinates'] else None)
-                            pfxx.append(ab_list['playEvents'][n]['pitchData']['coordinates']['pfxX'] if 'pfxX' in ab_list['playEvents'][n]['pitchData']['coordinates'] else None)
-                            pfxz.append(ab_list['playEvents'][n]['pitchData']['coordinates']['pfxZ'] if 'pfxZ' in ab_list['playEvents'][n]['pitchData']['coordinates'] else None)
-                            px.append(ab_list['playEvents'][n]['pitchData']['coordinates']['pX'] if 'pX' in ab_list['playEvents'][n]['pitchData']['coordinates'] else None)
-                            pz.append(ab_list['playEvents'][n]['pitchData']['coordinates']['pZ'] if 'pZ' in ab_list['playEvents'][n]['pitchData']['coordinates'] else None)
-                            vx0.append(ab_list['playEvents'][n]['pitchData']['coordinates']['vX0'] if 'vX0' in ab_list['playEvents'][n]['pitchData']['coordinates'] else None)
-                            vy0.append(ab_list['playEvents'][n]['pitchData']['coordinates']['vY0'] if 'vY0' in ab_list['playEvents'][n]['pitchData']['coordinates'] else None)
-                            vz0.append(ab_list['playEvents'][n]['pitchData']['coordinates']['vZ0'] if 'vZ0' in ab_list['playEvents'][n]['pitchData']['coordinates'] else None)
-                            x0.append(ab_list['playEvents'][n]['pitchData']['coordinates']['x0'] if 'x0' in ab_list['playEvents'][n]['pitchData']['coordinates'] else None)
-                            y0.append(ab_list['playEvents'][n]['pitchData']['coordinates']['y0'] if 'y0' in ab_list['playEvents'][n]['pitchData']['coordinates'] else None)
-                            z0.append(ab_list['playEvents'][n]['pitchData']['coordinates']['z0'] if 'z0' in ab_list['playEvents'][n]['pitchData']['coordinates'] else None)
-
-                            zone.append(ab_list['playEvents'][n]['pitchData']['zone'] if 'zone' in ab_list['playEvents'][n]['pitchData'] else None)
-                            type_confidence.append(ab_list['playEvents'][n]['pitchData']['typeConfidence'] if 'typeConfidence' in ab_list['playEvents'][n]['pitchData'] else None)
-                            plate_time.append(ab_list['playEvents'][n]['pitchData']['plateTime'] if 'plateTime' in ab_list['playEvents'][n]['pitchData'] else None)
-                            extension.append(ab_list['playEvents'][n]['pitchData']['extension'] if 'extension' in ab_list['playEvents'][n]['pitchData'] else None)
-
-                            if 'breaks' in ab_list['playEvents'][n]['pitchData']:
-                                spin_rate.append(ab_list['playEvents'][n]['pitchData']['breaks']['spinRate'] if 'spinRate' in ab_list['playEvents'][n]['pitchData']['breaks'] else None)
-                                spin_direction.append(ab_list['playEvents'][n]['pitchData']['breaks']['spinDirection'] if 'spinDirection' in ab_list['playEvents'][n]['pitchData']['breaks'] else None)
-                                vb.append(ab_list['playEvents'][n]['pitchData']['breaks']['breakVertical'] if 'breakVertical' in ab_list['playEvents'][n]['pitchData']['breaks'] else None)                               
-                                ivb.append(ab_list['playEvents'][n]['pitchData']['breaks']['breakVerticalInduced'] if 'breakVerticalInduced' in ab_list['playEvents'][n]['pitchData']['breaks'] else None)
-                                hb.append(ab_list['playEvents'][n]['pitchData']['breaks']['breakHorizontal'] if 'breakHorizontal' in ab_list['playEvents'][n]['pitchData']['breaks'] else None)
-
-                        else:
+                        if want['event']:
+                            ab_number.append(None)
+                            index_play.append(ab_list['playEvents'][n]['index'] if 'index' in ab_list['playEvents'][n] else None)
+                            play_id.append(ab_list['playEvents'][n]['playId'] if 'playId' in ab_list['playEvents'][n] else None)
+                            start_time.append(ab_list['playEvents'][n]['startTime'] if 'startTime' in ab_list['playEvents'][n] else None)
+                            end_time.append(ab_list['playEvents'][n]['endTime'] if 'endTime' in ab_list['playEvents'][n] else None)
+                            is_pitch.append(ab_list['playEvents'][n]['isPitch'] if 'isPitch' in ab_list['playEvents'][n] else None)
+                            type_type.append(ab_list['playEvents'][n]['type'] if 'type' in ab_list['playEvents'][n] else None)
+
+                        if want['pitch_data']:
                             start_speed.append(None)
                             end_speed.append(None)
-
                             sz_top.append(None)
                             sz_bot.append(None)
                             x.append(None)
                             y.append(None)
-
                             ax.append(None)
                             ay.append(None)
                             az.append(None)
@@ -391,7 +3267,6 @@ class MLB_Scrape:
                             x0.append(None)
                             y0.append(None)
                             z0.append(None)
-
                             zone.append(None)
                             type_confidence.append(None)
                             plate_time.append(None)
@@ -401,18 +3276,7 @@ class MLB_Scrape:
                             vb.append(None)
                             ivb.append(None)
                             hb.append(None)
-
-                        if 'hitData' in ab_list['playEvents'][n]:
-                            launch_speed.append(ab_list['playEvents'][n]['hitData']['launchSpeed'] if 'launchSpeed' in ab_list['playEvents'][n]['hitData'] else None)
-                            launch_angle.append(ab_list['playEvents'][n]['hitData']['launchAngle'] if 'launchAngle' in ab_list['playEvents'][n]['hitData'] else None)
-                            launch_distance.append(ab_list['playEvents'][n]['hitData']['totalDistance'] if 'totalDistance' in ab_list['playEvents'][n]['hitData'] else None)
-                            launch_location.append(ab_list['playEvents'][n]['hitData']['location'] if 'location' in ab_list['playEvents'][n]['hitData'] else None)
-
-                            trajectory.append(ab_list['playEvents'][n]['hitData']['trajectory'] if 'trajectory' in ab_list['playEvents'][n]['hitData'] else None)
-                            hardness.append(ab_list['playEvents'][n]['hitData']['hardness'] if 'hardness' in ab_list['playEvents'][n]['hitData'] else None)
-                            hit_x.append(ab_list['playEvents'][n]['hitData']['coordinates']['coordX'] if 'coordX' in ab_list['playEvents'][n]['hitData']['coordinates'] else None)
-                            hit_y.append(ab_list['playEvents'][n]['hitData']['coordinates']['coordY'] if 'coordY' in ab_list['playEvents'][n]['hitData']['coordinates'] else None)
-                        else:
+                        if want['hit_data']:
                             launch_speed.append(None)
                             launch_angle.append(None)
                             launch_distance.append(None)
@@ -421,129 +3285,6 @@ class MLB_Scrape:
                             hardness.append(None)
                             hit_x.append(None)
                             hit_y.append(None)
-
-                        index_play.append(ab_list['playEvents'][n]['index'] if 'index' in ab_list['playEvents'][n] else None)
-                        play_id.append(ab_list['playEvents'][n]['playId'] if 'playId' in ab_list['playEvents'][n] else None)
-                        start_time.append(ab_list['playEvents'][n]['startTime'] if 'startTime' in ab_list['playEvents'][n] else None)
-                        end_time.append(ab_list['playEvents'][n]['endTime'] if 'endTime' in ab_list['playEvents'][n] else None)
-                        is_pitch.append(ab_list['playEvents'][n]['isPitch'] if 'isPitch' in ab_list['playEvents'][n] else None)
-                        type_type.append(ab_list['playEvents'][n]['type'] if 'type' in ab_list['playEvents'][n] else None)
-
-
-
-                        if n == len(ab_list['playEvents']) - 1 :
-
-                            type_ab.append(data['liveData']['plays']['allPlays'][ab_id]['result']['type'] if 'type' in data['liveData']['plays']['allPlays'][ab_id]['result'] else None)
-                            event.append(data['liveData']['plays']['allPlays'][ab_id]['result']['event'] if 'event' in data['liveData']['plays']['allPlays'][ab_id]['result'] else None)
-                            event_type.append(data['liveData']['plays']['allPlays'][ab_id]['result']['eventType'] if 'eventType' in data['liveData']['plays']['allPlays'][ab_id]['result'] else None)
-                            rbi.append(data['liveData']['plays']['allPlays'][ab_id]['result']['rbi'] if 'rbi' in data['liveData']['plays']['allPlays'][ab_id]['result'] else None)
-                            away_score.append(data['liveData']['plays']['allPlays'][ab_id]['result']['awayScore'] if 'awayScore' in data['liveData']['plays']['allPlays'][ab_id]['result'] else None)
-                            home_score.append(data['liveData']['plays']['allPlays'][ab_id]['result']['homeScore'] if 'homeScore' in data['liveData']['plays']['allPlays'][ab_id]['result'] else None)
-                            is_out.append(data['liveData']['plays']['allPlays'][ab_id]['result']['isOut'] if 'isOut' in data['liveData']['plays']['allPlays'][ab_id]['result'] else None)
-
-                        else:
-
-                            type_ab.append(None)
-                            event.append(None)
-                            event_type.append(None)
-                            rbi.append(None)
-                            away_score.append(None)
-                            home_score.append(None)
-                            is_out.append(None)
-
-                    elif ab_list['playEvents'][n]['count']['balls'] == 4:
-
-                        event.append(data['liveData']['plays']['allPlays'][ab_id]['result']['event'])
-                        event_type.append(data['liveData']['plays']['allPlays'][ab_id]['result']['eventType'])
-
-
-                        game_id.append(data['gamePk'])
-                        game_date.append(data['gameData']['datetime']['officialDate'])
-                        batter_id.append(ab_list['matchup']['batter']['id'] if 'batter' in ab_list['matchup'] else None)
-                        batter_name.append(ab_list['matchup']['batter']['fullName'] if 'batter' in ab_list['matchup'] else None)
-                        batter_hand.append(ab_list['matchup']['batSide']['code'] if 'batSide' in ab_list['matchup'] else None)
-                        pitcher_id.append(ab_list['matchup']['pitcher']['id'] if 'pitcher' in ab_list['matchup'] else None)
-                        pitcher_name.append(ab_list['matchup']['pitcher']['fullName'] if 'pitcher' in ab_list['matchup'] else None)
-                        pitcher_hand.append(ab_list['matchup']['pitchHand']['code'] if 'pitchHand' in ab_list['matchup'] else None)
-                        if ab_list['about']['isTopInning']:
-                            batter_team.append(data['gameData']['teams']['away']['abbreviation'] if 'away' in data['gameData']['teams'] else None)
-                            batter_team_id.append(data['gameData']['teams']['away']['id'] if 'away' in data['gameData']['teams'] else None)
-                            pitcher_team.append(data['gameData']['teams']['home']['abbreviation'] if 'home' in data['gameData']['teams'] else None)
-                            pitcher_team_id.append(data['gameData']['teams']['away']['id'] if 'away' in data['gameData']['teams'] else None)
-                        else:
-                            batter_team.append(data['gameData']['teams']['home']['abbreviation'] if 'home' in data['gameData']['teams'] else None)
-                            batter_team_id.append(data['gameData']['teams']['home']['id'] if 'home' in data['gameData']['teams'] else None)
-                            pitcher_team.append(data['gameData']['teams']['away']['abbreviation'] if 'away' in data['gameData']['teams'] else None)
-                            pitcher_team_id.append(data['gameData']['teams']['home']['id'] if 'home' in data['gameData']['teams'] else None)
-
-                        play_description.append(None)
-                        play_code.append(None)
-                        in_play.append(None)
-                        is_strike.append(None)
-                        is_ball.append(None)
-                        is_review.append(None)
-                        pitch_type.append(None)
-                        pitch_description.append(None)
-                        strikes.append(ab_list['playEvents'][n]['count']['balls'] if 'balls' in ab_list['playEvents'][n]['count'] else None)
-                        balls.append(ab_list['playEvents'][n]['count']['strikes'] if 'strikes' in ab_list['playEvents'][n]['count'] else None)
-                        outs.append(ab_list['playEvents'][n]['count']['outs'] if 'outs' in ab_list['playEvents'][n]['count'] else None)
-                        strikes_after.append(ab_list['playEvents'][n]['count']['balls'] if 'balls' in ab_list['playEvents'][n]['count'] else None)
-                        balls_after.append(ab_list['playEvents'][n]['count']['strikes'] if 'strikes' in ab_list['playEvents'][n]['count'] else None)
-                        outs_after.append(ab_list['playEvents'][n]['count']['outs'] if 'outs' in ab_list['playEvents'][n]['count'] else None)
-                        index_play.append(ab_list['playEvents'][n]['index'] if 'index' in ab_list['playEvents'][n] else None)
-                        play_id.append(ab_list['playEvents'][n]['playId'] if 'playId' in ab_list['playEvents'][n] else None)
-                        start_time.append(ab_list['playEvents'][n]['startTime'] if 'startTime' in ab_list['playEvents'][n] else None)
-                        end_time.append(ab_list['playEvents'][n]['endTime'] if 'endTime' in ab_list['playEvents'][n] else None)
-                        is_pitch.append(ab_list['playEvents'][n]['isPitch'] if 'isPitch' in ab_list['playEvents'][n] else None)
-                        type_type.append(ab_list['playEvents'][n]['type'] if 'type' in ab_list['playEvents'][n] else None)
-
-
-
-                        is_swing.append(None)
-                        is_whiff.append(None)
-                        start_speed.append(None)
-                        end_speed.append(None)
-                        sz_top.append(None)
-                        sz_bot.append(None)
-                        x.append(None)
-                        y.append(None)
-                        ax.append(None)
-                        ay.append(None)
-                        az.append(None)
-                        pfxx.append(None)
-                        pfxz.append(None)
-                        px.append(None)
-                        pz.append(None)
-                        vx0.append(None)
-                        vy0.append(None)
-                        vz0.append(None)
-                        x0.append(None)
-                        y0.append(None)
-                        z0.append(None)
-                        zone.append(None)
-                        type_confidence.append(None)
-                        plate_time.append(None)
-                        extension.append(None)
-                        spin_rate.append(None)
-                        spin_direction.append(None)
-                        vb.append(None)
-                        ivb.append(None)
-                        hb.append(None)
-                        launch_speed.append(None)
-                        launch_angle.append(None)
-                        launch_distance.append(None)
-                        launch_location.append(None)
-                        trajectory.append(None)
-                        hardness.append(None)
-                        hit_x.append(None)
-                        hit_y.append(None)
-                        type_ab.append(None)
-                        ab_number.append(None)
-
-                        rbi.append(None)
-                        away_score.append(None)
-                        home_score.append(None)
-                        is_out.append(None)
                         
         # print({
         #     'game_id':len(game_id),
@@ -628,7 +3369,7 @@ class MLB_Scrape:
 
 
         # )
-        df  = pl.DataFrame(data={
+        column_data = {
             'game_id':game_id,
             'game_date':game_date,
             'batter_id':batter_id,
@@ -708,11 +3449,197 @@ class MLB_Scrape:
             'away_score':away_score,
             'home_score':home_score,
 
-            },strict=False
+            }
+        df  = pl.DataFrame(data={name: column_data[name] for name in keep},
+                           schema_overrides={name: PITCH_SCHEMA[name] for name in keep},strict=False
             )
 
         return df
 
+    def _get_data_df_polars(self, data_list, columns=None):
+        """
+        Vectorized version of get_data_df. The plays of every game are loaded into Polars structs (reading only the
+        fields in _FEED_SCHEMA), exploded into one row per play event, and the pitch columns are selected with expressions.
+        
+        Parameters:
+        - data_list (list): A list of JSON objects containing game data, or the raw feed bytes from get_data(raw=True), which skips the slow dictionary step.
+        - columns (list): The PITCH_SCHEMA columns to build. The play structs the projection does not need are left out of the read schema. Default is None (every column).
+        
+        Returns:
+        - data_df (pl.DataFrame): A DataFrame with the same rows, columns and dtypes as the python engine.
+        """
+        keep, want = _column_projection(columns)
+        keep_schema = {name: PITCH_SCHEMA[name] for name in keep}
+        feed_schema = _feed_schema(tuple(group for group in _PRUNABLE_PLAY_FIELDS if not want[group]))
+
+        # Load every game into a one-row struct frame holding only the fields in the feed schema,
+        # raw feed bytes are decoded straight into it without building the full dictionary first
+        feeds = []
+        for data in data_list:
+            if isinstance(data, (bytes, bytearray)):
+                feeds.append(pl.read_json(BytesIO(data), schema=feed_schema))
+            else:
+                feeds.append(pl.from_dicts([data], schema=feed_schema, strict=False))
+
+        if len(feeds) == 0:
+            return pl.DataFrame(schema=keep_schema)
+
+        teams = _field(pl.col('gameData'), 'teams')
+        games = (pl.concat(feeds)
+                 .select(pl.int_range(pl.len()).alias('_game'),
+                         pl.col('gamePk').alias('game_id'),
+                         _field(pl.col('gameData'), 'datetime', 'officialDate').alias('game_date'),
+                         _field(teams, 'away', 'abbreviation').alias('_away_abb'),
+                         _field(teams, 'away', 'id').alias('_away_id'),
+                         _field(teams, 'home', 'abbreviation').alias('_home_abb'),
+                         _field(teams, 'home', 'id').alias('_home_id'),
+                         _field(pl.col('liveData'), 'plays', 'allPlays').alias('_plays')))
+
+        # Stack the plays of every game (concatenating per game is much cheaper than exploding the nested lists),
+        # then attach the game level fields to each play
+        plays = [game_plays for game_plays in games['_plays'] if game_plays is not None and len(game_plays) > 0]
+        if len(plays) == 0:
+            return pl.DataFrame(schema=keep_schema)
+        game_index = games.select(pl.col('_game').repeat_by(pl.col('_plays').list.len().fill_null(0)).explode().drop_nulls())
+        plays_df = (pl.DataFrame(pl.concat(plays).alias('_plays'))
+                    .unnest('_plays')
+                    .with_columns(game_index['_game'])
+                    .join(games.drop('_plays'), on='_game', how='left', maintain_order='left')
+                    .with_row_index('_play'))
+
+        # One row per play event, numbered within its play
+        events = (plays_df
+                  .with_columns(pl.col('playEvents').list.len().alias('_n_events'),
+                                pl.int_ranges(0, pl.col('playEvents').list.len()).alias('_n'))
+                  .explode(['playEvents', '_n'])
+                  .with_row_index('_row'))
+
+        event = pl.col('playEvents')
+        details = _field(event, 'details')
+        count = _field(event, 'count')
+        pitch_data = _field(event, 'pitchData')
+        coordinates = _field(pitch_data, 'coordinates')
+        breaks = _field(pitch_data, 'breaks')
+        hit_data = _field(event, 'hitData')
+        result = pl.col('result')
+        matchup = pl.col('matchup')
+        top = _field(pl.col('about'), 'isTopInning')
+
+        # The count before the pitch is the count of the previous event, wrapping to the last event of the play like the python engine.
+        # Events of a play are contiguous, so a plain shift (or a gather to the end of the play) avoids a window over every play
+        last_event = pl.col('_row') - pl.col('_n') + pl.col('_n_events') - 1
+        def prev_count(name):
+            return pl.when(pl.col('_n') == 0).then(_field(count, name).gather(last_event)).otherwise(_field(count, name).shift(1))
+        first_pitch = _field(event, 'pitchNumber') == 1
+
+        # Pitches and called events get a full row, events that reach ball four (e.g. intentional walks) get a partial row
+        is_main = _field(event, 'isPitch').fill_null(False) | _field(details, 'call').is_not_null()
+        is_walk = ~is_main & (_field(count, 'balls') == 4).fill_null(False)
+        is_last = is_main & (pl.col('_n') == pl.col('_n_events') - 1)
+
+        def main(expr):
+            return pl.when(pl.col('_main')).then(expr)
+
+        def last(expr):
+            return pl.when(pl.col('_last')).then(expr)
+
+        swing_list = ['X','F','S','D','E','T','W']
+        whiff_list = ['S','T','W']
+
+        pitch_columns = [
+            pl.col('game_id'),
+            pl.col('game_date'),
+            _field(matchup, 'batter', 'id').alias('batter_id'),
+            _field(matchup, 'batter', 'fullName').alias('batter_name'),
+            _field(matchup, 'batSide', 'code').alias('batter_hand'),
+            pl.when(top).then(pl.col('_away_abb')).otherwise(pl.col('_home_abb')).alias('batter_team'),
+            pl.when(top).then(pl.col('_away_id')).otherwise(pl.col('_home_id')).alias('batter_team_id'),
+            _field(matchup, 'pitcher', 'id').alias('pitcher_id'),
+            _field(matchup, 'pitcher', 'fullName').alias('pitcher_name'),
+            _field(matchup, 'pitchHand', 'code').alias('pitcher_hand'),
+            pl.when(top).then(pl.col('_home_abb')).otherwise(pl.col('_away_abb')).alias('pitcher_team'),
+            # The walk rows of the python engine take the pitcher team id from the batting team
+            pl.when(top == pl.col('_main')).then(pl.col('_home_id')).otherwise(pl.col('_away_id')).alias('pitcher_team_id'),
+            main(pl.col('atBatIndex')).alias('ab_number'),
+            main(_field(details, 'description')).alias('play_description'),
+            main(_field(details, 'code')).alias('play_code'),
+            main(_field(details, 'isInPlay')).alias('in_play'),
+            main(_field(details, 'isStrike')).alias('is_strike'),
+            main(pl.when(_field(details, 'code').is_in(swing_list)).then(True)).alias('is_swing'),
+            main(pl.when(_field(details, 'code').is_in(whiff_list)).then(True)).alias('is_whiff'),
+            last(_field(result, 'isOut')).alias('is_out'),
+            main(_field(details, 'isOut')).alias('is_ball'),
+            main(_field(details, 'hasReview')).alias('is_review'),
+            main(_field(details, 'type', 'code')).alias('pitch_type'),
+            main(_field(details, 'type', 'description')).alias('pitch_description'),
+            main(pl.when(first_pitch).then(0).otherwise(prev_count('strikes'))).otherwise(_field(count, 'balls')).alias('strikes'),
+            main(pl.when(first_pitch).then(0).otherwise(prev_count('balls'))).otherwise(_field(count, 'strikes')).alias('balls'),
+            main(pl.when(first_pitch).then(_field(count, 'outs')).otherwise(prev_count('outs'))).otherwise(_field(count, 'outs')).alias('outs'),
+            main(_field(count, 'strikes')).otherwise(_field(count, 'balls')).alias('strikes_after'),
+            main(_field(count, 'balls')).otherwise(_field(count, 'strikes')).alias('balls_after'),
+            _field(count, 'outs').alias('outs_after'),
+            main(_field(pitch_data, 'startSpeed')).alias('start_speed'),
+            main(_field(pitch_data, 'endSpeed')).alias('end_speed'),
+            main(_field(pitch_data, 'strikeZoneTop')).alias('sz_top'),
+            main(_field(pitch_data, 'strikeZoneBottom')).alias('sz_bot'),
+            main(_field(coordinates, 'x')).alias('x'),
+            main(_field(coordinates, 'y')).alias('y'),
+            main(_field(coordinates, 'aX')).alias('ax'),
+            main(_field(coordinates, 'aY')).alias('ay'),
+            main(_field(coordinates, 'aZ')).alias('az'),
+            main(_field(coordinates, 'pfxX')).alias('pfxx'),
+            main(_field(coordinates, 'pfxZ')).alias('pfxz'),
+            main(_field(coordinates, 'pX')).alias('px'),
+            main(_field(coordinates, 'pZ')).alias('pz'),
+            main(_field(coordinates, 'vX0')).alias('vx0'),
+            main(_field(coordinates, 'vY0')).alias('vy0'),
+            main(_field(coordinates, 'vZ0')).alias('vz0'),
+            main(_field(coordinates, 'x0')).alias('x0'),
+            main(_field(coordinates, 'y0')).alias('y0'),
+            main(_field(coordinates, 'z0')).alias('z0'),
+            main(_field(pitch_data, 'zone')).alias('zone'),
+            main(_field(pitch_data, 'typeConfidence')).alias('type_confidence'),
+            main(_field(pitch_data, 'plateTime')).alias('plate_time'),
+            main(_field(pitch_data, 'extension')).alias('extension'),
+            main(_field(breaks, 'spinRate')).alias('spin_rate'),
+            main(_field(breaks, 'spinDirection')).alias('spin_direction'),
+            main(_field(breaks, 'breakVertical')).alias('vb'),
+            main(_field(breaks, 'breakVerticalInduced')).alias('ivb'),
+            main(_field(breaks, 'breakHorizontal')).alias('hb'),
+            main(_field(hit_data, 'launchSpeed')).alias('launch_speed'),
+            main(_field(hit_data, 'launchAngle')).alias('launch_angle'),
+            main(_field(hit_data, 'totalDistance')).alias('launch_distance'),
+            main(_field(hit_data, 'location')).alias('launch_location'),
+            main(_field(hit_data, 'trajectory')).alias('trajectory'),
+            main(_field(hit_data, 'hardness')).alias('hardness'),
+            main(_field(hit_data, 'coordinates', 'coordX')).alias('hit_x'),
+            main(_field(hit_data, 'coordinates', 'coordY')).alias('hit_y'),
+            _field(event, 'index').alias('index_play'),
+            _field(event, 'playId').alias('play_id'),
+            _field(event, 'startTime').alias('start_time'),
+            _field(event, 'endTime').alias('end_time'),
+            _field(event, 'isPitch').alias('is_pitch'),
+            _field(event, 'type').alias('type_type'),
+            last(_field(result, 'type')).alias('type_ab'),
+            pl.when(pl.col('_last') | pl.col('_walk')).then(_field(result, 'event')).alias('event'),
+            pl.when(pl.col('_last') | pl.col('_walk')).then(_field(result, 'eventType')).alias('event_type'),
+            last(_field(result, 'rbi')).alias('rbi'),
+            last(_field(result, 'awayScore')).alias('away_score'),
+            last(_field(result, 'homeScore')).alias('home_score'),
+        ]
+        wanted = set(keep)
+        pitch_columns = [expr for expr in pitch_columns if expr.meta.output_name() in wanted]
+
+        # Select the projected columns first and filter the flat result, which is cheaper than filtering the nested events
+        df = (events
+              .with_columns(is_main.alias('_main'), is_walk.alias('_walk'), is_last.alias('_last'))
+              .select(pl.col('_main'), pl.col('_walk'), *pitch_columns)
+              .filter(pl.col('_main') | pl.col('_walk'))
+              .select(keep)
+              .cast(keep_schema))
+
+        return df
+
     # def get_players(self,sport_id:int):
     #     player_data = requests.get(url=f'https://statsapi.mlb.com/api/v1/sports/{sport_id}/players').json()
 
@@ -737,31 +3664,35 @@ class MLB_Scrape:
         Returns:
         - mlb_teams_df (pl.DataFrame): A DataFrame containing team information, including team ID, city, name, franchise, abbreviation, parent organization ID, parent organization name, league ID, and league name.
         """
-        # Make API call to retrieve team information
-        teams = requests.get(url='https://statsapi.mlb.com/api/v1/teams/').json()
-
-        # Extract relevant data from the API response
-        mlb_teams_city = [x['franchiseName'] if 'franchiseName' in x else None for x in teams['teams']]
-        mlb_teams_name = [x['teamName'] if 'franchiseName' in x else None for x in teams['teams']]
-        mlb_teams_franchise = [x['name'] if 'franchiseName' in x else None for x in teams['teams']]
-        mlb_teams_id = [x['id'] if 'franchiseName' in x else None for x in teams['teams']]
-        mlb_teams_abb = [x['abbreviation'] if 'franchiseName' in x else None for x in teams['teams']]
-        mlb_teams_parent_id = [x['parentOrgId'] if 'parentOrgId' in x else None for x in teams['teams']]
-        mlb_teams_parent = [x['parentOrgName'] if 'parentOrgName' in x else None for x in teams['teams']]
-        mlb_teams_league_id = [x['league']['id'] if 'id' in x['league'] else None for x in teams['teams']]
-        mlb_teams_league_name = [x['league']['name'] if 'name' in x['league'] else None for x in teams['teams']]
+        # The teams list is downloaded once per process by the reference registry
+        teams = self.reference.teams()
+
+        # Extract relevant data from the API response in a single pass, teams without a franchise only keep their parent and league
+        rows = []
+        for x in teams:
+            franchise = 'franchiseName' in x
+            league = x.get('league', {})
+            rows.append((x.get('id') if franchise else None,
+                         x.get('name') if franchise else None,
+                         x.get('teamName') if franchise else None,
+                         x.get('name') if franchise else None,
+                         x.get('abbreviation') if franchise else None,
+                         x.get('parentOrgId'),
+                         x.get('parentOrgName'),
+                         league.get('id'),
+                         league.get('name')))
 
         # Create a Polars DataFrame with the extracted data
-        mlb_teams_df = pl.DataFrame(data={'team_id': mlb_teams_id,
-                                        'city': mlb_teams_franchise,
-                                        'name': mlb_teams_name,
-                                        'franchise': mlb_teams_franchise,
-                                        'abbreviation': mlb_teams_abb,
-                                        'parent_org_id': mlb_teams_parent_id,
-                                        'parent_org': mlb_teams_parent,
-                                        'league_id': mlb_teams_league_id,
-                                        'league_name': mlb_teams_league_name
-                                        }).unique().drop_nulls(subset=['team_id']).sort('team_id')
+        mlb_teams_df = pl.DataFrame(rows, orient='row', schema={'team_id': pl.Int64,
+                                                                'city': pl.String,
+                                                                'name': pl.String,
+                                                                'franchise': pl.String,
+                                                                'abbreviation': pl.String,
+                                                                'parent_org_id': pl.Int64,
+                                                                'parent_org': pl.String,
+                                                                'league_id': pl.Int64,
+                                                                'league_name': pl.String,
+                                                                }).unique().drop_nulls(subset=['team_id']).sort('team_id')
 
         # Fill missing parent organization IDs with team IDs
         mlb_teams_df = mlb_teams_df.with_columns(
@@ -779,10 +3710,6 @@ class MLB_Scrape:
             .alias('parent_org')
         )
 
-        # Create a dictionary for mapping team IDs to abbreviations
-        abbreviation_dict = mlb_teams_df.select(['team_id', 'abbreviation']).to_dict(as_series=False)
-        abbreviation_map = {k: v for k, v in zip(abbreviation_dict['team_id'], abbreviation_dict['abbreviation'])}
-
         # Create a DataFrame for parent organization abbreviations
         abbreviation_df = mlb_teams_df.select(['team_id', 'abbreviation']).rename({'team_id': 'parent_org_id', 'abbreviation': 'parent_org_abbreviation'})
 
@@ -798,21 +3725,18 @@ class MLB_Scrape:
         Returns:
         - leagues_df (pl.DataFrame): A DataFrame containing league information, including league ID, league name, league abbreviation, and sport ID.
         """
-        # Make API call to retrieve league information
-        leagues = requests.get(url='https://statsapi.mlb.com/api/v1/leagues/').json()
+        # The leagues list is downloaded once per process by the reference registry
+        leagues = self.reference.leagues()
 
-        # Extract relevant data from the API response
-        sport_id = [x['sport']['id'] if 'sport' in x else None for x in leagues['leagues']]
-        league_id = [x['id'] if 'id' in x else None for x in leagues['leagues']]
-        league_name = [x['name'] if 'name' in x else None for x in leagues['leagues']]
-        league_abbreviation = [x['abbreviation'] if 'abbreviation' in x else None for x in leagues['leagues']]
+        # Extract relevant data from the API response in a single pass
+        rows = [(x.get('id'), x.get('name'), x.get('abbreviation'), x['sport'].get('id') if 'sport' in x else None) for x in leagues]
 
         # Create a Polars DataFrame with the extracted data
-        leagues_df = pl.DataFrame(data={
-            'league_id': league_id,
-            'league_name': league_name,
-            'league_abbreviation': league_abbreviation,
-            'sport_id': sport_id,
+        leagues_df = pl.DataFrame(rows, orient='row', schema={
+            'league_id': pl.Int64,
+            'league_name': pl.String,
+            'league_abbreviation': pl.String,
+            'sport_id': pl.Int64,
         })
 
         return leagues_df
@@ -851,14 +3775,76 @@ class MLB_Scrape:
         game_type_str = ','.join([str(x) for x in game_type])
 
         # Make API call to retrieve player game logs
-        response = requests.get(url=f'http://statsapi.mlb.com/api/v1/people/{player_id}?hydrate=stats(type=gameLog,season={season},startDate={start_date},endDate={end_date},sportId={sport_id},gameType=[{game_type_str}]),hydrations').json()
-        print(f'http://statsapi.mlb.com/api/v1/people/{player_id}?hydrate=stats(type=gameLog,season={season},startDate={start_date},endDate={end_date},sportId={sport_id},gameType=[{game_type_str}]),hydrations')
+        url = f'http://statsapi.mlb.com/api/v1/people/{player_id}?hydrate=stats(type=gameLog,season={season},startDate={start_date},endDate={end_date},sportId={sport_id},gameType=[{game_type_str}]),hydrations'
+        logger.debug('Player game log request: %s', url)
+        response = self.session.get(url=url).json()
         # Extract game IDs from the API response
         player_game_list = [x['game']['gamePk'] for x in response['people'][0]['stats'][0]['splits']]
         
         return player_game_list
         
 
+    def get_players_games_list(self, player_ids: list, seasons: list, start_date: str = None, end_date: str = None, sport_id: int = 1,
+                               game_type: list = ['R'], chunk_size: int = 50, max_workers: int = None, unique: bool = False):
+        """
+        Retrieves the games of many players over many seasons at once. Players are requested in chunks through the multi-person
+        people?personIds= endpoint, one request per chunk and season, and the requests run concurrently over the shared session.
+
+        Parameters:
+        - player_ids (list): The IDs of the players.
+        - seasons (list): The season years for which to retrieve the game lists. A single int is accepted too.
+        - start_date (str): The start date (YYYY-MM-DD) of the range, only with a single season (default is January 1st of each season).
+        - end_date (str): The end date (YYYY-MM-DD) of the range, only with a single season (default is December 31st of each season).
+        - sport_id (int): The ID of the sport for which to retrieve player data. Default is 1.
+        - game_type (list): A list of game types to filter the games. Default is ['R'].
+        - chunk_size (int): The number of players per request. Default is 50.
+        - max_workers (int): The maximum number of requests in flight at once. Default is the value given to MLB_Scrape.
+        - unique (bool): Return the list of distinct game IDs across every player instead of the frame, ready for get_data. Default is False.
+
+        Returns:
+        - games_df (pl.DataFrame): One row per player and game (player_id, season, game_id, game_date), sorted by player and date.
+        - game_list (list): With unique, the distinct game IDs in date order, so every game is downloaded once however many players appeared in it.
+        """
+        if isinstance(seasons, int):
+            seasons = [seasons]
+        if (start_date or end_date) and len(seasons) != 1:
+            raise ValueError("start_date and end_date can only be given with a single season.")
+
+        # Validate date format
+        date_pattern = re.compile(r'^\d{4}-\d{2}-\d{2}$')
+        for date in (start_date, end_date):
+            if date and not date_pattern.match(date):
+                raise ValueError(f"{date} is not in YYYY-MM-DD format")
+
+        player_ids = list(dict.fromkeys(player_ids))
+        game_type_str = ','.join([str(x) for x in game_type])
+        chunks = [player_ids[i:i + chunk_size] for i in range(0, len(player_ids), max(1, chunk_size))]
+
+        def fetch(chunk, season):
+            start = start_date or f'{season}-01-01'
+            end = end_date or f'{season}-12-31'
+            ids = ','.join(str(x) for x in chunk)
+            response = self.session.get(url=f'https://statsapi.mlb.com/api/v1/people?personIds={ids}&hydrate=stats(type=gameLog,season={season},startDate={start},endDate={end},sportId={sport_id},gameType=[{game_type_str}])').json()
+            # A player can have splits in more than one stat group (hitting, pitching, fielding) for the same game
+            return [(person['id'], season, split['game']['gamePk'], split.get('date'))
+                    for person in response.get('people', [])
+                    for stats in person.get('stats', [])
+                    for split in stats.get('splits', [])
+                    if 'game' in split]
+
+        rows = []
+        with ThreadPoolExecutor(max_workers=max(1, max_workers or self.max_workers)) as executor:
+            futures = [executor.submit(fetch, chunk, season) for season in seasons for chunk in chunks]
+            for future in tqdm(futures, desc="Processing", unit="iteration"):
+                rows.extend(future.result())
+
+        games_df = (pl.DataFrame(rows, orient='row', schema={'player_id': pl.Int64, 'season': pl.Int64, 'game_id': pl.Int64, 'game_date': pl.String})
+                    .unique(subset=['player_id', 'game_id'], keep='first', maintain_order=True)
+                    .sort(['player_id', 'game_date', 'game_id']))
+        if unique:
+            return games_df.sort(['game_date', 'game_id'])['game_id'].unique(maintain_order=True).to_list()
+        return games_df
+
     def get_players(self, sport_id: int, season: int):
         """
         Retrieves data frame of players in a given league
@@ -871,32 +3857,31 @@ class MLB_Scrape:
         - player_df (pl.DataFrame): A DataFrame containing player information, including player ID, name, position, team, and age.
         """
     
-        player_data = requests.get(url=f'https://statsapi.mlb.com/api/v1/sports/{sport_id}/players?season={season}').json()
-
-        #Select relevant data that will help distinguish players from one another
-        
-        fullName_list = [x['fullName'] if 'fullName' in x else None for x in player_data['people']]
-        firstName_list = [x['firstName'] if 'firstName' in x else None for x in player_data['people']]
-        lastName_list = [x['lastName'] if 'lastName' in x else None for x in player_data['people']]
-        id_list = [x['id'] if 'id' in x else None for x in player_data['people']]
-        position_list = [x['primaryPosition']['abbreviation'] if 'primaryPosition' in x and 'abbreviation' in x['primaryPosition'] else None for x in player_data['people']]
-        team_list = [x['currentTeam']['id'] if 'currentTeam' in x and 'id' in x['currentTeam'] else None for x in player_data['people']]
-        weight_list = [x['weight'] if 'weight' in x else None for x in player_data['people']]
-        height_list = [x['height'] if 'height' in x else None for x in player_data['people']]
-        age_list = [x['currentAge'] if 'currentAge' in x else None for x in player_data['people']]
-        birthDate_list = [x['birthDate'] if 'birthDate' in x else None for x in player_data['people']]
-
-
-        df = pl.DataFrame(data={'player_id':id_list,
-                                        'first_name':firstName_list,
-                                        'last_name':lastName_list,
-                                        'name':fullName_list,
-                                        'position':position_list,
-                                        'team':team_list,
-                                        'weight':weight_list,
-                                        'height':height_list,
-                                        'age':age_list,
-                                        'birthDate':birthDate_list})
+        # The players of a sport and season are downloaded once per process by the reference registry
+        people = self.reference.players(sport_id, season)
+
+        #Select relevant data that will help distinguish players from one another, in a single pass
+        rows = [(x.get('id'),
+                 x.get('firstName'),
+                 x.get('lastName'),
+                 x.get('fullName'),
+                 x.get('primaryPosition', {}).get('abbreviation'),
+                 x.get('currentTeam', {}).get('id'),
+                 x.get('weight'),
+                 x.get('height'),
+                 x.get('currentAge'),
+                 x.get('birthDate')) for x in people]
+
+        df = pl.DataFrame(rows, orient='row', schema={'player_id': pl.Int64,
+                                                      'first_name': pl.String,
+                                                      'last_name': pl.String,
+                                                      'name': pl.String,
+                                                      'position': pl.String,
+                                                      'team': pl.Int64,
+                                                      'weight': pl.Int64,
+                                                      'height': pl.String,
+                                                      'age': pl.Int64,
+                                                      'birthDate': pl.String})
               
         return df
 
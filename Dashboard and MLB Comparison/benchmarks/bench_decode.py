@@ -0,0 +1,73 @@
+"""
+Compares decoding feed/live payloads with json.loads (what r.json() does) against the compact typed schema
+(decode_feed(compact=True)), measuring decode time, peak memory of holding every decoded game, and get_data_df time.
+
+Usage:
+    python bench_decode.py 763702 763704 763697      # game ids, downloaded once into the feed cache
+    python bench_decode.py --feeds path/to/feeds     # a folder of .json or .json.gz feed files
+"""
+import argparse
+import gc
+import glob
+import gzip
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from api_scraper import MLB_Scrape, DEFAULT_CACHE_DIR, decode_feed
+
+
+def load_payloads(args):
+    # Read the raw bytes of every feed, either from files or through the feed cache
+    if args.feeds:
+        payloads = []
+        for path in sorted(glob.glob(os.path.join(args.feeds, '*.json*'))):
+            opener = gzip.open if path.endswith('.gz') else open
+            with opener(path, 'rb') as f:
+                payloads.append(f.read())
+        return payloads
+    scraper = MLB_Scrape(cache_dir=DEFAULT_CACHE_DIR)
+    return scraper.get_data(game_list_input=[int(x) for x in args.game_ids], raw=True)
+
+
+def measure(payloads, compact):
+    # Time the decoding on its own, then measure peak memory in a second pass since tracemalloc slows it down
+    gc.collect()
+    start = time.perf_counter()
+    data_list = [decode_feed(content, compact=compact) for content in payloads]
+    decode_time = time.perf_counter() - start
+    del data_list
+
+    gc.collect()
+    tracemalloc.start()
+    data_list = [decode_feed(content, compact=compact) for content in payloads]
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    start = time.perf_counter()
+    df = MLB_Scrape().get_data_df(data_list)
+    parse_time = time.perf_counter() - start
+    return decode_time, peak, parse_time, len(df)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('game_ids', nargs='*', help='gamePks to benchmark')
+    parser.add_argument('--feeds', help='folder of saved feed/live files to benchmark instead of game ids')
+    args = parser.parse_args()
+    if not args.feeds and not args.game_ids:
+        parser.error('give game ids or --feeds')
+
+    payloads = load_payloads(args)
+    total_mb = sum(len(content) for content in payloads) / 1024 ** 2
+    print(f'{len(payloads)} feeds, {total_mb:.1f} MB of JSON')
+    print(f"{'decoder':<10}{'decode s':>10}{'peak MB':>10}{'parse s':>10}{'rows':>10}")
+    for name, compact in [('json', False), ('compact', True)]:
+        decode_time, peak, parse_time, rows = measure(payloads, compact)
+        print(f'{name:<10}{decode_time:>10.3f}{peak / 1024 ** 2:>10.1f}{parse_time:>10.3f}{rows:>10}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,80 @@
+"""
+Compares the pitch frame in its PITCH_SCHEMA dtypes against the memory-compact dtypes (compact_pitch_schema), printing the bytes per
+pitch of every column and timing the gen_grouping aggregation of the dashboard on both frames.
+
+Usage:
+    python bench_dtypes.py 763702 763704 763697      # game ids, downloaded once into the feed cache
+    python bench_dtypes.py --feeds path/to/feeds     # a folder of .json or .json.gz feed files
+    python bench_dtypes.py --feeds path/to/feeds --float32 --repeat 50
+"""
+import argparse
+import glob
+import gzip
+import os
+import sys
+import time
+
+import polars as pl
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from api_scraper import MLB_Scrape, DEFAULT_CACHE_DIR, compact_pitch_frame, pitch_memory_report
+
+
+def load_frame(args):
+    # Parse every feed with the polars engine, either from files or through the feed cache
+    scraper = MLB_Scrape(cache_dir=None if args.feeds else DEFAULT_CACHE_DIR)
+    if args.feeds:
+        payloads = []
+        for path in sorted(glob.glob(os.path.join(args.feeds, '*.json*'))):
+            opener = gzip.open if path.endswith('.gz') else open
+            with opener(path, 'rb') as f:
+                payloads.append(f.read())
+    else:
+        payloads = scraper.get_data(game_list_input=[int(x) for x in args.game_ids], raw=True)
+    return scraper.get_data_df(payloads, engine='polars')
+
+
+def grouping(df):
+    # The aggregation of gen_grouping in OSU_Dashboard.py
+    return df.group_by(['pitcher_name', 'pitcher_hand', 'pitch_type']).agg(
+        pl.len().alias('pitch'),
+        pl.col(['start_speed', 'ivb', 'hb', 'spin_rate', 'spin_direction', 'x0', 'z0', 'extension']).mean(),
+        pl.col(['is_swing', 'is_whiff']).sum(),
+        (pl.col('zone') < 10).sum().alias('in_zone'),
+        (pl.col('zone') > 10).sum().alias('out_zone'),
+    )
+
+
+def time_grouping(df, repeat):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        grouping(df)
+    return (time.perf_counter() - start) / repeat
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('game_ids', nargs='*', help='gamePks to benchmark')
+    parser.add_argument('--feeds', help='folder of saved feed/live files to benchmark instead of game ids')
+    parser.add_argument('--float32', action='store_true', help='store the tracking columns as Float32 in the compact frame')
+    parser.add_argument('--repeat', type=int, default=20, help='number of timed runs of the grouping')
+    args = parser.parse_args()
+    if not args.feeds and not args.game_ids:
+        parser.error('give game ids or --feeds')
+
+    df = load_frame(args)
+    compact_df = compact_pitch_frame(df, args.float32)
+    report = pitch_memory_report(df, args.float32)
+    with pl.Config(tbl_rows=len(report), tbl_width_chars=120, fmt_str_lengths=24):
+        print(report)
+
+    total = report.filter(pl.col('column') == 'total').row(0, named=True)
+    print(f"{df.height} pitches: {total['bytes_per_pitch']:.0f} -> {total['compact_bytes_per_pitch']:.0f} bytes per pitch "
+          f"({total['ratio']:.2f}x smaller)")
+    print(f"{'frame':<10}{'grouping ms':>14}")
+    for name, frame in [('default', df), ('compact', compact_df)]:
+        print(f'{name:<10}{time_grouping(frame, args.repeat) * 1000:>14.2f}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,115 @@
+"""
+Times get_data_df and the dashboard aggregations on synthetic games (synthetic_feeds.py) at growing pitch counts, so their
+scaling can be checked well past the size of a college season without downloading anything.
+
+For every size the games are generated in batches and parsed by each engine (the python engine includes the json decode,
+as get_data does it), then the polars frame goes through stat_frame, gen_grouping and the plinko chart's after() calls of
+OSU_Dashboard.py. The dashboard steps need the dashboard's dependencies and are skipped when it cannot be imported.
+
+Usage:
+    python bench_scale.py                                  # 10k, 100k and 1M pitches with both engines
+    python bench_scale.py --pitches 10000 100000 --engines polars
+    python bench_scale.py --pitches 1000000 --max-after 0  # skip after(), it loops over the rows in Python
+"""
+import argparse
+import json
+import os
+import sys
+import time
+
+import polars as pl
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from api_scraper import MLB_Scrape
+from synthetic_feeds import synthetic_feeds
+
+# Every count of the plinko chart
+COUNTS = [(balls, strikes) for balls in [0, 1, 2, 3] for strikes in [0, 1, 2]]
+
+
+def load_dashboard():
+    # OSU_Dashboard.py lives next to the Streamlit app and imports the plotting and scraping stack
+    sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'Dashboard app'))
+    try:
+        import OSU_Dashboard
+    except ImportError as e:
+        print(f'Skipping the dashboard steps, OSU_Dashboard could not be imported ({e}).')
+        return None
+    return OSU_Dashboard
+
+
+def parse(scraper, n_pitches, engines, batch_games, seed):
+    # Generates the games batch by batch, so only one batch of raw feeds is held in memory at a time
+    timings = {engine: 0.0 for engine in engines}
+    frames = {engine: [] for engine in engines}
+    batch = []
+    games = 0
+
+    def flush():
+        for engine in engines:
+            start = time.perf_counter()
+            data = batch if engine == 'polars' else [json.loads(content) for content in batch]
+            frames[engine].append(scraper.get_data_df(data, engine=engine))
+            timings[engine] += time.perf_counter() - start
+        batch.clear()
+
+    for content in synthetic_feeds(n_pitches=n_pitches, seed=seed, as_bytes=True):
+        batch.append(content)
+        games += 1
+        if len(batch) == batch_games:
+            flush()
+    if batch:
+        flush()
+    return games, timings, {engine: pl.concat(frames[engine]) for engine in engines}
+
+
+def time_call(function, *args):
+    start = time.perf_counter()
+    result = function(*args)
+    return result, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--pitches', type=int, nargs='+', default=[10_000, 100_000, 1_000_000], help='pitch counts to benchmark')
+    parser.add_argument('--engines', nargs='+', default=['polars', 'python'], choices=['polars', 'python'], help='get_data_df engines')
+    parser.add_argument('--batch-games', type=int, default=200, help='games generated and parsed per batch')
+    parser.add_argument('--max-after', type=int, default=100_000, help='largest frame after() is timed on')
+    parser.add_argument('--no-dashboard', action='store_true', help='only time get_data_df')
+    parser.add_argument('--seed', type=int, default=0, help='random seed of the synthetic games')
+    args = parser.parse_args()
+
+    dashboard = None if args.no_dashboard else load_dashboard()
+    scraper = MLB_Scrape(cache_dir=None)
+
+    print(f"{'pitches':>9}{'games':>7}{'engine':>8}{'parse s':>10}{'pitches/s':>12}{'frame MB':>10}")
+    results = []
+    for n_pitches in args.pitches:
+        games, timings, frames = parse(scraper, n_pitches, args.engines, args.batch_games, args.seed)
+        for engine in args.engines:
+            df = frames[engine]
+            print(f'{df.height:>9}{games:>7}{engine:>8}{timings[engine]:>10.2f}{df.height / timings[engine]:>12.0f}'
+                  f'{df.estimated_size() / 1024 ** 2:>10.1f}')
+        if len(args.engines) == 2 and not frames['polars'].equals(frames['python']):
+            print('  the polars and python frames differ')
+        results.append(frames[args.engines[0]])
+        del frames
+
+    if dashboard is None:
+        return
+
+    print(f"\n{'pitches':>9}{'stat_frame s':>14}{'gen_grouping s':>16}{'after() x12 s':>15}")
+    for df in results:
+        stat_df, stat_time = time_call(dashboard.stat_frame, df)
+        _, grouping_time = time_call(dashboard.gen_grouping, stat_df)
+        after_time = float('nan')
+        if df.height <= args.max_after:
+            start = time.perf_counter()
+            for balls, strikes in COUNTS:
+                dashboard.after(stat_df, balls, strikes)
+            after_time = time.perf_counter() - start
+        print(f'{df.height:>9}{stat_time:>14.2f}{grouping_time:>16.2f}{after_time:>15.2f}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,76 @@
+"""
+Profiles the cold-start imports of the dashboard with python -X importtime. The import statements of each script are run in a fresh
+interpreter (nothing else of the script runs), and the cumulative time of every top-level module they pull in is reported, slowest first.
+
+Usage:
+    python profile_imports.py                                  # the Streamlit app, "Dashboard app/app.py"
+    python profile_imports.py "../Dashboard app/OSU_Dashboard.py" --repeat 5 --top 15
+    python profile_imports.py --markdown >> import_profile.md
+"""
+import argparse
+import ast
+import os
+import statistics
+import subprocess
+import sys
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+PROJECT_DIR = os.path.dirname(BENCH_DIR)
+
+
+def import_code(path):
+    # The top-level import statements of a script, in order
+    with open(path) as f:
+        tree = ast.parse(f.read())
+    return '\n'.join(ast.unparse(node) for node in tree.body if isinstance(node, (ast.Import, ast.ImportFrom)))
+
+
+def profile(path, code=None):
+    # Runs the imports once in a fresh interpreter, returning the cumulative ms of each top-level module
+    env = {**os.environ, 'PYTHONPATH': os.pathsep.join([os.path.dirname(os.path.abspath(path)), PROJECT_DIR])}
+    result = subprocess.run([sys.executable, '-X', 'importtime', '-c', import_code(path) if code is None else code],
+                            cwd=os.path.dirname(os.path.abspath(path)), env=env, capture_output=True, text=True)
+    if result.returncode != 0:
+        raise RuntimeError(result.stderr.strip().splitlines()[-1])
+    modules = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or '[us]' in line:
+            continue
+        _, cumulative, name = line.removeprefix('import time:').split('|')
+        # Nested imports are indented under the module that imported them, only top-level ones are kept
+        if name[1:2] != ' ':
+            modules[name.strip()] = int(cumulative) / 1000
+    return modules
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('scripts', nargs='*', default=[os.path.join(PROJECT_DIR, 'Dashboard app', 'app.py')], help='scripts to profile')
+    parser.add_argument('--repeat', type=int, default=3, help='fresh interpreters per script, the median is reported')
+    parser.add_argument('--top', type=int, default=12, help='number of modules listed')
+    parser.add_argument('--markdown', action='store_true', help='print markdown tables')
+    args = parser.parse_args()
+
+    for path in args.scripts:
+        # Modules the interpreter imports on its own before any code runs are left out
+        startup = set(profile(path, code='pass'))
+        runs = [{name: ms for name, ms in profile(path).items() if name not in startup} for _ in range(args.repeat)]
+        names = set().union(*runs)
+        modules = {name: statistics.median(run.get(name, 0) for run in runs) for name in names}
+        total = statistics.median(sum(run.values()) for run in runs)
+        ranked = sorted(modules.items(), key=lambda item: item[1], reverse=True)[:args.top]
+
+        title = os.path.relpath(path, PROJECT_DIR)
+        if args.markdown:
+            print(f'\n### {title}\n\n| module | cumulative ms |\n| --- | ---: |')
+            for name, ms in ranked:
+                print(f'| {name} | {ms:.0f} |')
+            print(f'| **total** | **{total:.0f}** |')
+        else:
+            print(f'\n{title}: {total:.0f} ms')
+            for name, ms in ranked:
+                print(f'{name:<40}{ms:>10.1f}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,46 @@
+"""
+Records a fixture archive, or serves one as a local stand-in for statsapi.mlb.com, osubeavers.com and GitHub.
+
+Record the responses of a scrape (any script that uses MLB_Scrape or OSU_Dashboard records the same way):
+    MLB_SCRAPE_FIXTURES=fixtures MLB_SCRAPE_FIXTURE_MODE=record python bench_decode.py 763702 763704
+
+Replay in process, with no network:
+    MLB_SCRAPE_FIXTURES=fixtures python bench_decode.py 763702 763704
+
+Serve the archive over a local socket and point every session at it:
+    python serve_fixtures.py fixtures --port 8765 --latency 0.05
+    MLB_SCRAPE_FIXTURE_SERVER=http://127.0.0.1:8765 python bench_decode.py 763702 763704
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from api_scraper import FixtureArchive, FixtureServer
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('archive', help='fixture archive directory')
+    parser.add_argument('--host', default='127.0.0.1', help='interface to listen on')
+    parser.add_argument('--port', type=int, default=8765, help='port to listen on')
+    parser.add_argument('--latency', type=float, default=0, help='seconds added to every response')
+    args = parser.parse_args()
+
+    archive = FixtureArchive(args.archive)
+    stats = archive.stats()
+    server = FixtureServer(archive, host=args.host, port=args.port, latency=args.latency).start()
+    print(f"Serving {stats['entries']} responses ({stats['bytes'] / 1024 ** 2:.1f} MB) at {server.url}, Ctrl+C to stop.")
+    try:
+        while True:
+            time.sleep(1)
+    except KeyboardInterrupt:
+        pass
+    server.stop()
+    stats = archive.stats()
+    print(f"Served {stats['served']} responses, {stats['missing']} missing.")
+
+
+if __name__ == '__main__':
+    main()
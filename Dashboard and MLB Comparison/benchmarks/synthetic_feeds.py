@@ -0,0 +1,305 @@
+"""
+Generates synthetic feed/live documents with the layout of the Stats API, for scale testing get_data_df and the dashboard aggregations
+without downloading anything.
+
+Each game is nine innings of plate appearances simulated pitch by pitch: ball/strike counts, fouls with two strikes, walks, strikeouts,
+hit by pitches, balls in play, pickoff attempts and automatic intentional walks. Every pitcher has his own pitch mix, pitchers are
+changed as their pitch counts climb, and a share of pitches come without pitchData and of balls in play without hitData,
+as happens in parks without full tracking. The same seed always gives the same games.
+
+Usage:
+    python synthetic_feeds.py path/to/feeds --pitches 100000     # writes gzipped feeds, readable by bench_decode.py --feeds
+    python synthetic_feeds.py path/to/feeds --games 50 --seed 7
+"""
+import argparse
+import gzip
+import json
+import math
+import os
+import random
+from datetime import datetime, timedelta
+
+# Pitch type -> (description, mean velocity, mean induced vertical break, mean horizontal break, mean spin rate)
+PITCH_TYPES = {
+    'FF': ('Four-Seam Fastball', 94.0, 16.0, 7.0, 2300),
+    'SI': ('Sinker', 93.0, 8.0, 15.0, 2150),
+    'FC': ('Cutter', 89.0, 10.0, -2.0, 2400),
+    'SL': ('Slider', 85.0, 2.0, -5.0, 2450),
+    'ST': ('Sweeper', 82.0, 1.0, -14.0, 2600),
+    'CU': ('Curveball', 79.0, -9.0, -8.0, 2550),
+    'CH': ('Changeup', 86.0, 7.0, 14.0, 1750),
+    'FS': ('Splitter', 86.0, 3.0, 9.0, 1400),
+}
+
+# Outcome probabilities of a pitch, before the count decides what it means
+PITCH_OUTCOMES = [('B', 0.36), ('C', 0.17), ('S', 0.11), ('F', 0.18), ('X', 0.175), ('H', 0.005)]
+CALL_DESCRIPTIONS = {'B': 'Ball', 'C': 'Called Strike', 'S': 'Swinging Strike', 'F': 'Foul', 'X': 'In play, out(s)', 'H': 'Hit By Pitch'}
+
+# Results of a ball in play -> (event, eventType, bases, probability)
+IN_PLAY_RESULTS = [('Groundout', 'field_out', 0, 0.36), ('Flyout', 'field_out', 0, 0.24), ('Lineout', 'field_out', 0, 0.08),
+                   ('Single', 'single', 1, 0.19), ('Double', 'double', 2, 0.07), ('Triple', 'triple', 3, 0.01),
+                   ('Home Run', 'home_run', 4, 0.05)]
+
+
+def _choice(rng, weighted):
+    # Picks from a list of (value, ..., weight) tuples, the weight being the last item
+    point = rng.random() * sum(item[-1] for item in weighted)
+    for item in weighted:
+        point -= item[-1]
+        if point <= 0:
+            return item
+    return weighted[-1]
+
+
+def _uuid(rng):
+    value = f'{rng.getrandbits(128):032x}'
+    return f'{value[:8]}-{value[8:12]}-{value[12:16]}-{value[16:20]}-{value[20:]}'
+
+
+def _zone(px, pz):
+    # The Gameday zone: 1-9 across the strike zone (top left to bottom right), 11-14 for the four quadrants outside it
+    if abs(px) <= 0.83 and 1.5 <= pz <= 3.5:
+        return 1 + 3 * min(int((3.5 - pz) / (2 / 3)), 2) + min(int((px + 0.83) / (1.66 / 3)), 2)
+    return (11 if px < 0 else 12) + (0 if pz >= 2.5 else 2)
+
+
+class _Pitcher:
+    def __init__(self, rng, player_id, name):
+        self.id = player_id
+        self.name = name
+        self.hand = 'R' if rng.random() < 0.7 else 'L'
+        self.pitches = 0
+        # Three to five pitch types, a fastball first, with their own weights and velocity offset
+        fastball = rng.choice(['FF', 'FF', 'SI'])
+        others = rng.sample([t for t in PITCH_TYPES if t != fastball], rng.randint(2, 4))
+        self.mix = [(fastball, rng.uniform(0.35, 0.6))] + [(t, rng.uniform(0.08, 0.3)) for t in others]
+        self.velocity = rng.gauss(0, 1.5)
+        self.extension = rng.uniform(5.6, 7.0)
+        self.release = (rng.uniform(-2.5, -1.0) * (1 if self.hand == 'R' else -1), rng.uniform(5.2, 6.4))
+
+
+def _pitch_data(rng, pitcher, pitch_type):
+    _, velocity, ivb, hb, spin = PITCH_TYPES[pitch_type]
+    side = 1 if pitcher.hand == 'R' else -1
+    start_speed = rng.gauss(velocity + pitcher.velocity, 1.0)
+    px, pz = rng.gauss(0, 0.85), rng.gauss(2.4, 0.85)
+    ivb, hb = rng.gauss(ivb, 2.0), rng.gauss(hb, 2.5) * side
+    return {
+        'startSpeed': round(start_speed, 1),
+        'endSpeed': round(start_speed * rng.uniform(0.9, 0.93), 1),
+        'strikeZoneTop': round(rng.uniform(3.2, 3.6), 2),
+        'strikeZoneBottom': round(rng.uniform(1.5, 1.7), 2),
+        'coordinates': {
+            'aY': round(rng.uniform(24, 34), 2), 'aZ': round(-32.174 + ivb * 1.1, 2), 'pfxX': round(hb / 2.1, 2),
+            'pfxZ': round(ivb / 2.1, 2), 'pX': round(px, 3), 'pZ': round(pz, 3), 'vX0': round(rng.gauss(5 * side, 2), 2),
+            'vY0': round(-start_speed * 1.45, 2), 'vZ0': round(rng.gauss(-5, 2), 2), 'x0': round(pitcher.release[0], 2),
+            'y0': 50.0, 'z0': round(pitcher.release[1] + rng.gauss(0, 0.1), 2), 'aX': round(hb * -0.9, 2),
+            'x': round(117 - px * 40, 2), 'y': round(190 - pz * 30, 2),
+        },
+        'breaks': {'breakAngle': round(rng.uniform(-40, 40), 1), 'breakLength': round(rng.uniform(3, 15), 1),
+                   'breakY': 24.0, 'breakVertical': round(ivb - 30 + (95 - start_speed) * 0.5, 1),
+                   'breakVerticalInduced': round(ivb, 1), 'breakHorizontal': round(hb, 1),
+                   'spinRate': int(rng.gauss(spin, 90)), 'spinDirection': int(rng.uniform(0, 360))},
+        'zone': _zone(px, pz),
+        'typeConfidence': round(rng.uniform(0.8, 2.0), 2),
+        'plateTime': round(60.5 / (start_speed * 1.467), 3),
+        'extension': round(pitcher.extension + rng.gauss(0, 0.1), 2),
+    }
+
+
+def _hit_data(rng, event_type):
+    launch_angle = {'field_out': rng.gauss(12, 28), 'single': rng.gauss(8, 12), 'double': rng.gauss(18, 10),
+                    'triple': rng.gauss(20, 8), 'home_run': rng.gauss(28, 5)}[event_type]
+    trajectory = ('ground_ball' if launch_angle < 10 else 'line_drive' if launch_angle < 25 else 'fly_ball' if launch_angle < 50 else 'popup')
+    launch_speed = rng.gauss(104, 4) if event_type == 'home_run' else rng.gauss(88, 12)
+    return {'launchSpeed': round(launch_speed, 1), 'launchAngle': round(launch_angle, 1),
+            'totalDistance': round(launch_speed * 4.2 * math.sin(math.radians(2 * min(max(launch_angle, 1), 89))) ** 0.5, 0),
+            'trajectory': trajectory, 'hardness': 'hard' if launch_speed > 95 else 'medium' if launch_speed > 75 else 'soft',
+            'location': str(rng.randint(1, 9)),
+            'coordinates': {'coordX': round(rng.uniform(20, 230), 2), 'coordY': round(rng.uniform(20, 200), 2)}}
+
+
+def synthetic_feed(game_pk: int, seed: int = 0, game_date: str = '2024-04-01', missing_pitch_data: float = 0.03,
+                   missing_hit_data: float = 0.05, innings: int = 9):
+    """
+    Generates one final game.
+
+    Parameters:
+    - game_pk (int): The game id, also mixed into the random seed.
+    - seed (int): The random seed. Default is 0.
+    - game_date (str): The officialDate of the game (YYYY-MM-DD). Default is '2024-04-01'.
+    - missing_pitch_data (float): The share of pitches without pitchData. Default is 0.03.
+    - missing_hit_data (float): The share of balls in play without hitData. Default is 0.05.
+    - innings (int): The number of innings played. Default is 9.
+
+    Returns:
+    - feed (dict): The feed/live document.
+    """
+    rng = random.Random(seed * 1_000_003 + game_pk)
+    teams = {}
+    for side, team_id in (('away', 100 + game_pk % 30), ('home', 130 + game_pk % 30)):
+        abbreviation = f'T{team_id:02d}'
+        lineup = [(600000 + team_id * 100 + i, f'Batter {team_id}-{i}', rng.choice('RRLLS')) for i in range(9)]
+        staff = [_Pitcher(rng, 700000 + team_id * 100 + i, f'Pitcher {team_id}-{i}') for i in range(8)]
+        teams[side] = {'id': team_id, 'abbreviation': abbreviation, 'lineup': lineup, 'staff': staff, 'pitcher': 0, 'next_batter': 0}
+
+    plays = []
+    score = {'away': 0, 'home': 0}
+    clock = datetime.fromisoformat(f'{game_date}T18:05:00')
+
+    for inning in range(1, innings + 1):
+        for top in (True, False):
+            batting, fielding = ('away', 'home') if top else ('home', 'away')
+            defense = teams[fielding]
+            pitcher = defense['staff'][defense['pitcher']]
+            # Starters go about 90 pitches, relievers about 25
+            if pitcher.pitches > (90 if defense['pitcher'] == 0 else 25) and defense['pitcher'] < len(defense['staff']) - 1:
+                defense['pitcher'] += 1
+                pitcher = defense['staff'][defense['pitcher']]
+            outs = 0
+            while outs < 3:
+                offense = teams[batting]
+                batter_id, batter_name, bat_side = offense['lineup'][offense['next_batter'] % 9]
+                offense['next_batter'] += 1
+                if bat_side == 'S':
+                    bat_side = 'L' if pitcher.hand == 'R' else 'R'
+
+                events = []
+                balls = strikes = 0
+                result = None
+                pitch_number = 0
+
+                # A small share of plate appearances are automatic intentional walks with no pitch thrown
+                if rng.random() < 0.004:
+                    events.append({'details': {'description': 'Intent Walk', 'event': 'Intent Walk', 'eventType': 'intent_walk',
+                                               'isOut': False, 'hasReview': False},
+                                   'count': {'balls': 4, 'strikes': 0, 'outs': outs}, 'index': 0, 'isPitch': False, 'type': 'action',
+                                   'startTime': clock.isoformat() + 'Z', 'endTime': clock.isoformat() + 'Z'})
+                    result = ('Intent Walk', 'intent_walk', False, 0)
+
+                while result is None:
+                    # Occasional pickoff throws between pitches
+                    if rng.random() < 0.02:
+                        events.append({'details': {'description': 'Pickoff Attempt 1B', 'code': '1', 'isOut': False, 'hasReview': False},
+                                       'count': {'balls': balls, 'strikes': strikes, 'outs': outs}, 'index': len(events),
+                                       'isPitch': False, 'type': 'pickoff', 'startTime': clock.isoformat() + 'Z', 'endTime': clock.isoformat() + 'Z'})
+
+                    pitch_type = _choice(rng, pitcher.mix)[0]
+                    code = _choice(rng, PITCH_OUTCOMES)[0]
+                    pitch_number += 1
+                    pitcher.pitches += 1
+                    if code == 'B':
+                        balls += 1
+                    elif code in ('C', 'S'):
+                        strikes += 1
+                    elif code == 'F' and strikes < 2:
+                        strikes += 1
+
+                    in_play = code == 'X'
+                    strikeout = strikes == 3
+                    if in_play:
+                        event, event_type, bases, _ = _choice(rng, IN_PLAY_RESULTS)
+                        is_out = event_type == 'field_out'
+                        outs += is_out
+                        runs = 1 if bases == 4 else (1 if bases >= 2 and rng.random() < 0.3 else 0)
+                        result = (event, event_type, is_out, runs)
+                    elif code == 'H':
+                        result = ('Hit By Pitch', 'hit_by_pitch', False, 0)
+                    elif balls == 4:
+                        result = ('Walk', 'walk', False, 0)
+                    elif strikeout:
+                        outs += 1
+                        result = ('Strikeout', 'strikeout', True, 0)
+
+                    end = clock + timedelta(seconds=rng.uniform(12, 25))
+                    pitch = {'details': {'call': {'code': code, 'description': CALL_DESCRIPTIONS[code]},
+                                         'description': CALL_DESCRIPTIONS[code], 'code': code, 'isInPlay': in_play,
+                                         'isStrike': code in ('C', 'S', 'F', 'X'), 'isBall': code == 'B',
+                                         'isOut': (in_play and result[2]) or strikeout, 'hasReview': rng.random() < 0.002,
+                                         'type': {'code': pitch_type, 'description': PITCH_TYPES[pitch_type][0]}},
+                             'count': {'balls': min(balls, 4), 'strikes': min(strikes, 3), 'outs': outs},
+                             'index': len(events), 'playId': _uuid(rng), 'pitchNumber': pitch_number,
+                             'startTime': clock.isoformat() + 'Z', 'endTime': end.isoformat() + 'Z', 'isPitch': True, 'type': 'pitch'}
+                    if rng.random() >= missing_pitch_data:
+                        pitch['pitchData'] = _pitch_data(rng, pitcher, pitch_type)
+                    if in_play and rng.random() >= missing_hit_data:
+                        pitch['hitData'] = _hit_data(rng, result[1])
+                    events.append(pitch)
+                    clock = end
+
+                event, event_type, is_out, runs = result
+                score[batting] += runs
+                plays.append({
+                    'result': {'type': 'atBat', 'event': event, 'eventType': event_type, 'description': f'{batter_name}: {event}',
+                               'rbi': runs, 'awayScore': score['away'], 'homeScore': score['home'], 'isOut': is_out},
+                    'about': {'atBatIndex': len(plays), 'halfInning': 'top' if top else 'bottom', 'isTopInning': top, 'inning': inning,
+                              'isComplete': True},
+                    'count': {'balls': min(balls, 4), 'strikes': min(strikes, 3), 'outs': outs},
+                    'matchup': {'batter': {'id': batter_id, 'fullName': batter_name}, 'batSide': {'code': bat_side},
+                                'pitcher': {'id': pitcher.id, 'fullName': pitcher.name}, 'pitchHand': {'code': pitcher.hand}},
+                    'playEvents': events,
+                    'atBatIndex': len(plays),
+                })
+
+    return {
+        'gamePk': game_pk,
+        'gameData': {
+            'game': {'pk': game_pk, 'type': 'R', 'season': game_date[:4]},
+            'datetime': {'officialDate': game_date},
+            'status': {'abstractGameState': 'Final', 'codedGameState': 'F', 'detailedState': 'Final'},
+            'teams': {side: {'id': team['id'], 'abbreviation': team['abbreviation'], 'name': f"Team {team['id']}"}
+                      for side, team in teams.items()},
+            'venue': {'id': 5000 + game_pk % 30, 'name': f'Park {game_pk % 30}'},
+        },
+        'liveData': {'plays': {'allPlays': plays}},
+    }
+
+
+def synthetic_feeds(n_games: int = None, n_pitches: int = None, seed: int = 0, first_game_pk: int = 900000, as_bytes: bool = False, **kwargs):
+    """
+    Yields synthetic games until n_games games or n_pitches pitches have been generated.
+
+    Parameters:
+    - n_games (int): The number of games. Default is None.
+    - n_pitches (int): Keep generating games until they hold at least this many pitches. Default is None.
+    - seed (int): The random seed. Default is 0.
+    - first_game_pk (int): The game id of the first game, the next ones count up from it. Default is 900000.
+    - as_bytes (bool): Yield the JSON bytes, as get_data(raw=True) returns them, instead of dictionaries. Default is False.
+    - **kwargs: Passed on to synthetic_feed.
+
+    Yields:
+    - feed (dict or bytes): One game per iteration, one day apart.
+    """
+    if n_games is None and n_pitches is None:
+        raise ValueError('give n_games or n_pitches')
+    pitches = 0
+    game = 0
+    start = datetime(2024, 3, 28)
+    while (n_games is None or game < n_games) and (n_pitches is None or pitches < n_pitches):
+        feed = synthetic_feed(first_game_pk + game, seed=seed, game_date=(start + timedelta(days=game // 15)).strftime('%Y-%m-%d'), **kwargs)
+        pitches += sum(1 for play in feed['liveData']['plays']['allPlays'] for event in play['playEvents'] if event.get('isPitch'))
+        game += 1
+        yield json.dumps(feed).encode() if as_bytes else feed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('output', help='folder the .json.gz feeds are written to')
+    parser.add_argument('--games', type=int, help='number of games')
+    parser.add_argument('--pitches', type=int, help='generate games until they hold this many pitches')
+    parser.add_argument('--seed', type=int, default=0, help='random seed')
+    args = parser.parse_args()
+    if args.games is None and args.pitches is None:
+        parser.error('give --games or --pitches')
+
+    os.makedirs(args.output, exist_ok=True)
+    count = 0
+    for count, content in enumerate(synthetic_feeds(n_games=args.games, n_pitches=args.pitches, seed=args.seed, as_bytes=True), 1):
+        game_pk = json.loads(content)['gamePk']
+        with gzip.open(os.path.join(args.output, f'{game_pk}.json.gz'), 'wb') as f:
+            f.write(content)
+    print(f'Wrote {count} games to {args.output}.')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,46 @@
+"""
+Crawls every game of a season schedule into the local pitch store, for unattended overnight rebuilds.
+Progress is checkpointed to a manifest, so running the same command again after an interruption resumes the crawl.
+Games without pitch tracking are found with a small probe and skipped, unless --include-untracked is given.
+
+Usage:
+    python crawl_season.py --season 2025 --sport-id 22              # the NCAA season into DEFAULT_STORE_DIR
+    python crawl_season.py --season 2024 2025 --sport-id 1 --game-type R F D L W --store path/to/store
+"""
+import argparse
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from api_scraper import MLB_Scrape, PitchStore, SeasonCrawler, TrackingIndex, DEFAULT_CACHE_DIR, DEFAULT_STORE_DIR
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--season', type=int, nargs='+', required=True, help='season(s) to crawl')
+    parser.add_argument('--sport-id', type=int, nargs='+', default=[1], help='sport id(s), 1 for MLB and 22 for college baseball')
+    parser.add_argument('--game-type', nargs='+', default=['R'], help='game type code(s), default R (regular season)')
+    parser.add_argument('--store', default=DEFAULT_STORE_DIR, help='pitch store directory')
+    parser.add_argument('--manifest', help='checkpoint manifest, default crawl_manifest.json in the store directory')
+    parser.add_argument('--workers', type=int, default=8, help='downloads in flight at once')
+    parser.add_argument('--include-untracked', action='store_true', help='also crawl games without pitch tracking')
+    parser.add_argument('--tracking-index', default=os.path.join(DEFAULT_CACHE_DIR, 'tracking.json'), help='pitch tracking index file')
+    parser.add_argument('--report-every', type=float, default=30, help='seconds between progress lines')
+    args = parser.parse_args()
+
+    scraper = MLB_Scrape(max_workers=args.workers, cache_dir=DEFAULT_CACHE_DIR)
+    schedule = scraper.get_schedule(year_input=args.season, sport_id=args.sport_id, game_type=args.game_type)
+    if isinstance(schedule, str):
+        # get_schedule returns a message when there are no games
+        print(schedule)
+        return
+
+    crawler = SeasonCrawler(scraper, PitchStore(args.store), manifest_path=args.manifest, report_every=args.report_every)
+    tracking_index = None if args.include_untracked else TrackingIndex(args.tracking_index)
+    summary = crawler.crawl(schedule, tracking_index=tracking_index)
+    print('Crawl finished:', ', '.join(f'{count} {status}' for status, count in sorted(summary.items())))
+    print(f'Manifest: {crawler.manifest_path}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,89 @@
+import glob
+import gzip
+import json
+import os
+import sys
+import threading
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+
+import pytest
+
+PROJECT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, PROJECT_DIR)
+sys.path.insert(0, os.path.join(PROJECT_DIR, 'benchmarks'))
+
+from api_scraper import MLB_Scrape
+
+# Four short made-up games in the feed/live layout, stored gzip-compressed as <gamePk>.json.gz. They are not real games,
+# only shaped like them
+SAMPLE_GAMES = sorted(glob.glob(os.path.join(PROJECT_DIR, 'tests', 'fixtures', 'sample_games', '*.json.gz')))
+
+
+@pytest.fixture(scope='session')
+def feeds():
+    # Raw bytes of the sample games
+    contents = []
+    for path in SAMPLE_GAMES:
+        with open(path, 'rb') as f:
+            contents.append(gzip.decompress(f.read()))
+    return contents
+
+
+@pytest.fixture
+def scraper():
+    return MLB_Scrape(cache_dir=None)
+
+
+@pytest.fixture(scope='session')
+def pitch_df(feeds):
+    return MLB_Scrape(cache_dir=None).get_data_df([json.loads(content) for content in feeds])
+
+
+class LocalServer:
+    """
+    A local HTTP server answering each path from a queue of (status, headers, body) responses, the last one repeating.
+    Every request is kept in self.requests as (path, headers).
+    """
+
+    def __init__(self):
+        self.responses = {}
+        self.requests = []
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(handler):
+                server.requests.append((handler.path, dict(handler.headers)))
+                queue = server.responses.get(handler.path, [(404, {}, b'')])
+                status, headers, body = queue.pop(0) if len(queue) > 1 else queue[0]
+                handler.send_response(status)
+                for name, value in headers.items():
+                    handler.send_header(name, value)
+                handler.send_header('Content-Length', str(len(body)))
+                handler.end_headers()
+                handler.wfile.write(body)
+
+            def log_message(handler, *args):
+                pass
+
+        Handler.protocol_version = 'HTTP/1.1'
+        self.httpd = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+        self.httpd.daemon_threads = True
+        threading.Thread(target=self.httpd.serve_forever, daemon=True).start()
+
+    def url(self, path):
+        host, port = self.httpd.server_address[:2]
+        return f'http://{host}:{port}{path}'
+
+    def respond(self, path, *responses):
+        self.responses[path] = list(responses)
+
+    def hits(self, path):
+        return sum(1 for requested, _ in self.requests if requested == path)
+
+
+@pytest.fixture
+def server():
+    local = LocalServer()
+    yield local
+    local.httpd.shutdown()
+    local.httpd.server_close()
@@ -0,0 +1,35 @@
+import polars as pl
+
+from api_scraper import _column_bytes, compact_pitch_schema, pitch_memory_report
+
+
+def test_memory_report_lists_every_column(pitch_df):
+    report = pitch_memory_report(pitch_df)
+    columns = report.filter(pl.col('column') != 'total')
+
+    assert report['column'][-1] == 'total'
+    assert sorted(columns['column']) == sorted(pitch_df.columns)
+    schema = compact_pitch_schema()
+    for name, dtype, compact_dtype in columns.select('column', 'dtype', 'compact_dtype').rows():
+        assert dtype == str(pitch_df.schema[name]) and compact_dtype == str(schema[name])
+
+    # Sorted by the bytes saved, with the totals adding up
+    saved = (columns['bytes_per_pitch'] - columns['compact_bytes_per_pitch']).to_list()
+    assert saved == sorted(saved, reverse=True)
+    total = report.row(-1, named=True)
+    assert total['bytes_per_pitch'] == columns['bytes_per_pitch'].sum()
+    assert total['compact_bytes_per_pitch'] == columns['compact_bytes_per_pitch'].sum()
+    assert total['ratio'] > 1
+
+
+def test_memory_report_float32_is_smaller(pitch_df):
+    default = pitch_memory_report(pitch_df).row(-1, named=True)
+    float32 = pitch_memory_report(pitch_df, float32=True).row(-1, named=True)
+    assert float32['bytes_per_pitch'] == default['bytes_per_pitch']
+    assert float32['compact_bytes_per_pitch'] < default['compact_bytes_per_pitch']
+
+
+def test_string_bytes_count_the_views():
+    # A 16-byte view per row, the characters of strings longer than 12 bytes, and the null bitmap
+    assert _column_bytes(pl.Series(['a', 'x' * 20, None])) == 16 * 3 + 20 + 1
+    assert _column_bytes(pl.Series([1.0, 2.0], dtype=pl.Float64)) == 16
@@ -0,0 +1,102 @@
+import json
+from datetime import date
+
+import polars as pl
+import requests
+
+import api_scraper
+from api_scraper import FixtureArchive, FixtureServer, MLB_Scrape, PitchStore, SeasonCrawler, TrackingIndex
+
+
+def feed_source(scraper, feeds):
+    # Serves the feeds by game ID instead of downloading them, a game that is not there fails like a dropped connection
+    requested = []
+
+    def get_game_feed_bytes(game_id):
+        requested.append(game_id)
+        if game_id not in feeds:
+            raise requests.ConnectionError(f'no feed for game {game_id}')
+        return feeds[game_id]
+    scraper.get_game_feed_bytes = get_game_feed_bytes
+    return requested
+
+
+def test_crawler_resumes_where_it_stopped(tmp_path, feeds):
+    game_ids = [json.loads(content)['gamePk'] for content in feeds]
+    store = PitchStore(str(tmp_path / 'store'))
+    # The last game is missing, so the first run fails it
+    scraper = MLB_Scrape(cache_dir=None)
+    feed_source(scraper, dict(zip(game_ids[:-1], feeds[:-1])))
+    summary = SeasonCrawler(scraper, store, report_every=3600).crawl(game_ids)
+    assert summary == {'stored': len(game_ids) - 1, 'failed': 1}
+
+    scraper = MLB_Scrape(cache_dir=None)
+    requested = feed_source(scraper, dict(zip(game_ids, feeds)))
+    crawler = SeasonCrawler(scraper, store, report_every=3600)
+    assert crawler.pending(game_ids) == game_ids[-1:]
+    summary = crawler.crawl(game_ids)
+
+    # Only the failed game was downloaded again
+    assert summary == {'stored': len(game_ids)}
+    assert requested == game_ids[-1:]
+    assert crawler.manifest['games'][str(game_ids[-1])]['attempts'] == 2
+    assert store.games() == set(game_ids)
+
+
+def test_crawler_gives_up_after_max_attempts(tmp_path, feeds):
+    game_id = json.loads(feeds[0])['gamePk']
+    store = PitchStore(str(tmp_path / 'store'))
+    for _ in range(2):
+        scraper = MLB_Scrape(cache_dir=None)
+        feed_source(scraper, {})
+        SeasonCrawler(scraper, store, report_every=3600).crawl([game_id], max_attempts=2)
+
+    scraper = MLB_Scrape(cache_dir=None)
+    requested = feed_source(scraper, {})
+    crawler = SeasonCrawler(scraper, store, report_every=3600)
+    crawler.crawl([game_id], max_attempts=2)
+    assert crawler.manifest['games'][str(game_id)]['attempts'] == 2
+    assert requested == []
+
+
+def test_crawler_skips_untracked_games(tmp_path, feeds, monkeypatch):
+    game_ids = [json.loads(content)['gamePk'] for content in feeds]
+    # Three games at a tracked venue and one at a venue without tracking
+    venues = [1, 1, 1, 2]
+    tracked = b'{"liveData": {"plays": {"allPlays": [{"playEvents": [{"pitchData": {"startSpeed": 91.2}}]}]}}}'
+    untracked = b'{"liveData": {"plays": {"allPlays": [{"playEvents": [{}]}]}}}'
+    archive = FixtureArchive(str(tmp_path / 'fixtures'))
+    for game_id, content, venue_id in zip(game_ids, feeds, venues):
+        speeds = tracked if venue_id == 1 else untracked
+        archive.put('GET', f'https://statsapi.mlb.com/api/v1.1/game/{game_id}/feed/live?fields=liveData,plays,allPlays,playEvents,pitchData,startSpeed',
+                    200, {'Content-Type': 'application/json'}, speeds)
+        archive.put('GET', f'https://statsapi.mlb.com/api/v1.1/game/{game_id}/feed/live', 200, {'Content-Type': 'application/json'}, content)
+    requested = []
+    archive_get = archive.get
+
+    def get(method, url):
+        requested.append(url.removeprefix('https://statsapi.mlb.com/api/v1.1/game/'))
+        return archive_get(method, url)
+    archive.get = get
+
+    schedule = pl.DataFrame({'game_id': game_ids, 'date': [date(2024, 4, 1)] * len(game_ids), 'venue_id': venues, 'state': ['F'] * len(game_ids)})
+    fixture_server = FixtureServer(archive).start()
+    try:
+        monkeypatch.setattr(api_scraper, 'FIXTURE_SERVER', fixture_server.url)
+        # One worker probes in order, so the venue answer is settled before the third game
+        scraper = MLB_Scrape(max_workers=1)
+        tracking_index = TrackingIndex(str(tmp_path / 'tracking.json'), venue_threshold=2)
+        crawler = SeasonCrawler(scraper, PitchStore(str(tmp_path / 'store')), report_every=3600)
+        summary = crawler.crawl(schedule, tracking_index=tracking_index)
+    finally:
+        fixture_server.stop()
+
+    assert summary == {'stored': 3, 'untracked': 1}
+    probes = sorted(url.split('/')[0] for url in requested if '?fields=' in url)
+    feeds_downloaded = sorted(url.split('/')[0] for url in requested if url.endswith('/feed/live'))
+    # The third game of the tracked venue takes the venue's answer without a probe
+    assert probes == [str(game_ids[0]), str(game_ids[1]), str(game_ids[3])]
+    # The untracked game's feed is never downloaded
+    assert feeds_downloaded == [str(game_id) for game_id in game_ids[:3]]
+    assert TrackingIndex(str(tmp_path / 'tracking.json')).is_tracked(game_ids[3]) is False
+    assert tracking_index.stats()['probes'] == 3
@@ -0,0 +1,92 @@
+import json
+import os
+import sys
+
+import pytest
+
+pd = pytest.importorskip('pandas')
+pytest.importorskip('matplotlib')
+pytest.importorskip('seaborn')
+
+import matplotlib
+matplotlib.use('Agg')
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'Dashboard app'))
+import OSU_Dashboard
+import api_scraper
+from synthetic_feeds import synthetic_feed
+
+# Games of the same two teams, so their pitchers appear in every game, listed out of game ID order like osu_games
+GAME_IDS = [900060, 900000, 900030]
+COUNTS = [(balls, strikes) for balls in [0, 1, 2, 3] for strikes in [0, 1, 2]]
+
+
+@pytest.fixture
+def dashboard(tmp_path, monkeypatch):
+    # The dashboard reads the games through the pitch store, downloading them from a replayed fixture archive
+    archive = api_scraper.FixtureArchive(str(tmp_path / 'fixtures'))
+    feeds = {}
+    for game_id in GAME_IDS:
+        feeds[game_id] = synthetic_feed(game_id, seed=3)
+        archive.put('GET', f'https://statsapi.mlb.com/api/v1.1/game/{game_id}/feed/live', 200, {}, json.dumps(feeds[game_id]).encode())
+    scraper = api_scraper.MLB_Scrape(fixture_dir=str(tmp_path / 'fixtures'), fixture_mode='replay')
+
+    monkeypatch.setattr(OSU_Dashboard, 'pitch_store', api_scraper.PitchStore(str(tmp_path / 'store')))
+    monkeypatch.setattr(OSU_Dashboard, 'season_frames', api_scraper.FrameCache())
+    monkeypatch.setattr(OSU_Dashboard, 'dashboard_scraper', lambda: scraper)
+    monkeypatch.setattr(OSU_Dashboard, 'unavailable_games', {})
+    monkeypatch.setattr(OSU_Dashboard, 'osu_games', {2024: GAME_IDS})
+
+    # The frame the dashboard built before the pitch store: every game parsed in list order, filtered without renumbering
+    year_df = OSU_Dashboard.stat_frame(api_scraper.MLB_Scrape(cache_dir=None).get_data_df([feeds[game_id] for game_id in GAME_IDS]))
+    return OSU_Dashboard, year_df
+
+
+def pitchers(year_df):
+    # The pitchers with the most pitches, whose rows span every game
+    return year_df['pitcher_name'].value_counts().index[:6].tolist()
+
+
+def test_player_frames_match_a_filter_of_the_season_frame(dashboard):
+    board, year_df = dashboard
+    for name in pitchers(year_df):
+        expected = year_df[year_df['pitcher_name'] == name]
+        df = board.player_year_data(name, 2024)
+        pd.testing.assert_frame_equal(df, expected[df.columns], check_dtype=False)
+
+
+def test_after_counts_match_the_season_frame(dashboard):
+    board, year_df = dashboard
+    for name in pitchers(year_df):
+        expected = year_df[year_df['pitcher_name'] == name]
+        df = board.player_year_data(name, 2024)
+        for balls, strikes in COUNTS:
+            pd.testing.assert_frame_equal(board.after(df, balls, strikes), board.after(expected, balls, strikes))
+
+
+def test_stat_data_has_every_column_by_default(dashboard):
+    board, year_df = dashboard
+    pd.testing.assert_frame_equal(board.get_stat_data(GAME_IDS), year_df, check_dtype=False)
+    assert board.get_stat_data(GAME_IDS, columns=board.dashboard_columns).columns.tolist() == board.dashboard_columns + ['in_zone', 'out_zone', 'chase', 'year']
+
+
+def plinko_output(board, name):
+    # The line widths and pie wedges of the plinko chart
+    plt = board.plt
+    fig = plt.figure(figsize=(10, 10))
+    gs = board.gridspec.GridSpec(10, 10, figure=fig)
+    ax = fig.add_subplot(gs[0:10, 0:10])
+    board.plinko_chart(name, 2024, fig, ax, gs, [0, 10], [0, 10])
+    lines = [artist.get_linewidth() for artist in ax.artists]
+    wedges = [[(wedge.theta1, wedge.theta2, tuple(wedge.get_facecolor())) for wedge in pie.patches] for pie in fig.axes if pie is not ax]
+    plt.close(fig)
+    return lines, wedges
+
+
+def test_plinko_chart_matches_the_season_frame(dashboard, monkeypatch):
+    board, year_df = dashboard
+    name = pitchers(year_df)[0]
+    drawn = plinko_output(board, name)
+
+    monkeypatch.setattr(board, 'player_year_data', lambda playername, year: year_df[year_df['pitcher_name'] == playername])
+    assert drawn == plinko_output(board, name)
@@ -0,0 +1,64 @@
+import glob
+import gzip
+import json
+import os
+
+import pytest
+from polars.testing import assert_frame_equal
+
+from api_scraper import MLB_Scrape
+from synthetic_feeds import synthetic_feeds
+
+# Recorded feed/live responses of real games, gzip-compressed as <gamePk>.json.gz. A game is recorded with
+# gzip.compress(MLB_Scrape().get_game_feed_bytes(game_pk)), the parity tests on real feeds are skipped until there are some
+RECORDED_FEEDS = sorted(glob.glob(os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures', 'feeds', '*.json.gz')))
+
+
+OPTIONS = [{},
+           {'columns': ['game_id', 'pitcher_name', 'balls', 'strikes', 'pitch_type', 'start_speed', 'event_type', 'launch_speed']},
+           {'compact_dtypes': True},
+           {'compact_dtypes': True, 'float32': True}]
+
+
+def assert_engines_agree(contents, **options):
+    scraper = MLB_Scrape(cache_dir=None)
+    python_df = scraper.get_data_df([json.loads(content) for content in contents], engine='python', **options)
+    # The polars engine takes decoded feeds as well as the raw bytes
+    assert_frame_equal(scraper.get_data_df([json.loads(content) for content in contents], engine='polars', **options), python_df)
+    assert_frame_equal(scraper.get_data_df(contents, engine='polars', **options), python_df)
+    return python_df
+
+
+@pytest.mark.parametrize('options', OPTIONS)
+def test_engines_agree_on_sample_games(feeds, options):
+    assert assert_engines_agree(feeds, **options).height > 0
+
+
+@pytest.mark.parametrize('kwargs', [{'missing_pitch_data': 0.5, 'missing_hit_data': 0.5}, {'innings': 12}, {'innings': 1}])
+def test_engines_agree_on_unusual_games(kwargs):
+    assert_engines_agree(list(synthetic_feeds(n_games=3, seed=11, as_bytes=True, **kwargs)))
+
+
+def test_engines_agree_when_matchup_or_breaks_are_missing(feeds):
+    game = json.loads(feeds[3])
+    plays = game['liveData']['plays']['allPlays']
+    # Two plate appearances without a matchup, one of them ending in an automatic ball four, and pitches without breaks
+    walk = next(i for i, play in enumerate(plays) for event in play['playEvents']
+                if not event['isPitch'] and 'call' not in event['details'] and event['count'].get('balls') == 4)
+    for i in (0, walk):
+        del plays[i]['matchup']
+    for event in plays[1]['playEvents']:
+        event.get('pitchData', {}).pop('breaks', None)
+
+    df = assert_engines_agree([json.dumps(game).encode()])
+    assert df['pitcher_name'].null_count() > 0 and df['spin_rate'].null_count() > 0
+
+
+@pytest.mark.skipif(not RECORDED_FEEDS, reason='no recorded feeds in tests/fixtures/feeds')
+@pytest.mark.parametrize('options', OPTIONS)
+def test_engines_agree_on_recorded_feeds(options):
+    contents = []
+    for path in RECORDED_FEEDS:
+        with open(path, 'rb') as f:
+            contents.append(gzip.decompress(f.read()))
+    assert_engines_agree(contents, **options)
@@ -0,0 +1,95 @@
+import json
+import time
+
+import requests
+
+from api_scraper import FeedCache, MLB_Scrape
+
+
+def test_feed_cache_round_trip_and_reload(tmp_path, feeds):
+    cache = FeedCache(str(tmp_path))
+    assert cache.get(1) is None
+    cache.put(1, feeds[0], 'F')
+    assert cache.get(1) == feeds[0]
+    assert cache.stats()['hits'] == 1 and cache.stats()['misses'] == 1
+
+    # A new cache over the same directory sees the game once the index is flushed
+    cache.flush()
+    assert FeedCache(str(tmp_path)).get(1) == feeds[0]
+
+
+def test_feed_cache_writes_the_index_in_batches(tmp_path, feeds):
+    cache = FeedCache(str(tmp_path), save_every=3)
+    cache.put(1, feeds[0], 'F')
+    cache.put(2, feeds[1], 'F')
+    assert not (tmp_path / 'index.json').exists()
+
+    cache.put(3, feeds[2], 'F')
+    assert set(FeedCache(str(tmp_path)).index) == {'1', '2', '3'}
+    cache.put(4, feeds[3], 'F')
+    assert set(FeedCache(str(tmp_path)).index) == {'1', '2', '3'}
+    cache.flush()
+    assert set(FeedCache(str(tmp_path)).index) == {'1', '2', '3', '4'}
+
+
+def test_downloads_flush_the_feed_cache_once(tmp_path, feeds, monkeypatch):
+    contents = {json.loads(content)['gamePk']: content for content in feeds}
+    scraper = MLB_Scrape(cache_dir=str(tmp_path))
+
+    def get(url, **kwargs):
+        response = requests.Response()
+        response.status_code = 200
+        response._content = contents[int(url.split('/')[-3])]
+        return response
+    monkeypatch.setattr(scraper.session, 'get', get)
+    writes = []
+    save_index = scraper.feed_cache._save_index
+    monkeypatch.setattr(scraper.feed_cache, '_save_index', lambda: (writes.append(1), save_index()))
+
+    scraper.get_data(list(contents), raw=True)
+    # The index is written once at the end of the download, not once per game
+    assert len(writes) == 1
+    assert set(FeedCache(str(tmp_path / 'feeds')).index) == {str(game_id) for game_id in contents}
+
+
+def test_feed_cache_live_games_expire(tmp_path, feeds):
+    cache = FeedCache(str(tmp_path), live_ttl=60)
+    cache.put(1, feeds[0], 'I')
+    cache.put(2, feeds[1], 'F')
+    assert cache.get(1) == feeds[0]
+
+    # Once live_ttl has passed only the final game is still served
+    for entry in cache.index.values():
+        entry['fetched'] -= 120
+    assert cache.get(1) is None
+    assert cache.get(2) == feeds[1]
+
+
+def test_feed_cache_evicts_least_recently_used(tmp_path, feeds):
+    sizes = []
+    probe = FeedCache(str(tmp_path / 'probe'))
+    for i, content in enumerate(feeds[:3]):
+        probe.put(i, content, 'F')
+        sizes.append(probe.index[str(i)]['bytes'])
+
+    cache = FeedCache(str(tmp_path / 'cache'), max_bytes=sizes[0] + max(sizes[1:]) + 1)
+    cache.put(0, feeds[0], 'F')
+    time.sleep(0.01)
+    cache.put(1, feeds[1], 'F')
+    time.sleep(0.01)
+    # Reading game 0 makes game 1 the least recently used one
+    assert cache.get(0) == feeds[0]
+    time.sleep(0.01)
+    cache.put(2, feeds[2], 'F')
+
+    assert set(cache.index) == {'0', '2'}
+    assert not (tmp_path / 'cache' / '1.json.gz').exists()
+
+
+def test_feed_cache_truncated_file_is_a_miss(tmp_path, feeds):
+    cache = FeedCache(str(tmp_path))
+    cache.put(1, feeds[0], 'F')
+    with open(cache._path(1), 'r+b') as f:
+        f.truncate(10)
+    assert cache.get(1) is None
+    assert '1' not in cache.index
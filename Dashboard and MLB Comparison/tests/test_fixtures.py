@@ -0,0 +1,48 @@
+import pytest
+import requests
+
+from api_scraper import (FixtureArchive, FixtureMissingError, FixtureServer, RecordingHTTPAdapter, ReplayHTTPAdapter,
+                         StandInHTTPAdapter, ThrottledHTTPAdapter, RateLimiter)
+
+URL = 'https://statsapi.mlb.com/api/v1/sports'
+
+
+def test_archive_round_trip(tmp_path):
+    archive = FixtureArchive(str(tmp_path))
+    archive.put('GET', URL, 200, {'Content-Type': 'application/json', 'Content-Encoding': 'gzip'}, b'{"sports": []}')
+
+    entry = FixtureArchive(str(tmp_path)).get('GET', URL)
+    assert entry == {'status': 200, 'headers': {'Content-Type': 'application/json'}, 'content': b'{"sports": []}'}
+    assert archive.get('POST', URL) is None
+    assert archive.stats()['missing'] == 1
+
+
+def test_record_then_replay(tmp_path, server):
+    server.respond('/api/v1/teams', (200, {'Content-Type': 'application/json'}, b'{"teams": [147]}'))
+    archive = FixtureArchive(str(tmp_path))
+    recording = requests.Session()
+    recording.mount('http://', RecordingHTTPAdapter(archive, ThrottledHTTPAdapter(rate_limiter=RateLimiter(rate=1000))))
+    assert recording.get(server.url('/api/v1/teams')).json() == {'teams': [147]}
+
+    # Replay answers from the archive alone, the server is not asked again
+    replay = requests.Session()
+    replay.mount('http://', ReplayHTTPAdapter(FixtureArchive(str(tmp_path))))
+    response = replay.get(server.url('/api/v1/teams'))
+    assert response.status_code == 200 and response.json() == {'teams': [147]}
+    assert server.hits('/api/v1/teams') == 1
+
+    with pytest.raises(FixtureMissingError):
+        replay.get(server.url('/api/v1/venues'))
+
+
+def test_fixture_server_serves_the_archive(tmp_path):
+    archive = FixtureArchive(str(tmp_path))
+    archive.put('GET', URL, 200, {'Content-Type': 'application/json'}, b'{"sports": [1]}')
+    fixture_server = FixtureServer(archive).start()
+    try:
+        session = requests.Session()
+        session.mount('https://', StandInHTTPAdapter(fixture_server.url))
+        assert session.get(URL).json() == {'sports': [1]}
+        assert session.get('https://statsapi.mlb.com/api/v1/teams').status_code == 404
+    finally:
+        fixture_server.stop()
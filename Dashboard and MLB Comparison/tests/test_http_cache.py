@@ -0,0 +1,58 @@
+import os
+
+import requests
+
+from api_scraper import HttpCache, ConditionalHTTPAdapter
+
+
+def conditional_session(tmp_path):
+    http_cache = HttpCache(str(tmp_path))
+    session = requests.Session()
+    session.mount('http://', ConditionalHTTPAdapter(http_cache))
+    return session, http_cache
+
+
+def test_conditional_adapter_answers_304_from_the_cache(tmp_path, server):
+    server.respond('/api/v1/teams', (200, {'ETag': '"v1"'}, b'{"teams": [1]}'), (304, {'ETag': '"v1"'}, b''))
+    session, http_cache = conditional_session(tmp_path)
+
+    first = session.get(server.url('/api/v1/teams'))
+    second = session.get(server.url('/api/v1/teams'))
+
+    assert first.status_code == second.status_code == 200
+    assert second.content == b'{"teams": [1]}'
+    assert second.json() == {'teams': [1]}
+    # The second request carried the stored validator
+    assert server.requests[1][1].get('If-None-Match') == '"v1"'
+    assert http_cache.stats()['revalidated'] == 1
+
+
+def test_conditional_adapter_refetches_when_the_body_is_gone(tmp_path, server):
+    server.respond('/api/v1/teams', (200, {'ETag': '"v1"'}, b'old'), (304, {}, b''), (200, {'ETag': '"v2"'}, b'new'))
+    session, http_cache = conditional_session(tmp_path)
+    session.get(server.url('/api/v1/teams'))
+
+    # The validators are sent, but the stored body disappears before the 304 comes back
+    stored_get = http_cache.get
+
+    def get(url):
+        os.remove(http_cache._path(http_cache._key(url)))
+        return stored_get(url)
+    http_cache.get = get
+    response = session.get(server.url('/api/v1/teams'))
+
+    assert response.content == b'new'
+    assert 'If-None-Match' not in server.requests[2][1]
+
+
+def test_http_cache_skips_responses_without_validators_and_live_feeds(tmp_path, server):
+    server.respond('/api/v1/sports', (200, {}, b'{}'))
+    server.respond('/api/v1.1/game/1/feed/live', (200, {'ETag': '"v1"'}, b'{}'))
+    session, http_cache = conditional_session(tmp_path)
+
+    session.get(server.url('/api/v1/sports'))
+    session.get(server.url('/api/v1.1/game/1/feed/live'))
+    session.get(server.url('/api/v1.1/game/1/feed/live'))
+
+    assert http_cache.index == {}
+    assert all('If-None-Match' not in headers for _, headers in server.requests)
@@ -0,0 +1,148 @@
+import copy
+import json
+
+import pytest
+import requests
+from polars.testing import assert_frame_equal
+
+from api_scraper import LiveGame, _apply_json_patch
+
+
+def test_json_patch_operations():
+    document = {'a': {'b': [1, 2, 3]}, 'c': 'x'}
+    document = _apply_json_patch(document, [{'op': 'add', 'path': '/a/b/-', 'value': 4},
+                                            {'op': 'add', 'path': '/a/b/0', 'value': 0},
+                                            {'op': 'remove', 'path': '/a/b/1'},
+                                            {'op': 'replace', 'path': '/c', 'value': 'y'},
+                                            {'op': 'copy', 'from': '/a/b', 'path': '/d'},
+                                            {'op': 'move', 'from': '/c', 'path': '/e~1f'},
+                                            {'op': 'test', 'path': '/e~1f', 'value': 'y'}])
+    assert document == {'a': {'b': [0, 2, 3, 4]}, 'd': [0, 2, 3, 4], 'e/f': 'y'}
+
+    with pytest.raises(ValueError):
+        _apply_json_patch(document, [{'op': 'test', 'path': '/d/0', 'value': 1}])
+    assert _apply_json_patch(document, [{'op': 'replace', 'path': '', 'value': [1]}]) == [1]
+
+
+class PatchedFeed:
+    """
+    Serves a feed cut off after its first plays, then JSON patches that bring it up to the full feed.
+    """
+
+    def __init__(self, scraper, full, first_plays):
+        self.full = full
+        start = copy.deepcopy(full)
+        start['liveData']['plays']['allPlays'] = start['liveData']['plays']['allPlays'][:first_plays]
+        start['gameData']['status']['codedGameState'] = 'I'
+        start['metaData'] = {'timeStamp': '20240401_180000'}
+        self.start = start
+        self.patches = []
+        self.timecodes = []
+        scraper.get_game_feed_bytes = lambda game_id: json.dumps(self.start).encode()
+        scraper.get_game_diff_bytes = self.diff
+
+    def diff(self, game_id, start_timecode):
+        self.timecodes.append(start_timecode)
+        return json.dumps(self.patches.pop(0) if self.patches else []).encode()
+
+
+def full_frame(scraper, feed):
+    return scraper._data_df([feed], 'python')
+
+
+def test_live_game_patches_up_to_the_full_feed(scraper, feeds):
+    full = json.loads(feeds[0])
+    plays = full['liveData']['plays']['allPlays']
+    source = PatchedFeed(scraper, full, first_plays=10)
+    game = LiveGame(scraper, full['gamePk'])
+
+    first = game.update()
+    assert_frame_equal(first, full_frame(scraper, source.start))
+
+    # Three plays arrive, then the rest of the game and its final state
+    source.patches.append([{'diff': [{'op': 'add', 'path': '/liveData/plays/allPlays/-', 'value': play} for play in plays[10:13]]
+                            + [{'op': 'replace', 'path': '/metaData/timeStamp', 'value': '20240401_181500'}]}])
+    source.patches.append([{'diff': [{'op': 'add', 'path': '/liveData/plays/allPlays/-', 'value': play} for play in plays[13:]]},
+                           {'diff': [{'op': 'replace', 'path': '/gameData/status/codedGameState', 'value': 'F'},
+                                     {'op': 'replace', 'path': '/metaData/timeStamp', 'value': '20240401_210000'}]}])
+
+    partial = copy.deepcopy(full)
+    partial['liveData']['plays']['allPlays'] = plays[:13]
+    assert_frame_equal(game.update(), full_frame(scraper, partial))
+    assert_frame_equal(game.update(), full_frame(scraper, full))
+    assert game.is_final
+    # Each diff asked for the changes since the previous copy
+    assert source.timecodes == ['20240401_180000', '20240401_181500']
+
+    # No changes leave the frame as it is
+    assert game.update() is game.frame
+
+
+def test_live_game_reparses_an_edited_earlier_play(scraper, feeds):
+    full = json.loads(feeds[1])
+    source = PatchedFeed(scraper, full, first_plays=len(full['liveData']['plays']['allPlays']))
+    game = LiveGame(scraper, full['gamePk'])
+    game.update()
+
+    # A scoring change on the first play after the rest of the game is already stable
+    edited = copy.deepcopy(source.start)
+    edited['liveData']['plays']['allPlays'][0]['result']['event'] = 'Field Error'
+    source.patches.append([{'diff': [{'op': 'replace', 'path': '/liveData/plays/allPlays/0/result/event', 'value': 'Field Error'}]}])
+    assert_frame_equal(game.update(), full_frame(scraper, edited))
+
+
+def test_live_game_starts_over_when_the_full_feed_comes_back(scraper, feeds):
+    full = json.loads(feeds[2])
+    source = PatchedFeed(scraper, full, first_plays=5)
+    game = LiveGame(scraper, full['gamePk'])
+    game.update()
+
+    # The API sends the whole document instead of a list of patches when that is smaller
+    source.patches.append(full)
+    assert_frame_equal(game.update(), full_frame(scraper, full))
+    assert game.is_final
+
+
+def test_live_game_keeps_its_copy_when_a_patch_fails(scraper, feeds):
+    full = json.loads(feeds[0])
+    plays = full['liveData']['plays']['allPlays']
+    source = PatchedFeed(scraper, full, first_plays=10)
+    game = LiveGame(scraper, full['gamePk'])
+    first = game.update()
+
+    # The test operation fails after two plays were already added
+    source.patches.append([{'diff': [{'op': 'add', 'path': '/liveData/plays/allPlays/-', 'value': play} for play in plays[10:12]]
+                            + [{'op': 'test', 'path': '/gamePk', 'value': -1}]}])
+    with pytest.raises(ValueError):
+        game.update()
+    assert game.data == source.start
+    assert game.timecode == '20240401_180000'
+    assert game.frame is first
+
+    # The next update asks for the same changes again
+    source.patches.append([{'diff': [{'op': 'add', 'path': '/liveData/plays/allPlays/-', 'value': play} for play in plays[10:12]]}])
+    partial = copy.deepcopy(source.start)
+    partial['liveData']['plays']['allPlays'] = plays[:12]
+    assert_frame_equal(game.update(), full_frame(scraper, partial))
+    assert source.timecodes == ['20240401_180000', '20240401_180000']
+
+
+def test_live_game_raises_on_an_error_response(scraper, feeds):
+    full = json.loads(feeds[0])
+    scraper.get_game_feed_bytes = lambda game_id: feeds[0]
+    game = LiveGame(scraper, full['gamePk'])
+    first = game.update()
+
+    def get(url, **kwargs):
+        response = requests.Response()
+        response.status_code = 503
+        response.url = url
+        response._content = b'{"messageNumber": 11, "message": "Service unavailable"}'
+        return response
+    scraper.session.get = get
+
+    # The error body is not taken for a full feed
+    with pytest.raises(requests.HTTPError):
+        game.update()
+    assert game.data == full
+    assert game.frame is first
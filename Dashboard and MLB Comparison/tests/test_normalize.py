@@ -0,0 +1,26 @@
+import pytest
+from polars.testing import assert_frame_equal
+
+from api_scraper import PITCH_TABLES, join_pitch_tables, normalize_pitch_frame
+
+
+def test_normalize_then_join_rebuilds_the_frame(pitch_df):
+    tables = normalize_pitch_frame(pitch_df)
+
+    assert {name: table.columns for name, table in tables.items()} == {name: list(columns) for name, columns in PITCH_TABLES.items()}
+    assert tables['games'].height == pitch_df['game_id'].n_unique()
+    assert tables['pitches'].height == pitch_df.height
+    assert tables['batted_balls'].height < pitch_df.height
+    assert_frame_equal(join_pitch_tables(tables), pitch_df)
+
+
+def test_join_a_subset_of_columns(pitch_df):
+    columns = ['launch_speed', 'game_id', 'pitcher_name', 'batter_name', 'start_speed', 'event_type']
+    # The columns come back in PITCH_SCHEMA order
+    assert_frame_equal(join_pitch_tables(normalize_pitch_frame(pitch_df), columns=columns),
+                       pitch_df.select([c for c in pitch_df.columns if c in columns]))
+
+
+def test_normalize_needs_every_column(pitch_df):
+    with pytest.raises(ValueError):
+        normalize_pitch_frame(pitch_df.drop('pitch_type'))
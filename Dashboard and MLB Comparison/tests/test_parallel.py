@@ -0,0 +1,32 @@
+import json
+
+from polars.testing import assert_frame_equal
+
+from api_scraper import MLB_Scrape
+
+
+def serve_feeds(scraper, feeds):
+    # Serves the feeds by game ID instead of downloading them
+    contents = {json.loads(content)['gamePk']: content for content in feeds}
+    scraper.get_game_feed_bytes = lambda game_id: contents[game_id]
+    return list(contents)
+
+
+def test_parallel_frames_match_get_data_df(scraper, feeds):
+    game_ids = serve_feeds(scraper, feeds)
+    # Out of order, so the frames have to be put back in input order after the workers
+    game_ids = game_ids[2:] + game_ids[:2]
+    expected = scraper.get_data_df([json.loads(scraper.get_game_feed_bytes(game_id)) for game_id in game_ids])
+
+    assert_frame_equal(scraper.get_data_df_parallel(game_ids, processes=2, chunk_size=3), expected)
+
+
+def test_parallel_frames_keep_the_options(scraper, feeds):
+    game_ids = serve_feeds(scraper, feeds)
+    columns = ['game_id', 'pitcher_name', 'pitch_type', 'start_speed', 'spin_rate']
+    expected = scraper.get_data_df([json.loads(content) for content in feeds], columns=columns, compact_dtypes=True, float32=True)
+
+    df = scraper.get_data_df_parallel(game_ids, processes=2, engine='polars', chunk_size=1, columns=columns, compact_dtypes=True, float32=True)
+    assert_frame_equal(df, expected)
+    # Nothing downloaded still gives the right schema
+    assert MLB_Scrape(cache_dir=None).get_data_df_parallel([], processes=1, columns=columns, compact_dtypes=True, float32=True).schema == expected.schema
@@ -0,0 +1,29 @@
+from polars.testing import assert_frame_equal
+
+from api_scraper import PitchStore
+
+
+def test_store_round_trip(tmp_path, pitch_df):
+    store = PitchStore(str(tmp_path))
+    for game_df in pitch_df.partition_by('game_id', maintain_order=True):
+        store.write_game(game_df)
+
+    assert store.games() == set(pitch_df['game_id'].unique())
+    assert_frame_equal(store.read(), pitch_df)
+
+    pitcher = pitch_df['pitcher_name'][0]
+    assert_frame_equal(store.read(pitcher_name=pitcher), pitch_df.filter(pitch_df['pitcher_name'] == pitcher))
+    assert_frame_equal(store.read(year=1999), pitch_df.clear())
+
+
+def test_store_version_follows_the_files(tmp_path, pitch_df):
+    store = PitchStore(str(tmp_path))
+    games = pitch_df.partition_by('game_id', maintain_order=True)
+    store.write_game(games[0])
+    before = store.version()
+    untouched = store.version([games[0]['game_id'][0]])
+
+    store.write_game(games[1])
+    assert store.version() != before
+    # Only the games asked about count
+    assert store.version([games[0]['game_id'][0]]) == untouched
@@ -0,0 +1,57 @@
+import json
+
+import pytest
+import requests
+
+from api_scraper import FixtureArchive, MLB_Scrape
+
+
+def people_url(ids, season):
+    # The URL as the session sends it, with the brackets quoted
+    url = (f'https://statsapi.mlb.com/api/v1/people?personIds={ids}&hydrate=stats(type=gameLog,season={season},'
+           f'startDate={season}-01-01,endDate={season}-12-31,sportId=1,gameType=[R])')
+    return requests.Request('GET', url).prepare().url
+
+
+def person(player_id, *games):
+    # A game log with one split per (group, game_id, date), the way a two-way player has a hitting and a pitching split
+    groups = {}
+    for group, game_id, date in games:
+        groups.setdefault(group, []).append({'date': date, 'game': {'gamePk': game_id}})
+    return {'id': player_id, 'stats': [{'group': {'displayName': group}, 'splits': splits} for group, splits in groups.items()]}
+
+
+@pytest.fixture
+def replayed_people(tmp_path):
+    archive = FixtureArchive(str(tmp_path))
+    responses = {
+        ('1,2', 2023): [person(1, ('hitting', 11, '2023-04-02'), ('pitching', 11, '2023-04-02'), ('hitting', 10, '2023-04-01')),
+                        person(2, ('pitching', 11, '2023-04-02'))],
+        ('3', 2023): [{'id': 3, 'stats': [{'splits': [{'date': '2023-05-01', 'stat': {}}]}]}],
+        ('1,2', 2024): [person(2, ('pitching', 20, '2024-03-28'))],
+        ('3', 2024): [person(3, ('hitting', 21, '2024-03-29'), ('hitting', 20, '2024-03-28'))]}
+    for (ids, season), people in responses.items():
+        archive.put('GET', people_url(ids, season), 200, {'Content-Type': 'application/json'}, json.dumps({'people': people}).encode())
+    return MLB_Scrape(fixture_dir=str(tmp_path), fixture_mode='replay')
+
+
+def test_players_games_list_batches_players(replayed_people):
+    games_df = replayed_people.get_players_games_list([1, 2, 3, 1], [2023, 2024], chunk_size=2)
+
+    # One row per player and game, however many stat groups listed it
+    assert games_df.rows() == [(1, 2023, 10, '2023-04-01'), (1, 2023, 11, '2023-04-02'),
+                               (2, 2023, 11, '2023-04-02'), (2, 2024, 20, '2024-03-28'),
+                               (3, 2024, 20, '2024-03-28'), (3, 2024, 21, '2024-03-29')]
+    # One request per chunk of players and season
+    assert replayed_people.fixtures.stats()['served'] == 4
+
+
+def test_players_games_list_unique_games_in_date_order(replayed_people):
+    assert replayed_people.get_players_games_list([1, 2, 3], [2023, 2024], chunk_size=2, unique=True) == [10, 11, 20, 21]
+
+
+def test_players_games_list_dates_need_one_season(replayed_people):
+    with pytest.raises(ValueError):
+        replayed_people.get_players_games_list([1], [2023, 2024], start_date='2023-04-01')
+    with pytest.raises(ValueError):
+        replayed_people.get_players_games_list([1], 2023, start_date='04/01/2023')
@@ -0,0 +1,75 @@
+import glob
+import os
+import sys
+
+import pytest
+
+pytest.importorskip('bs4')
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'Dashboard app'))
+from OSU_Dashboard import RosterIndex
+
+# Scrolled roster pages saved from https://osubeavers.com/sports/baseball/roster/<year>/ as <year>.html, the test of the
+# real page layout is skipped until there are some
+RECORDED_PAGES = sorted(glob.glob(os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures', 'roster', '*.html')))
+
+
+def roster_html(*players):
+    links = ''.join(f'<li><a href="/sports/baseball/roster/{slug}/{roster_id}" aria-label="{name} - View Full Bio">{name}</a></li>'
+                    for name, slug, roster_id in players)
+    return f'<html><body><a href="/sports/baseball/roster/2025/" aria-label="Roster">Roster</a><ul>{links}</ul></body></html>'
+
+
+class ScrolledPages:
+    """
+    Stands in for the browser, answering each scroll with the next page.
+    """
+
+    def __init__(self, index, *pages):
+        self.pages = list(pages)
+        self.urls = []
+        index._scrolled_page = self.scroll
+
+    def scroll(self, url):
+        self.urls.append(url)
+        return self.pages.pop(0)
+
+
+def test_lookup_scrolls_a_season_once(tmp_path):
+    index = RosterIndex(str(tmp_path / 'roster.json'))
+    pages = ScrolledPages(index, roster_html(('Aiden May', 'aiden-may', '11881'), ('A.J. Hutcheson', 'aj-hutcheson', '12001')))
+
+    assert index.lookup('Aiden May', 2025) == {'id': '11881', 'url': 'https://osubeavers.com/sports/baseball/roster/aiden-may/11881'}
+    # Names with punctuation match their aria-label
+    assert index.lookup('A.J. Hutcheson', 2025)['id'] == '12001'
+    assert pages.urls == ['https://osubeavers.com/sports/baseball/roster/2025/']
+
+    # The season is kept on disk
+    reloaded = RosterIndex(str(tmp_path / 'roster.json'))
+    assert ScrolledPages(reloaded).urls == [] and reloaded.lookup('Aiden May', 2025)['id'] == '11881'
+
+
+def test_saved_season_is_kept_past_max_age(tmp_path):
+    index = RosterIndex(str(tmp_path / 'roster.json'), max_age=60)
+    pages = ScrolledPages(index, roster_html(('Aiden May', 'aiden-may', '11881')),
+                          roster_html(('Aiden May', 'aiden-may', '11881'), ('Zach Edwards', 'zach-edwards', '11999')))
+    index.lookup('Aiden May', 2024)
+
+    # A player on the saved roster never starts the browser, however old the roster is
+    index.seasons['2024']['fetched'] -= 3600
+    assert index.lookup('Aiden May', 2024)['id'] == '11881'
+    assert len(pages.urls) == 1
+
+    # A missing player scrolls the page again once the roster is older than max_age, then not until max_age has passed
+    assert index.lookup('Zach Edwards', 2024)['id'] == '11999'
+    with pytest.raises(KeyError):
+        index.lookup('Not A Player', 2024)
+    assert len(pages.urls) == 2
+
+
+@pytest.mark.skipif(not RECORDED_PAGES, reason='no recorded roster pages in tests/fixtures/roster')
+@pytest.mark.parametrize('path', RECORDED_PAGES)
+def test_recorded_roster_pages(path):
+    with open(path, encoding='utf-8') as f:
+        links = RosterIndex._links(f.read())
+    assert any(href.startswith('/sports/baseball/roster/') and href.rstrip('/').rsplit('/', 1)[1].isdigit() for _, href in links)
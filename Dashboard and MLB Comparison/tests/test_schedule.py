@@ -0,0 +1,52 @@
+from urllib.parse import parse_qs, urlparse
+
+
+class Schedule:
+    """
+    Stands in for the session, keeping the query of every schedule request and answering one game per request.
+    """
+
+    def __init__(self, scraper):
+        self.queries = []
+        scraper.session.get = self.get
+
+    def get(self, url):
+        query = parse_qs(urlparse(url).query)
+        self.queries.append({name: values[0] for name, values in query.items() if name != 'fields'})
+        day = query.get('startDate', [query['season'][0] + '-06-01'])[0]
+        game = {'gamePk': len(self.queries), 'gameDate': f'{day}T23:05:00Z', 'officialDate': day,
+                'teams': {'away': {'team': {'name': 'Away'}}, 'home': {'team': {'name': 'Home'}}},
+                'status': {'codedGameState': 'F'}, 'venue': {'id': 1, 'name': 'Park'}}
+        return Response({'dates': [{'games': [game]}]})
+
+
+class Response:
+    def __init__(self, data):
+        self.data = data
+
+    def json(self):
+        return self.data
+
+
+def dates(queries):
+    return sorted((query['season'], query.get('startDate'), query.get('endDate')) for query in queries)
+
+
+def test_whole_seasons_send_no_dates(scraper):
+    schedule = Schedule(scraper)
+    assert scraper.get_schedule(year_input=[2023, 2024]).height == 2
+    assert dates(schedule.queries) == [('2023', None, None), ('2024', None, None)]
+
+
+def test_one_date_sends_both(scraper):
+    schedule = Schedule(scraper)
+    scraper.get_schedule(year_input=[2024], start_date='2024-05-01')
+    scraper.get_schedule(year_input=[2024], end_date='2024-05-01')
+    assert dates(schedule.queries) == [('2024', '2024-01-01', '2024-05-01'), ('2024', '2024-05-01', '2024-12-31')]
+
+
+def test_date_range_skips_other_seasons_and_splits_into_windows(scraper):
+    schedule = Schedule(scraper)
+    scraper.get_schedule(year_input=[2023, 2024], start_date='2024-05-01', end_date='2024-05-20', chunk_days=7)
+    assert dates(schedule.queries) == [('2024', '2024-05-01', '2024-05-07'), ('2024', '2024-05-08', '2024-05-14'),
+                                       ('2024', '2024-05-15', '2024-05-20')]
@@ -0,0 +1,90 @@
+import time
+
+import pytest
+import requests
+
+from api_scraper import CircuitBreaker, CircuitOpenError, RateLimiter, ThrottledHTTPAdapter
+
+
+def throttled_session(**kwargs):
+    adapter = ThrottledHTTPAdapter(rate_limiter=RateLimiter(rate=1000, burst=100), backoff=0.001, **kwargs)
+    session = requests.Session()
+    session.mount('http://', adapter)
+    return session, adapter
+
+
+def test_retries_until_the_server_recovers(server):
+    server.respond('/api/v1/schedule', (503, {}, b''), (429, {'Retry-After': '0'}, b''), (200, {}, b'ok'))
+    session, adapter = throttled_session(max_retries=4)
+
+    response = session.get(server.url('/api/v1/schedule'))
+
+    assert response.status_code == 200 and response.content == b'ok'
+    assert server.hits('/api/v1/schedule') == 3
+    # The limiter backed off on the errors and the breaker saw a success
+    assert adapter.rate_limiter.rate < 1000
+    assert adapter.circuit_breaker.failures == {}
+
+
+def test_gives_back_the_last_response_after_the_retries(server):
+    server.respond('/api/v1/schedule', (500, {}, b'down'))
+    session, adapter = throttled_session(max_retries=2)
+
+    response = session.get(server.url('/api/v1/schedule'))
+
+    assert response.status_code == 500
+    assert server.hits('/api/v1/schedule') == 3
+    assert adapter.circuit_breaker.failures == {'/api/v1/schedule': 1}
+
+
+def test_does_not_retry_client_errors(server):
+    server.respond('/api/v1/people/1', (404, {}, b''))
+    session, _ = throttled_session(max_retries=4)
+
+    assert session.get(server.url('/api/v1/people/1')).status_code == 404
+    assert server.hits('/api/v1/people/1') == 1
+
+
+def test_breaker_opens_fails_fast_and_closes_after_a_good_trial(server):
+    server.respond('/api/v1.1/game/1/feed/live', (503, {}, b''), (503, {}, b''), (200, {}, b'{}'))
+    session, adapter = throttled_session(max_retries=0, circuit_breaker=CircuitBreaker(failure_threshold=2, reset_timeout=0.2))
+
+    session.get(server.url('/api/v1.1/game/1/feed/live'))
+    session.get(server.url('/api/v1.1/game/1/feed/live'))
+
+    # Open: other games of the same endpoint fail without a request
+    with pytest.raises(CircuitOpenError):
+        session.get(server.url('/api/v1.1/game/2/feed/live'))
+    assert len(server.requests) == 2
+
+    # Half-open after the timeout, the trial succeeds and closes the circuit
+    time.sleep(0.25)
+    assert session.get(server.url('/api/v1.1/game/1/feed/live')).status_code == 200
+    assert adapter.circuit_breaker.opened == {}
+    assert session.get(server.url('/api/v1.1/game/1/feed/live')).status_code == 200
+
+
+def test_breaker_lets_one_trial_through_and_reopens_on_failure():
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0.1)
+    url = 'https://statsapi.mlb.com/api/v1.1/game/5/feed/live'
+    breaker.record(url, success=False)
+    with pytest.raises(CircuitOpenError):
+        breaker.check(url)
+
+    time.sleep(0.15)
+    breaker.check(url)
+    # A second caller during the trial is still turned away
+    with pytest.raises(CircuitOpenError):
+        breaker.check(url)
+
+    breaker.record(url, success=False)
+    with pytest.raises(CircuitOpenError):
+        breaker.check(url)
+
+
+def test_breakers_are_per_endpoint():
+    breaker = CircuitBreaker(failure_threshold=1)
+    breaker.record('https://statsapi.mlb.com/api/v1.1/game/5/feed/live', success=False)
+    breaker.check('https://statsapi.mlb.com/api/v1/schedule/?sportId=1')
+    with pytest.raises(CircuitOpenError):
+        breaker.check('https://statsapi.mlb.com/api/v1.1/game/6/feed/live')